@@ -0,0 +1,89 @@
+"""Throughput and latency of `AsyncQueue` against `asyncio.Queue`.
+
+Usage: python benchmarks/bench_async_queue.py [n]
+"""
+
+
+import asyncio
+import statistics
+import sys
+import time
+
+from common import print_table
+
+from oops.queues import AsyncQueue
+
+
+async def throughput(queue, n, producers=4, consumers=4):
+    """Move `n` items from the producers to the consumers, return items/s."""
+    per_producer = n // producers
+
+    async def produce():
+        for x in range(per_producer):
+            await queue.put(x)
+
+    async def consume():
+        while True:
+            await queue.get()
+            queue.task_done()
+
+    workers = [asyncio.create_task(consume()) for _ in range(consumers)]
+    start = time.perf_counter()
+    await asyncio.gather(*(produce() for _ in range(producers)))
+    await queue.join()
+    elapsed = time.perf_counter() - start
+    for worker in workers:
+        worker.cancel()
+    return per_producer * producers / elapsed
+
+
+async def batch_throughput(n, batch=1000):
+    """Move `n` items to a consumer calling `get_many`, return items/s."""
+    queue = AsyncQueue(maxsize=4 * batch)
+    received = 0
+
+    async def consume():
+        nonlocal received
+        while received < n:
+            received += len(await queue.get_many(batch))
+
+    consumer = asyncio.create_task(consume())
+    start = time.perf_counter()
+    for x in range(n):
+        await queue.put(x)
+    await consumer
+    return n / (time.perf_counter() - start)
+
+
+async def latency(queue, n):
+    """Return the put-to-get latencies, in microseconds, of `n` items."""
+    latencies = []
+
+    async def consume():
+        for _ in range(n):
+            sent = await queue.get()
+            latencies.append((time.perf_counter() - sent) * 1e6)
+
+    consumer = asyncio.create_task(consume())
+    for _ in range(n):
+        await queue.put(time.perf_counter())
+        await asyncio.sleep(0)
+    await consumer
+    return latencies
+
+
+def main(n: int = 100_000) -> None:
+    rows = []
+    for name, make in (('AsyncQueue', AsyncQueue), ('asyncio.Queue', asyncio.Queue)):
+        unbounded = asyncio.run(throughput(make(), n))
+        bounded = asyncio.run(throughput(make(maxsize=64), n))
+        lat = asyncio.run(latency(make(), n // 10))
+        rows.append([name, unbounded, bounded, statistics.median(lat), statistics.quantiles(lat, n=100)[98]])
+    print_table(f'asyncio queues (n={n:,}, 4 producers, 4 consumers)',
+                ['queue', 'items/s', 'items/s (maxsize=64)', 'p50 us', 'p99 us'], rows)
+    print_table('Batched consumer', ['queue', 'items/s'],
+                [['AsyncQueue.get_many(1000)', asyncio.run(batch_throughput(n))]])
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,78 @@
+"""Multi-producer/multi-consumer throughput of `ConcurrentQueue` and
+`ConcurrentDeque` against `queue.Queue`, with 1 to 32 threads per side.
+
+Usage: python benchmarks/bench_concurrent_queues.py [n]
+"""
+
+
+import queue
+import sys
+import threading
+import time
+
+from common import print_table
+
+from oops.queues import ConcurrentDeque
+from oops.queues import ConcurrentQueue
+
+
+THREADS = (1, 2, 4, 8, 16, 32)
+STOP = object()
+
+
+def mpmc(container, n, threads, batch=None):
+    """Move `n` items through `container` with `threads` producers and
+    `threads` consumers, return items/s."""
+    per_producer = n // threads
+
+    def produce():
+        put = container.put
+        for x in range(per_producer):
+            put(x)
+
+    def consume():
+        if batch is None:
+            get = container.get
+            while get() is not STOP:
+                pass
+        else:
+            while True:
+                items = container.get_batch(batch)
+                if items[-1] is STOP:
+                    # Other consumers need their own stop marker
+                    for item in items[:-1]:
+                        if item is STOP:
+                            container.put(STOP)
+                    return
+
+    consumers = [threading.Thread(target=consume) for _ in range(threads)]
+    producers = [threading.Thread(target=produce) for _ in range(threads)]
+    start = time.perf_counter()
+    for thread in consumers + producers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    for _ in consumers:
+        container.put(STOP)
+    for thread in consumers:
+        thread.join()
+    return per_producer * threads / (time.perf_counter() - start)
+
+
+def main(n: int = 200_000) -> None:
+    rows = []
+    for threads in THREADS:
+        rows.append([
+            threads,
+            mpmc(queue.Queue(), n, threads),
+            mpmc(ConcurrentQueue(), n, threads),
+            mpmc(ConcurrentDeque(), n, threads),
+            mpmc(ConcurrentQueue(), n, threads, batch=256),
+        ])
+    print_table(f'MPMC items/s (n={n:,})',
+                ['threads/side', 'queue.Queue', 'ConcurrentQueue', 'ConcurrentDeque', 'ConcurrentQueue batch=256'],
+                rows)
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]))
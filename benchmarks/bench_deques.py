@@ -0,0 +1,87 @@
+"""Memory and throughput of the deque backends against `collections.deque`.
+
+Usage: python benchmarks/bench_deques.py [n]
+"""
+
+
+import collections
+import sys
+
+from common import bytes_per_element
+from common import ops_per_sec
+from common import print_table
+
+from oops import lists
+
+
+BACKENDS = {
+    'LinkedDeque': lambda: lists.make_deque(backend='linked'),
+    'BlockDeque': lambda: lists.make_deque(backend='block'),
+}
+
+
+def build(make, n):
+    deque = make()
+    for x in range(n):
+        deque.insert_back(x)
+    return deque
+
+
+def churn(deque, n):
+    for x in range(n):
+        deque.insert_back(x)
+        deque.insert_front(x)
+    for _ in range(n):
+        deque.pop_back()
+        deque.pop_front()
+
+
+def stdlib_build(n):
+    deque = collections.deque()
+    for x in range(n):
+        deque.append(x)
+    return deque
+
+
+def stdlib_churn(deque, n):
+    for x in range(n):
+        deque.append(x)
+        deque.appendleft(x)
+    for _ in range(n):
+        deque.pop()
+        deque.popleft()
+
+
+def main(n: int = 100_000) -> None:
+    rows = []
+    for name, make in BACKENDS.items():
+        full = build(make, n)
+        rows.append([
+            name,
+            bytes_per_element(lambda size: build(make, size), n),
+            ops_per_sec(lambda: churn(make(), n), 4 * n),
+            ops_per_sec(lambda: sum(1 for _ in full), n),
+            ops_per_sec(lambda: full.rotate(n // 3), 1),
+        ])
+    full = stdlib_build(n)
+    rows.append([
+        'collections.deque',
+        bytes_per_element(stdlib_build, n),
+        ops_per_sec(lambda: stdlib_churn(collections.deque(), n), 4 * n),
+        ops_per_sec(lambda: sum(1 for _ in full), n),
+        ops_per_sec(lambda: full.rotate(n // 3), 1),
+    ])
+    print_table(f'Deque backends (n={n:,})',
+                ['backend', 'bytes/elem', 'push/pop ops/s', 'iter items/s', 'rotate(n/3)/s'], rows)
+
+    block = build(BACKENDS['BlockDeque'], n)
+    stdlib = stdlib_build(n)
+    indices = [(i * 7919) % n for i in range(1000)]
+    print_table(f'Random indexed reads (n={n:,})', ['backend', 'reads/s'], [
+        ['BlockDeque', ops_per_sec(lambda: [block[i] for i in indices], len(indices))],
+        ['collections.deque', ops_per_sec(lambda: [stdlib[i] for i in indices], len(indices))],
+    ])
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,101 @@
+"""Throughput of `WorkStealingExecutor` against
+`concurrent.futures.ThreadPoolExecutor` on fine-grained workloads: a flat
+map of tiny calls, a recursive fan-out where every task submits its children
+without waiting, and a recursive Fibonacci where every task waits for its
+children (which deadlocks a `ThreadPoolExecutor` smaller than the recursion).
+
+Usage: python benchmarks/bench_executors.py [depth]
+"""
+
+
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from common import ops_per_sec
+from common import print_table
+
+from oops.executors import WorkStealingExecutor
+
+
+THREADS = (1, 2, 4, 8)
+BRANCHING = 4
+REPEAT = 3
+
+
+def flat_map(executor, n):
+    assert sum(executor.map(abs, range(n))) == n * (n - 1) // 2
+    return n
+
+
+def fan_out(executor, depth):
+    """Every task submits `BRANCHING` children down to `depth`, counting
+    the tasks until the last one signals completion."""
+    total = (BRANCHING ** (depth + 1) - 1) // (BRANCHING - 1)
+    lock = threading.Lock()
+    done = threading.Event()
+    remaining = [total]
+
+    def task(level):
+        if level < depth:
+            for _ in range(BRANCHING):
+                executor.submit(task, level + 1)
+        with lock:
+            remaining[0] -= 1
+            if not remaining[0]:
+                done.set()
+
+    executor.submit(task, 0)
+    done.wait()
+    return total
+
+
+def fib(executor, n):
+    if n < 2:
+        return n
+    left = executor.submit(fib, executor, n - 1)
+    right = executor.submit(fib, executor, n - 2)
+    return executor.result(left) + executor.result(right)
+
+
+def fib_tasks(executor, n):
+    executor.submit(fib, executor, n).result()
+    # Number of calls of the naive recursion
+    a, b = 1, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return 2 * a - 1
+
+
+def main(depth: int = 7) -> None:
+    workloads = {
+        f'map ({BRANCHING ** depth:,} calls)': lambda executor: flat_map(executor, BRANCHING ** depth),
+        f'fan-out (depth {depth})': lambda executor: fan_out(executor, depth),
+        f'fib({2 * depth + 6}) with waits': lambda executor: fib_tasks(executor, 2 * depth + 6),
+    }
+    rows = []
+    for name, workload in workloads.items():
+        for threads in THREADS:
+            row = [name, threads]
+            for kind in (ThreadPoolExecutor, WorkStealingExecutor):
+                if kind is ThreadPoolExecutor and 'waits' in name:
+                    row.append('- (deadlocks)')
+                    continue
+                with kind(max_workers=threads) as executor:
+                    tasks = workload(executor)
+                    if kind is WorkStealingExecutor:
+                        # Only count the timed runs, not the warm-up
+                        for worker in executor.stats:
+                            worker.reset()
+                    row.append(ops_per_sec(lambda: workload(executor), tasks, REPEAT))
+                if kind is WorkStealingExecutor:
+                    stats = executor.stats
+                    row.append(sum(worker.steals for worker in stats) / REPEAT)
+                    row.append(sum(worker.stolen for worker in stats) / REPEAT)
+            rows.append(row)
+    print_table('Tasks/s', ['workload', 'threads', 'ThreadPoolExecutor', 'WorkStealingExecutor', 'steals/run',
+                            'stolen tasks/run'], rows)
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]))
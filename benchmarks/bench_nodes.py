@@ -0,0 +1,86 @@
+"""Memory and throughput of node allocation, with and without a `NodePool`.
+
+Usage: python benchmarks/bench_nodes.py [n]
+"""
+
+
+import sys
+
+from common import bytes_per_element
+from common import ops_per_sec
+from common import print_table
+
+from oops import lists
+
+
+def build_stack(n, pool=None):
+    stack = lists.SinglyLinkedStack(pool=pool) if pool is not None else lists.SinglyLinkedStack()
+    for x in range(n):
+        stack.push(x)
+    return stack
+
+
+def build_queue(n, pool=None):
+    queue = lists.Queue(pool=pool) if pool is not None else lists.Queue()
+    for x in range(n):
+        queue.enqueue(x)
+    return queue
+
+
+def build_deque(n, pool=None):
+    deque = lists.LinkedDeque(pool=pool) if pool is not None else lists.LinkedDeque()
+    for x in range(n):
+        deque.insert_back(x)
+    return deque
+
+
+def queue_churn(queue, n, window=64):
+    """Steady-state churn: keep `window` items queued, push/pop `n` times."""
+    for x in range(window):
+        queue.enqueue(x)
+    for x in range(n):
+        queue.enqueue(x)
+        queue.dequeue()
+
+
+def deque_churn(deque, n, window=64):
+    for x in range(window):
+        deque.insert_back(x)
+    for x in range(n):
+        deque.insert_back(x)
+        deque.pop_front()
+
+
+def stack_churn(stack, n, window=64):
+    for x in range(window):
+        stack.push(x)
+    for x in range(n):
+        stack.push(x)
+        stack.pop()
+
+
+def main(n: int = 100_000) -> None:
+    pool_cls = getattr(lists, 'NodePool', None)
+
+    rows = []
+    for name, build in (('SinglyLinkedStack', build_stack), ('Queue', build_queue), ('LinkedDeque', build_deque)):
+        rows.append([name, bytes_per_element(build, n)])
+    print_table(f'Bytes per element (n={n:,})', ['structure', 'bytes/elem'], rows)
+
+    rows = []
+    cases = (
+        ('SinglyLinkedStack', lists.SinglyLinkedStack, stack_churn, lists.ListNode),
+        ('Queue', lists.Queue, queue_churn, lists.ListNode),
+        ('LinkedDeque', lists.LinkedDeque, deque_churn, lists.DoubleListNode),
+    )
+    for name, cls, churn, node_type in cases:
+        row = [name, ops_per_sec(lambda: churn(cls(), n), 2 * n)]
+        if pool_cls is not None:
+            row.append(ops_per_sec(lambda: churn(cls(pool=pool_cls(node_type)), n), 2 * n))
+        rows.append(row)
+    header = ['structure', 'ops/s'] + (['ops/s (pool)'] if pool_cls is not None else [])
+    print_table(f'Steady-state churn (n={n:,})', header, rows)
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,95 @@
+"""Probe counts and throughput of the search strategies against
+`searches.bisect_left`, on uniform, timestamp-like, skewed and local lookups.
+
+Usage: python benchmarks/bench_searches.py [n]
+"""
+
+
+import bisect
+import random
+import sys
+
+from common import ops_per_sec
+from common import print_table
+
+from oops import searches
+
+
+LOOKUPS = 2000
+
+
+class Probed:
+    """Sequence counting the elements read by a search."""
+
+    def __init__(self, data):
+        self.data = data
+        self.probes = 0
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, idx):
+        self.probes += 1
+        return self.data[idx]
+
+
+def datasets(n, rng):
+    step = 1000
+    timestamps = []
+    now = 1_700_000_000_000
+    for _ in range(n):
+        now += int(rng.expovariate(1 / step)) + 1
+        timestamps.append(now)
+    return {
+        'uniform ids': sorted(rng.sample(range(n * 100), n)),
+        'timestamps': timestamps,
+        'skewed': [int(1.0001 ** i) + i for i in range(n)],
+    }
+
+
+def lookups(data, rng):
+    """Random targets, and targets near the previous one (with their hint)."""
+    random_targets = [data[rng.randrange(len(data))] for _ in range(LOOKUPS)]
+    local, idx = [], len(data) // 2
+    for _ in range(LOOKUPS):
+        idx = min(max(idx + rng.randrange(-20, 21), 0), len(data) - 1)
+        local.append((data[idx], idx + rng.randrange(-5, 6)))
+    return random_targets, local
+
+
+def strategies():
+    return {
+        'bisect_left (current)': lambda data, target, hint: searches.bisect_left(data, target),
+        'interpolation_search': lambda data, target, hint: searches.interpolation_search(data, target),
+        'search (adaptive)': lambda data, target, hint: searches.search(data, target),
+        'search (with hint)': lambda data, target, hint: searches.search(data, target, hint=hint),
+        'exponential_search': lambda data, target, hint: searches.exponential_search(data, target),
+    }
+
+
+def run(n):
+    rng = random.Random(0)
+    rows = []
+    for name, data in datasets(n, rng).items():
+        random_targets, local = lookups(data, rng)
+        cases = {'random': [(target, None) for target in random_targets], 'local': local}
+        for case, targets in cases.items():
+            for strategy, func in strategies().items():
+                if strategy == 'search (with hint)' and case == 'random':
+                    continue
+                probed = Probed(data)
+                for target, hint in targets:
+                    assert func(probed, target, hint) == bisect.bisect_left(data, target)
+
+                def timed():
+                    for target, hint in targets:
+                        func(data, target, hint)
+
+                rows.append([name, case, strategy, probed.probes / len(targets), ops_per_sec(timed, len(targets))])
+            rows.append([name, case, 'bisect.bisect_left (stdlib)', '-',
+                         ops_per_sec(lambda: [bisect.bisect_left(data, t) for t, _ in targets], len(targets))])
+    print_table(f'Searches in {n:,} sorted keys', ['data', 'lookups', 'strategy', 'probes/search', 'searches/s'], rows)
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
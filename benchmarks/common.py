@@ -0,0 +1,49 @@
+"""Helpers shared by the benchmark scripts.
+
+The scripts are meant to be run directly, e.g. `python benchmarks/bench_nodes.py`,
+with `src` on the `PYTHONPATH` or with the package installed.
+"""
+
+
+import gc
+import time
+import tracemalloc
+from typing import Any
+from typing import Callable
+
+
+def ops_per_sec(func: Callable[[], Any], ops: int, repeat: int = 3) -> float:
+    """Return the best `ops / second` rate of `repeat` calls to `func`,
+    where a single call to `func` performs `ops` operations."""
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return ops / best if best else float('inf')
+
+
+def bytes_per_element(build: Callable[[int], Any], n: int) -> float:
+    """Return the traced memory used by `build(n)`, divided by `n`."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        obj = build(n)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del obj
+    return (after - before) / n
+
+
+def print_table(title: str, header: list[str], rows: list[list[Any]]) -> None:
+    """Print `rows` as a simple aligned text table."""
+    cells = [header] + [[f'{x:,.1f}' if isinstance(x, float) else str(x) for x in row] for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(header))]
+    print(f'\n{title}')
+    for i, row in enumerate(cells):
+        print('  '.join(cell.rjust(width) for cell, width in zip(row, widths)))
+        if i == 0:
+            print('  '.join('-' * width for width in widths))
@@ -0,0 +1,246 @@
+"""Benchmark suite of every structure in `oops.lists` and of
+`searches.binary_search`, against `list`, `collections.deque` and `bisect`.
+
+Every case measures a number of operations per second (and the memory per
+element for the 'build' operation) for each size `n`.
+
+Usage:
+    python benchmarks/suite.py --sizes 1000 10000 100000 --json results.json
+    python benchmarks/suite.py --compare results.json --threshold 0.1
+
+With `--compare`, the results are compared to a previous JSON output and
+the exit status is 1 if any case got slower than the threshold.
+"""
+
+
+import argparse
+import bisect
+import collections
+import json
+import platform
+import random
+import sys
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+
+from common import bytes_per_element
+from common import ops_per_sec
+from common import print_table
+
+from oops import lists
+from oops import searches
+
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+READS = 1_000
+"""Number of random reads of the 'index' and 'search' operations."""
+SLOW_INDEX_MAX_N = 100_000
+"""Largest size for indexing structures with O(n) reads."""
+
+
+@dataclass
+class Case:
+    structure: str
+    operation: str
+    setup: Callable[[int], Any]
+    """Return the state given to `run` for size `n`, outside the timing."""
+    run: Callable[[Any], Any]
+    ops: Callable[[int], int]
+    """Number of operations performed by `run` for size `n`."""
+    max_n: int | None = None
+
+
+@dataclass
+class Result:
+    structure: str
+    operation: str
+    n: int
+    ops_per_sec: float
+    bytes_per_elem: float | None = None
+
+
+def random_indices(n: int) -> list[int]:
+    rng = random.Random(n)
+    return [rng.randrange(n) for _ in range(min(n, READS))]
+
+
+def single_ops(make, insert, remove):
+    """Return the `run` and `ops` functions of a case inserting `n` values
+    one at a time into `make(n)`, then removing them if `remove` is given."""
+    def run(n):
+        structure = make(n)
+        for x in range(n):
+            insert(structure, x)
+        if remove is not None:
+            for _ in range(n):
+                remove(structure)
+    return run, (lambda n: n if remove is None else 2 * n)
+
+
+STRUCTURES: dict[str, dict[str, Any]] = {
+    'SinglyLinkedList': {
+        'build': lists.SinglyLinkedList.from_iterable,
+        'single': (lambda n: lists.SinglyLinkedList(), lambda s, x: s.add(x), None),
+        'iterate': lambda s: s.values(),
+        'index': lambda s, i: s[i].val,
+        'slow_index': True,
+    },
+    'IndexableSkipList': {
+        'build': lists.IndexableSkipList.from_iterable,
+        'single': (lambda n: lists.IndexableSkipList(), lambda s, x: s.add(x), lambda s: s.delete(len(s) - 1)),
+        'iterate': lambda s: s.values(),
+        'index': lambda s, i: s[i].val,
+    },
+    'SinglyLinkedStack': {
+        'build': lists.SinglyLinkedStack.from_iterable,
+        'single': (lambda n: lists.SinglyLinkedStack(), lambda s, x: s.push(x), lambda s: s.pop()),
+        # No 'iterate' case: the only public iteration, `drain`, would
+        # leave the later repeats empty
+    },
+    'Queue': {
+        'build': lists.Queue.from_iterable,
+        'single': (lambda n: lists.Queue(), lambda s, x: s.enqueue(x), lambda s: s.dequeue()),
+        # No 'iterate' case: the only public iteration, `drain`, would
+        # leave the later repeats empty
+    },
+    'CircularlyLinkedList': {
+        'build': lists.CircularlyLinkedList.from_iterable,
+        'single': (lambda n: lists.CircularlyLinkedList(), lambda s, x: s.enqueue(x), lambda s: s.dequeue()),
+    },
+    'LinkedDeque': {
+        'build': lists.LinkedDeque.from_iterable,
+        'single': (lambda n: lists.LinkedDeque(), lambda s, x: s.insert_back(x), lambda s: s.pop_front()),
+        'iterate': iter,
+    },
+    'BlockDeque': {
+        'build': lists.BlockDeque.from_iterable,
+        'single': (lambda n: lists.BlockDeque(), lambda s, x: s.insert_back(x), lambda s: s.pop_front()),
+        'iterate': iter,
+        'index': lambda s, i: s[i],
+    },
+    'RingBuffer': {
+        'build': lambda values: lists.RingBuffer.from_iterable(values, capacity=len(values)),
+        'single': (lists.RingBuffer, lambda s, x: s.enqueue(x), lambda s: s.dequeue()),
+        'iterate': iter,
+        'index': lambda s, i: s[i],
+    },
+    'list': {
+        'build': list,
+        'single': (lambda n: [], list.append, list.pop),
+        'iterate': iter,
+        'index': list.__getitem__,
+    },
+    'collections.deque': {
+        'build': collections.deque,
+        'single': (lambda n: collections.deque(), collections.deque.append, collections.deque.popleft),
+        'iterate': iter,
+        'index': collections.deque.__getitem__,
+    },
+}
+
+
+def build_cases() -> list[Case]:
+    cases = []
+    for name, spec in STRUCTURES.items():
+        build = spec['build']
+        cases.append(Case(name, 'build', lambda n: range(n), build, lambda n: n))
+
+        run, ops = single_ops(*spec['single'])
+        cases.append(Case(name, 'single', lambda n: n, run, ops))
+
+        if 'iterate' in spec:
+            iterate = spec['iterate']
+            cases.append(Case(name, 'iterate', lambda n, build=build: build(range(n)),
+                              lambda s, iterate=iterate: collections.deque(iterate(s), maxlen=0), lambda n: n))
+
+        if 'index' in spec:
+            index = spec['index']
+            cases.append(Case(name, 'index', lambda n, build=build: (build(range(n)), random_indices(n)),
+                              lambda state, index=index: [index(state[0], i) for i in state[1]],
+                              lambda n: min(n, READS), SLOW_INDEX_MAX_N if spec.get('slow_index') else None))
+
+    def search_setup(n):
+        return list(range(0, 2 * n, 2)), [2 * i + i % 2 for i in random_indices(n)]
+
+    cases.append(Case('searches.binary_search', 'search', search_setup,
+                      lambda state: [searches.binary_search(state[0], t) for t in state[1]], lambda n: min(n, READS)))
+    cases.append(Case('bisect', 'search', search_setup,
+                      lambda state: [bisect.bisect_left(state[0], t) for t in state[1]], lambda n: min(n, READS)))
+    return cases
+
+
+def run_cases(cases: list[Case], sizes: list[int], repeat: int, memory: bool) -> list[Result]:
+    results = []
+    for n in sizes:
+        for case in cases:
+            if case.max_n is not None and n > case.max_n:
+                continue
+            state = case.setup(n)
+            result = Result(case.structure, case.operation, n,
+                            ops_per_sec(lambda state=state: case.run(state), case.ops(n), repeat))
+            del state
+            if memory and case.operation == 'build':
+                result.bytes_per_elem = bytes_per_element(lambda size: case.run(range(size)), n)
+            results.append(result)
+            print(f'{case.structure:>24} {case.operation:>8} n={n:<10,} {result.ops_per_sec:>16,.1f} ops/s',
+                  file=sys.stderr)
+    return results
+
+
+def compare(results: list[Result], baseline: dict[str, Any], threshold: float) -> bool:
+    """Print the change of every case against `baseline`, and return `True`
+    if no case got slower by more than `threshold`."""
+    previous = {(r['structure'], r['operation'], r['n']): r['ops_per_sec'] for r in baseline['results']}
+    rows = []
+    ok = True
+    for result in results:
+        before = previous.get((result.structure, result.operation, result.n))
+        if before is None:
+            continue
+        change = result.ops_per_sec / before - 1
+        regression = change < -threshold
+        ok = ok and not regression
+        rows.append([result.structure, result.operation, result.n, before, result.ops_per_sec,
+                     f'{change:+.1%}', 'REGRESSION' if regression else ''])
+    print_table(f'Comparison (threshold {threshold:.0%})',
+                ['structure', 'operation', 'n', 'baseline ops/s', 'ops/s', 'change', ''], rows)
+    return ok
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help='sizes n to benchmark, e.g. 1000 ... 10000000')
+    parser.add_argument('--structures', nargs='+', help='only benchmark these structures')
+    parser.add_argument('--operations', nargs='+', help='only benchmark these operations')
+    parser.add_argument('--repeat', type=int, default=3, help='timing repetitions, the best one is kept')
+    parser.add_argument('--no-memory', action='store_true', help='skip the memory measurements')
+    parser.add_argument('--json', metavar='PATH', help='write the results as JSON')
+    parser.add_argument('--compare', metavar='PATH', help='compare with the JSON results of a previous run')
+    parser.add_argument('--threshold', type=float, default=0.1, help='tolerated slowdown ratio for --compare')
+    args = parser.parse_args(argv)
+
+    cases = [case for case in build_cases()
+             if (args.structures is None or case.structure in args.structures)
+             and (args.operations is None or case.operation in args.operations)]
+    results = run_cases(cases, args.sizes, args.repeat, not args.no_memory)
+
+    print_table('Results', ['structure', 'operation', 'n', 'ops/s', 'bytes/elem'],
+                [[r.structure, r.operation, r.n, r.ops_per_sec, '' if r.bytes_per_elem is None else r.bytes_per_elem]
+                 for r in results])
+
+    if args.json:
+        with open(args.json, 'w') as output:
+            json.dump({'python': platform.python_version(), 'results': [asdict(r) for r in results]}, output,
+                      indent=2)
+
+    if args.compare:
+        with open(args.compare) as baseline:
+            return 0 if compare(results, json.load(baseline), args.threshold) else 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,388 @@
+from __future__ import annotations
+
+import functools
+from abc import abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Callable
+from typing import Iterator
+
+from oops.lists import DoubleListNode
+from oops.lists import DoublyLinkedBase
+
+
+_MISSING = object()
+_KWARGS_MARK = object()
+"""Separator of the positional and keyword arguments in memoized keys."""
+
+
+@dataclass(slots=True)
+class CacheEntry():
+    """Value of a cache node."""
+
+    key: Any
+    value: Any
+    weight: float = 1
+    """Weight of the entry, given by the cache's `weigher`."""
+    count: int = 1
+    """Number of accesses, used by `LFUCache`."""
+
+
+@dataclass
+class CacheStats:
+    """Lookup and eviction counters of a cache."""
+
+    hits: int = 0
+    """Number of lookups that found their key."""
+    misses: int = 0
+    """Number of lookups that didn't find their key."""
+    evictions: int = 0
+    """Number of entries evicted to respect the bounds of the cache."""
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of the lookups that found their key."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def reset(self) -> None:
+        """Set all the counters back to zero."""
+        self.hits = self.misses = self.evictions = 0
+
+
+@dataclass
+class CacheBase(DoublyLinkedBase):
+    """Base of the caches: a dict indexes the nodes of a doubly linked list
+    kept in eviction order, from the next victim to the last one, so that
+    lookups, insertions and evictions all take O(1).
+
+    Entries are evicted when the cache holds more than `maxsize` entries or
+    more than `maxweight` weight, `on_evict(key, value)` being called for
+    each of them. Entries removed with `pop` or `clear` are not evictions.
+    Caches are not thread-safe.
+    """
+
+    _header: DoubleListNode = field(default_factory=DoubleListNode, init=False, repr=False)
+    maxsize: int | None = 128
+    """Maximum number of entries, or `None` for no bound."""
+    maxweight: float | None = None
+    """Maximum total weight of the entries, or `None` for no bound."""
+    weigher: Callable[[Any, Any], float] | None = field(default=None, compare=False)
+    """Function giving the weight of a key and its value, 1 by default."""
+    on_evict: Callable[[Any, Any], None] | None = field(default=None, compare=False)
+    """Function called with the key and the value of every evicted entry."""
+    stats: CacheStats = field(default_factory=CacheStats, init=False, compare=False)
+    """Hit, miss and eviction counters."""
+    _index: dict[Any, DoubleListNode] = field(default_factory=dict, init=False, repr=False, compare=False)
+    """Node of every key."""
+    _weight: float = field(default=0, init=False, repr=False, compare=False)
+    """Total weight of the entries."""
+
+    def __post_init__(self, deep_copy: bool = False) -> None:
+        super().__post_init__(deep_copy)
+        if self.maxsize is not None and (not type(self.maxsize) is int or self.maxsize < 1):
+            raise ValueError(f'{type(self).__name__}: maxsize must be a positive integer: {self.maxsize=}')
+        if self.maxweight is not None and not self.maxweight > 0:
+            raise ValueError(f'{type(self).__name__}: maxweight must be positive: {self.maxweight=}')
+
+    def _flat_values(self) -> Iterable[Any]:
+        return self.items()
+
+    def _init_kwargs(self) -> dict[str, Any]:
+        return {**super()._init_kwargs(), 'maxsize': self.maxsize, 'maxweight': self.maxweight,
+                'weigher': self.weigher, 'on_evict': self.on_evict}
+
+    def _link_values(self, values: Iterable[Any]) -> int:
+        count = 0
+        for key, value in values:
+            self.put(key, value)
+            count += 1
+        return count
+
+    @property
+    def weight(self) -> float:
+        """Total weight of the entries."""
+        return self._weight
+
+    def __contains__(self, key: Any) -> bool:
+        """Return `True` if `key` is cached, without counting a lookup."""
+        return key in self._index
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the keys, from the next one to be evicted."""
+        node = self._header.next
+        while node is not self._trailer:
+            yield node.val.key  # type: ignore
+            node = node.next  # type: ignore
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        """Iterate over the keys and values, from the next one to be evicted."""
+        node = self._header.next
+        while node is not self._trailer:
+            yield node.val.key, node.val.value  # type: ignore
+            node = node.next  # type: ignore
+
+    def __getitem__(self, key: Any) -> Any:
+        """Look `key` up and return its value.
+
+        Raises
+        ------
+        KeyError
+            If `key` is not cached.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.put(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        self.pop(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Look `key` up and return its value, or `default` if it is not
+        cached. A hit counts as an access of the entry."""
+        node = self._index.get(key)
+        if node is None:
+            self.stats.misses += 1
+            return default
+        self.stats.hits += 1
+        self._touch(node)
+        return node.val.value
+
+    def peek(self, key: Any, default: Any = None) -> Any:
+        """Return the value of `key`, or `default`, without counting a lookup
+        or an access."""
+        node = self._index.get(key)
+        return default if node is None else node.val.value
+
+    def put(self, key: Any, value: Any) -> None:
+        """Cache `value` for `key`, evicting entries to respect the bounds.
+        Replacing the value of a key counts as an access of the entry.
+
+        Raises
+        ------
+        ValueError
+            If the weight of the entry alone is more than `maxweight`.
+        """
+        weight = 1 if self.weigher is None else self.weigher(key, value)
+        if self.maxweight is not None and weight > self.maxweight:
+            raise ValueError(f'{type(self).__name__}: entry heavier than maxweight: {key=}, {weight=}')
+
+        node = self._index.get(key)
+        if node is None:
+            self._make_room(1, weight)
+            self._index[key] = self._insert(CacheEntry(key, value, weight))
+            self._weight += weight
+        else:
+            entry = node.val
+            self._weight += weight - entry.weight
+            entry.value, entry.weight = value, weight
+            self._make_room(0, 0, keep=node)
+            self._touch(node)
+
+    def pop(self, key: Any, default: Any = _MISSING) -> Any:
+        """Remove `key` and return its value, or `default` if it is not
+        cached. `on_evict` is not called.
+
+        Raises
+        ------
+        KeyError
+            If `key` is not cached and no `default` is given.
+        """
+        node = self._index.pop(key, None)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        value = node.val.value
+        self._weight -= node.val.weight
+        self._remove(node)
+        return value
+
+    def clear(self) -> None:
+        """Remove all the entries, without calling `on_evict`. The statistics
+        are kept."""
+        while self._header.next is not self._trailer:
+            self._remove(self._header.next)  # type: ignore
+        self._index.clear()
+        self._weight = 0
+
+    def _make_room(self, count: int, weight: float, keep: DoubleListNode | None = None) -> None:
+        """Evict entries until `count` more entries of `weight` fit in the
+        cache, never evicting the `keep` node."""
+        maxsize, maxweight = self.maxsize, self.maxweight
+        while ((maxsize is not None and self._size + count > maxsize)
+               or (maxweight is not None and self._weight + weight > maxweight)):
+            victim = self._header.next
+            if victim is keep:
+                victim = victim.next  # type: ignore
+            if victim is self._trailer:
+                return
+            entry = victim.val  # type: ignore
+            del self._index[entry.key]
+            self._weight -= entry.weight
+            self._remove(victim)  # type: ignore
+            self.stats.evictions += 1
+            if self.on_evict is not None:
+                self.on_evict(entry.key, entry.value)
+
+    def _move_between(self, node: DoubleListNode, left: DoubleListNode, right: DoubleListNode) -> None:
+        """Relink `node` between the adjacent `left` and `right` nodes,
+        without allocating a new node."""
+        node.prev.next, node.next.prev = node.next, node.prev  # type: ignore
+        node.prev, node.next = left, right
+        left.next = right.prev = node
+
+    @abstractmethod
+    def _insert(self, entry: CacheEntry) -> DoubleListNode:
+        """Link a node holding the new `entry` and return it."""
+
+    @abstractmethod
+    def _touch(self, node: DoubleListNode) -> None:
+        """Record an access of the entry of `node`."""
+
+    def _remove(self, node: DoubleListNode) -> None:
+        """Unlink `node` from the list."""
+        self._delete_node(node)
+
+
+@dataclass
+class LRUCache(CacheBase):
+    """Cache evicting the least recently used entries first.
+
+    Notes
+    -----
+
+    _header <-> least recent <-> ... <-> most recent <-> _trailer
+    """
+
+    def _insert(self, entry: CacheEntry) -> DoubleListNode:
+        return self._insert_between(entry, self._trailer.prev, self._trailer)  # type: ignore
+
+    def _touch(self, node: DoubleListNode) -> None:
+        if node.next is not self._trailer:
+            self._move_between(node, self._trailer.prev, self._trailer)  # type: ignore
+
+
+@dataclass
+class LFUCache(CacheBase):
+    """Cache evicting the least frequently used entries first, and the least
+    recently used ones among entries accessed as often.
+
+    The list is sorted by access count, and the last node of every count is
+    indexed, so that an access moves a node to the end of the next count in
+    O(1).
+
+    Notes
+    -----
+
+    _header <-> count 1 (least recent first) <-> count 2 <-> ... <-> _trailer
+    """
+
+    _tails: dict[int, DoubleListNode] = field(default_factory=dict, init=False, repr=False, compare=False)
+    """Last node of every access count."""
+
+    def _insert(self, entry: CacheEntry) -> DoubleListNode:
+        left = self._tails.get(1, self._header)
+        node = self._insert_between(entry, left, left.next)  # type: ignore
+        self._tails[1] = node
+        return node
+
+    def _detach_tail(self, node: DoubleListNode) -> None:
+        """Update the last node of the count of `node`, about to leave it."""
+        count = node.val.count
+        if self._tails[count] is node:
+            if node.prev is not self._header and node.prev.val.count == count:  # type: ignore
+                self._tails[count] = node.prev  # type: ignore
+            else:
+                del self._tails[count]
+
+    def _touch(self, node: DoubleListNode) -> None:
+        self._detach_tail(node)
+        count = node.val.count
+        node.val.count = count + 1
+        # Nodes of the next count follow the nodes of the current count
+        left = self._tails.get(count + 1)
+        if left is None:
+            left = self._tails.get(count, node.prev)
+        if left is not node.prev:
+            self._move_between(node, left, left.next)  # type: ignore
+        self._tails[count + 1] = node
+
+    def _remove(self, node: DoubleListNode) -> None:
+        self._detach_tail(node)
+        self._delete_node(node)
+
+
+CACHE_POLICIES: dict[str, type[CacheBase]] = {'lru': LRUCache, 'lfu': LFUCache}
+"""Cache classes of the `memoize` policies."""
+
+
+def _make_key(args: tuple[Any, ...], kwargs: dict[str, Any], typed: bool) -> tuple[Any, ...]:
+    """Return the cache key of a call with `args` and `kwargs`."""
+    key = args
+    if kwargs:
+        key += (_KWARGS_MARK, *kwargs.items())
+    if typed:
+        key += tuple(type(arg) for arg in args) + tuple(type(arg) for arg in kwargs.values())
+    return key
+
+
+def memoize(func: Callable[..., Any] | None = None, /, maxsize: int | None = 128, *, policy: str = 'lru',
+            maxweight: float | None = None, weigher: Callable[[Any, Any], float] | None = None,
+            on_evict: Callable[[Any, Any], None] | None = None, typed: bool = False) -> Any:
+    """Decorator caching the results of a function by arguments, used as
+    `@memoize` or `@memoize(maxsize=..., policy='lfu')`.
+
+    The cache is exposed as the `cache` attribute of the decorated function
+    (with its `stats`), and emptied by its `cache_clear()`. The keys given
+    to `weigher` and `on_evict` are tuples of the arguments. Results heavier
+    than `maxweight` are returned without being cached.
+
+    Parameters
+    ----------
+    maxsize : int | None, optional
+        Maximum number of cached results, by default 128.
+    policy : str, optional
+        Eviction policy, 'lru' or 'lfu', by default 'lru'.
+    maxweight, weigher, on_evict : optional
+        Bounds and callbacks of the cache, see `CacheBase`.
+    typed : bool, optional
+        Cache arguments of different types separately, by default False.
+
+    Raises
+    ------
+    ValueError
+        If the policy or the bounds are invalid, or if `maxweight` is less
+        than 1 without a `weigher`.
+    """
+    if policy not in CACHE_POLICIES:
+        raise ValueError(f'Unknown cache policy: {policy=}, expected one of {tuple(CACHE_POLICIES)}')
+    if weigher is None and maxweight is not None and maxweight < 1:
+        # Without a weigher every result weighs 1, so none would be cached
+        raise ValueError(f'memoize: maxweight must be at least 1 without a weigher: {maxweight=}')
+    cache_type = CACHE_POLICIES[policy]
+
+    def decorator(function: Callable[..., Any]) -> Callable[..., Any]:
+        cache = cache_type(maxsize, maxweight, weigher, on_evict)
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = _make_key(args, kwargs, typed)
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = function(*args, **kwargs)
+                if maxweight is None or weigher is None or weigher(key, result) <= maxweight:
+                    cache.put(key, result)
+            return result
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator if func is None else decorator(func)
@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import wait
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+
+from oops.queues import ConcurrentQueue
+from oops.queues import WorkStealingDeque
+
+
+HELP_WAIT_TIMEOUT = 0.001
+"""Seconds a worker waiting for a future sleeps when it finds no task to
+run meanwhile, before looking again."""
+
+_Task = tuple[Future, Callable[..., Any], tuple, dict]
+
+
+@dataclass
+class WorkerStats:
+    """Scheduling counters of a worker of a `WorkStealingExecutor`, only
+    updated by the worker itself."""
+
+    executed: int = 0
+    """Number of tasks run."""
+    spawned: int = 0
+    """Number of tasks submitted from the worker, to its own deque."""
+    injected: int = 0
+    """Number of tasks taken from the queue of external submissions."""
+    steals: int = 0
+    """Number of steals that took tasks from another worker."""
+    stolen: int = 0
+    """Number of tasks taken by these steals."""
+    failed_steals: int = 0
+    """Number of rounds over the other workers that found nothing to steal."""
+    sleeps: int = 0
+    """Number of times the worker went to sleep for lack of tasks."""
+
+    def reset(self) -> None:
+        """Set all the counters back to zero."""
+        self.executed = self.spawned = self.injected = 0
+        self.steals = self.stolen = self.failed_steals = self.sleeps = 0
+
+
+@dataclass(eq=False)
+class WorkStealingExecutor(Executor):
+    """Thread pool executor scheduling tasks by work stealing.
+
+    Every worker thread owns a `WorkStealingDeque`: tasks submitted from a
+    worker are pushed to its own deque and run newest first, without
+    touching any shared lock. Tasks submitted from other threads go through
+    a shared `ConcurrentQueue`. An idle worker takes a share of this queue,
+    or steals the oldest half of the tasks of a random worker, before going
+    to sleep until a task is submitted.
+
+    Tasks can wait for the tasks they submitted with `result`, which runs
+    other tasks in the meantime instead of blocking the worker, so that
+    fine-grained recursive work doesn't deadlock a bounded pool. Waiting on
+    `Future.result` directly from a task still blocks its worker.
+
+    Parameters
+    ----------
+    max_workers : int | None, optional
+        Number of worker threads, by default `min(32, os.cpu_count() + 4)`
+        like `ThreadPoolExecutor`.
+    thread_name_prefix : str, optional
+        Prefix of the names of the worker threads.
+    """
+
+    max_workers: int | None = None
+    """Number of worker threads."""
+    thread_name_prefix: str = ''
+    """Prefix of the names of the worker threads."""
+    stats: list[WorkerStats] = field(default_factory=list, init=False, repr=False)
+    """Counters of every worker."""
+    _deques: list[WorkStealingDeque] = field(default_factory=list, init=False, repr=False)
+    """Task deque of every worker."""
+    _injector: ConcurrentQueue = field(default_factory=ConcurrentQueue, init=False, repr=False)
+    """Tasks submitted from outside the workers."""
+    _threads: list[threading.Thread] = field(default_factory=list, init=False, repr=False)
+    """Worker threads."""
+    _local: threading.local = field(default_factory=threading.local, init=False, repr=False)
+    """Index of the worker running in the current thread, if any."""
+    _wakeup: threading.Condition = field(default_factory=threading.Condition, init=False, repr=False)
+    """Condition notified when a task is submitted while workers sleep."""
+    _sleeping: int = field(default=0, init=False, repr=False)
+    """Number of sleeping workers, updated under `_wakeup`."""
+    _shutdown_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    """Lock ordering external submissions and `shutdown`."""
+    _shutdown: bool = field(default=False, init=False, repr=False)
+    """Whether `shutdown` was called."""
+
+    def __post_init__(self) -> None:
+        if self.max_workers is None:
+            self.max_workers = min(32, (os.cpu_count() or 1) + 4)
+        if not type(self.max_workers) is int or self.max_workers < 1:
+            raise ValueError(f'WorkStealingExecutor: max_workers must be a positive integer: {self.max_workers=}')
+        prefix = self.thread_name_prefix or f'WorkStealingExecutor-{id(self):x}'
+        for index in range(self.max_workers):
+            self.stats.append(WorkerStats())
+            self._deques.append(WorkStealingDeque())
+            self._threads.append(threading.Thread(target=self._work, args=(index,), name=f'{prefix}_{index}',
+                                                  daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        """Schedule `fn(*args, **kwargs)` and return its future.
+
+        Tasks submitted from a worker are still accepted after `shutdown`,
+        so that the running work can finish.
+
+        Raises
+        ------
+        RuntimeError
+            If called from outside the workers after `shutdown`.
+        """
+        future: Future = Future()
+        task = (future, fn, args, kwargs)
+        index = getattr(self._local, 'index', None)
+        if index is None:
+            with self._shutdown_lock:
+                if self._shutdown:
+                    raise RuntimeError('cannot schedule new futures after shutdown')
+                self._injector.put(task)
+        else:
+            self._deques[index].push(task)
+            self.stats[index].spawned += 1
+        if self._sleeping:
+            with self._wakeup:
+                self._wakeup.notify()
+        return future
+
+    def map(self, fn: Callable[..., Any], *iterables: Iterable[Any], timeout: float | None = None,
+            chunksize: int = 1) -> Iterator[Any]:
+        """Return an iterator over `fn` applied to the items of `iterables`,
+        like `Executor.map`, with every call submitted at once. Results are
+        waited for with `result`, so tasks can map too."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        futures = [self.submit(fn, *args) for args in zip(*iterables)]
+
+        def results() -> Iterator[Any]:
+            try:
+                futures.reverse()
+                while futures:
+                    remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+                    yield self.result(futures.pop(), remaining)
+            finally:
+                for future in futures:
+                    future.cancel()
+
+        return results()
+
+    def result(self, future: Future, timeout: float | None = None) -> Any:
+        """Return the result of `future`, like `future.result(timeout)`.
+
+        From a worker, other tasks are run while `future` isn't done, so
+        that a task can wait for the tasks it submitted.
+
+        Raises
+        ------
+        TimeoutError
+            If `future` isn't done after `timeout` seconds.
+        """
+        index = getattr(self._local, 'index', None)
+        if index is not None:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            stats = self.stats[index]
+            while not future.done():
+                task = self._find_task(index, stats)
+                if task is not None:
+                    self._run(task, stats)
+                    continue
+                remaining = HELP_WAIT_TIMEOUT if deadline is None else deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                wait([future], timeout=min(remaining, HELP_WAIT_TIMEOUT))
+            timeout = None if deadline is None else 0
+        return future.result(timeout)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Stop accepting tasks from outside the workers, and stop the
+        workers once all the tasks are done.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Wait for the workers to stop, by default True.
+        cancel_futures : bool, optional
+            Cancel the tasks that didn't start yet, by default False.
+        """
+        with self._shutdown_lock:
+            self._shutdown = True
+            if cancel_futures:
+                for task in self._drain():
+                    task[0].cancel()
+        with self._wakeup:
+            self._wakeup.notify_all()
+        if wait:
+            for thread in self._threads:
+                if thread is not threading.current_thread():
+                    thread.join()
+
+    def _drain(self) -> Iterator[_Task]:
+        """Remove and yield all the queued tasks."""
+        while not self._injector.is_empty():
+            yield from self._injector.get_batch(1024, timeout=0)
+        for deque in self._deques:
+            while not deque.is_empty():
+                yield from deque.steal_half(blocking=True)
+
+    def _has_tasks(self) -> bool:
+        return not self._injector.is_empty() or any(len(deque) for deque in self._deques)
+
+    def _find_task(self, index: int, stats: WorkerStats) -> _Task | None:
+        """Return a task for worker `index`: the newest of its own deque, or
+        else a share of the external submissions, or else the oldest half of
+        the deque of another worker, keeping the other tasks in its deque."""
+        own = self._deques[index]
+        if len(own):
+            try:
+                return own.pop()
+            except IndexError:
+                # Stolen in the meantime
+                pass
+
+        tasks: list[_Task] = []
+        if not self._injector.is_empty():
+            tasks = self._injector.get_batch(len(self._injector) // len(self._deques) + 1, timeout=0)
+            stats.injected += len(tasks)
+        elif len(self._deques) > 1:
+            # Visit the other workers from a random one
+            others = len(self._deques) - 1
+            start = self._local.rng.randrange(others)
+            for offset in range(others):
+                tasks = self._deques[(index + 1 + (start + offset) % others) % (others + 1)].steal_half()
+                if tasks:
+                    stats.steals += 1
+                    stats.stolen += len(tasks)
+                    break
+            else:
+                stats.failed_steals += 1
+        if not tasks:
+            return None
+        if len(tasks) > 1:
+            own.extend(tasks[1:])
+            if self._sleeping:
+                with self._wakeup:
+                    self._wakeup.notify()
+        return tasks[0]
+
+    def _run(self, task: _Task, stats: WorkerStats) -> None:
+        future, fn, args, kwargs = task
+        if not future.set_running_or_notify_cancel():
+            return
+        stats.executed += 1
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    def _work(self, index: int) -> None:
+        """Run the tasks of worker `index` until `shutdown`."""
+        self._local.index = index
+        self._local.rng = random.Random(index)
+        stats = self.stats[index]
+        while True:
+            task = self._find_task(index, stats)
+            if task is not None:
+                self._run(task, stats)
+                continue
+            with self._wakeup:
+                # Counted as sleeping before looking for tasks, so that a
+                # submission either is seen here or sees this worker.
+                self._sleeping += 1
+                try:
+                    if self._has_tasks():
+                        continue
+                    if self._shutdown:
+                        return
+                    stats.sleeps += 1
+                    self._wakeup.wait()
+                finally:
+                    self._sleeping -= 1
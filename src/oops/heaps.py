@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable
+from dataclasses import dataclass
+from dataclasses import field
+from itertools import count
+from typing import Any
+from typing import ClassVar
+from typing import Iterator
+
+from oops.lists import _checked_values
+from oops.lists import SinglyLinkedBase
+
+
+_MISSING = object()
+
+
+def _sift_up(heap: list[list[Any]], pos: int, arity: int, track: bool) -> None:
+    """Move the entry at `pos` up the d-ary `heap` until its parent is
+    smaller, storing the new index of the moved entries if `track`."""
+    entry = heap[pos]
+    while pos:
+        parent = (pos - 1) // arity
+        if not entry < heap[parent]:
+            break
+        heap[pos] = heap[parent]
+        if track:
+            heap[pos][3] = pos
+        pos = parent
+    heap[pos] = entry
+    if track:
+        entry[3] = pos
+
+
+def _sift_down(heap: list[list[Any]], pos: int, arity: int, track: bool) -> None:
+    """Move the entry at `pos` down the d-ary `heap` until its children are
+    larger, storing the new index of the moved entries if `track`."""
+    entry, size = heap[pos], len(heap)
+    while True:
+        first = pos * arity + 1
+        if first >= size:
+            break
+        child = first
+        for other in range(first + 1, min(first + arity, size)):
+            if heap[other] < heap[child]:
+                child = other
+        if not heap[child] < entry:
+            break
+        heap[pos] = heap[child]
+        if track:
+            heap[pos][3] = pos
+        pos = child
+    heap[pos] = entry
+    if track:
+        entry[3] = pos
+
+
+@dataclass(eq=False, repr=False)
+class PriorityQueue(SinglyLinkedBase):
+    """ADT implementation of a min-priority queue, on a binary heap or a
+    d-ary heap with `arity` children per node.
+
+    Values of equal priority are popped in insertion order. Priorities are
+    compared with `<` only, values are never compared. The binary heap uses
+    `heapq`, larger arities trade slower pops for shallower heaps.
+
+    Notes
+    -----
+
+    _heap: [[priority, insertion number, value], ...]
+    """
+
+    _heap: Any = field(default=None, init=True)
+    """Heap of the entries, given as the initial (priority, value) pairs."""
+    arity: int = field(default=2, kw_only=True)
+    """Number of children of a heap node."""
+    _counter: Iterator[int] = field(default_factory=count, init=False)
+    """Insertion numbers breaking ties between equal priorities."""
+
+    # Entries are stored in a list, not in nodes
+    _pooled: ClassVar[bool] = False
+    _track: ClassVar[bool] = False
+    """Store the heap index of every entry, for locators."""
+
+    def __post_init__(self, deep_copy: bool = False) -> None:
+        super().__post_init__(deep_copy)
+        if not type(self.arity) is int or self.arity < 2:
+            raise ValueError(f'{type(self).__name__}: arity must be an integer of at least 2: {self.arity=}')
+        init_value = self._heap
+        self._heap = []
+        if init_value is not None:
+            self._link_values(_checked_values(init_value, type(self).__name__, deep_copy))
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({list(self._flat_values())!r}, arity={self.arity})'
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        return list(self._flat_values()) == list(other._flat_values())
+
+    def __iter__(self) -> Iterator[tuple[Any, Any]]:
+        """Iterate over the (priority, value) pairs, in heap order (not in
+        priority order, see `drain`)."""
+        for entry in self._heap:
+            yield entry[0], entry[2]
+
+    def _flat_values(self) -> Iterable[tuple[Any, Any]]:
+        return ((entry[0], entry[2]) for entry in sorted(self._heap))
+
+    def _init_kwargs(self) -> dict[str, Any]:
+        return {'arity': self.arity}
+
+    def _new_entry(self, priority: Any, value: Any) -> list[Any]:
+        return [priority, next(self._counter), value]
+
+    def _link_values(self, values: Iterable[Any]) -> int:
+        """Add all (priority, value) pairs, restoring the heap in O(n) when
+        they outnumber the current entries."""
+        heap = self._heap
+        size = len(heap)
+        new_entry = self._new_entry
+        for priority, value in values:
+            heap.append(new_entry(priority, value))
+        added = len(heap) - size
+        if added > size:
+            self._heapify()
+        else:
+            for pos in range(size, len(heap)):
+                self._sift_up(pos)
+        self._size = len(heap)
+        return added
+
+    def _heapify(self) -> None:
+        heap = self._heap
+        if self.arity == 2 and not self._track:
+            heapq.heapify(heap)
+            return
+        if self._track:
+            for pos, entry in enumerate(heap):
+                entry[3] = pos
+        for pos in range((len(heap) - 2) // self.arity, -1, -1):
+            _sift_down(heap, pos, self.arity, self._track)
+
+    def _sift_up(self, pos: int) -> None:
+        _sift_up(self._heap, pos, self.arity, self._track)
+
+    def _sift_down(self, pos: int) -> None:
+        _sift_down(self._heap, pos, self.arity, self._track)
+
+    def push(self, priority: Any, value: Any = None) -> None:
+        """Add `value` with `priority`, in O(log n)."""
+        self._push(priority, value)
+
+    def _push(self, priority: Any, value: Any) -> list[Any]:
+        entry = self._new_entry(priority, value)
+        if self.arity == 2 and not self._track:
+            heapq.heappush(self._heap, entry)
+        else:
+            self._heap.append(entry)
+            self._sift_up(len(self._heap) - 1)
+        self._size += 1
+        return entry
+
+    def peek(self) -> tuple[Any, Any]:
+        """Get the (priority, value) pair of smallest priority."""
+        if self.is_empty():
+            raise IndexError('Priority queue is empty.')
+        entry = self._heap[0]
+        return entry[0], entry[2]
+
+    def pop(self) -> tuple[Any, Any]:
+        """Remove and return the (priority, value) pair of smallest priority,
+        in O(log n)."""
+        if self.is_empty():
+            raise IndexError('Priority queue is empty.')
+        if self.arity == 2 and not self._track:
+            entry = heapq.heappop(self._heap)
+        else:
+            entry = self._remove_at(0)
+        self._size -= 1
+        return entry[0], entry[2]
+
+    def _remove_at(self, pos: int) -> list[Any]:
+        """Remove and return the entry at `pos`, filling its slot with the
+        last entry."""
+        heap = self._heap
+        last = heap.pop()
+        if pos == len(heap):
+            entry = last
+        else:
+            entry, heap[pos] = heap[pos], last
+            self._sift_down(pos)
+            # Only pops remove entries without tracking, from the root
+            if self._track:
+                self._sift_up(last[3])
+        if self._track:
+            entry[3] = -1
+        return entry
+
+    def extend(self, pairs: Iterable[tuple[Any, Any]]) -> None:
+        """Add all (priority, value) `pairs`, in O(n) when they outnumber
+        the current entries."""
+        self._link_values(pairs)
+
+    def drain(self) -> Iterator[tuple[Any, Any]]:
+        """Remove and yield the (priority, value) pairs in priority order
+        until the queue is empty."""
+        while self._size:
+            yield self.pop()
+
+    def clear(self) -> None:
+        """Remove all the entries."""
+        if self._track:
+            for entry in self._heap:
+                entry[3] = -1
+        self._heap = []
+        self._size = 0
+
+
+@dataclass(slots=True, frozen=True, eq=False, repr=False)
+class Locator():
+    """Handle on an entry of an `AdaptablePriorityQueue`, valid until the
+    entry is popped or removed."""
+
+    _container: AdaptablePriorityQueue
+    """Queue holding the entry."""
+    _entry: list[Any]
+    """Entry: [priority, insertion number, value, heap index]."""
+
+    @property
+    def priority(self) -> Any:
+        return self._entry[0]
+
+    @property
+    def value(self) -> Any:
+        return self._entry[2]
+
+    def is_valid(self) -> bool:
+        """Return `True` if the entry is still in the queue."""
+        return self._entry[3] >= 0
+
+    def __repr__(self) -> str:
+        if not self.is_valid():
+            return 'Locator(<removed>)'
+        return f'Locator({self._entry[0]!r}, {self._entry[2]!r})'
+
+
+@dataclass(eq=False, repr=False)
+class AdaptablePriorityQueue(PriorityQueue):
+    """Priority queue giving a `Locator` for every pushed value, to change
+    its priority or remove it in O(log n)."""
+
+    _track: ClassVar[bool] = True
+
+    def _new_entry(self, priority: Any, value: Any) -> list[Any]:
+        return [priority, next(self._counter), value, len(self._heap)]
+
+    def push(self, priority: Any, value: Any = None) -> Locator:  # type: ignore[override]
+        """Add `value` with `priority`, in O(log n), and return its locator."""
+        return Locator(self, self._push(priority, value))
+
+    def _validate(self, locator: Locator) -> list[Any]:
+        """Return the entry of `locator`.
+
+        Raises
+        ------
+        TypeError
+            If `locator` is not a `Locator`.
+        ValueError
+            If `locator` belongs to another queue or its entry was removed.
+        """
+        if not isinstance(locator, Locator):
+            raise TypeError(f'{type(self).__name__}: expected a Locator, got {type(locator).__name__}.')
+        if locator._container is not self:
+            raise ValueError(f'{type(self).__name__}: locator belongs to another queue.')
+        if locator._entry[3] < 0:
+            raise ValueError(f'{type(self).__name__}: locator is no longer valid.')
+        return locator._entry
+
+    def update(self, locator: Locator, priority: Any = _MISSING, value: Any = _MISSING) -> None:
+        """Change the priority and/or the value of the entry of `locator`,
+        in O(log n). The entry keeps its insertion order among equal
+        priorities."""
+        entry = self._validate(locator)
+        if value is not _MISSING:
+            entry[2] = value
+        if priority is not _MISSING:
+            entry[0] = priority
+            self._sift_up(entry[3])
+            self._sift_down(entry[3])
+
+    def remove(self, locator: Locator) -> tuple[Any, Any]:
+        """Remove the entry of `locator` and return its (priority, value)
+        pair, in O(log n)."""
+        entry = self._remove_at(self._validate(locator)[3])
+        self._size -= 1
+        return entry[0], entry[2]
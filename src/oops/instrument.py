@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+import functools
+import inspect
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from dataclasses import field
+from time import perf_counter_ns
+from typing import Any
+from typing import Callable
+
+from oops import lists
+from oops.lists import SinglyLinkedBase
+
+
+LATENCY_BUCKETS = 64
+"""Number of power-of-two latency buckets, in nanoseconds."""
+TRACED_DUNDERS = ('__init__', '__getitem__', '__setitem__', '__contains__', '__iter__', '__reversed__')
+"""Special methods instrumented along with the public methods."""
+ALLOCATING_METHODS = ('_new_node', '_new_block')
+"""Methods returning a newly allocated (or pooled) node."""
+RELEASING_METHODS = ('_release_node',)
+"""Methods called with a node removed from a structure."""
+
+
+def _index(structure: Any, idx: int) -> int:
+    return idx + len(structure) if idx < 0 else idx
+
+
+def _list_getitem_cost(structure: Any, idx: Any) -> int:
+    if isinstance(idx, slice):
+        return 0
+    idx = _index(structure, idx)
+    # The last node is kept as the tail
+    return 0 if idx == len(structure) - 1 else idx + 1
+
+
+def _circular_rotate_cost(structure: Any, k: int = 1) -> int:
+    return -k % len(structure) if len(structure) > 1 else 0
+
+
+def _deque_getitem_cost(structure: Any, idx: Any) -> int:
+    if isinstance(idx, slice):
+        return 0
+    idx = _index(structure, idx)
+    return min(idx, len(structure) - 1 - idx) + 1
+
+
+def _deque_rotate_cost(structure: Any, k: int = 1) -> int:
+    size = len(structure)
+    if size <= 1:
+        return 0
+    k %= size
+    return min(k, size - k)
+
+
+def _block_locate_cost(structure: Any, idx: int) -> int:
+    idx = _index(structure, idx)
+    if idx < len(structure) // 2:
+        pos = structure._left_idx + idx
+    else:
+        pos = (structure.block_size - 1 - structure._right_idx) + (len(structure) - 1 - idx)
+    return pos // structure.block_size + 1
+
+
+TRAVERSAL_COSTS: dict[Callable[..., Any], Callable[..., int]] = {
+    lists.SinglyLinkedList.__getitem__: _list_getitem_cost,
+    lists.CircularlyLinkedList.rotate: _circular_rotate_cost,
+    lists.LinkedDeque.__getitem__: _deque_getitem_cost,
+    lists.LinkedDeque.rotate: _deque_rotate_cost,
+    lists.BlockDeque._locate: _block_locate_cost,
+}
+"""Number of nodes (or blocks) walked by a successful call of a method that
+walks to an index, from its arguments. The structures don't count them
+themselves, so that they cost nothing while not instrumented."""
+WALKING_METHODS = ('_locate',)
+"""Private methods instrumented for their `TRAVERSAL_COSTS` only."""
+
+_MISSING = object()
+
+
+@dataclass
+class LatencyHistogram:
+    """Histogram of latencies in power-of-two buckets: bucket `i` counts the
+    latencies `t` such that `2 ** (i - 1) <= t < 2 ** i` nanoseconds."""
+
+    buckets: list[int] = field(default_factory=lambda: [0] * LATENCY_BUCKETS)
+    """Number of latencies in every bucket."""
+    count: int = 0
+    """Number of recorded latencies."""
+    total_ns: int = 0
+    """Sum of the recorded latencies."""
+    max_ns: int = 0
+    """Largest recorded latency."""
+
+    def record(self, ns: int) -> None:
+        """Add a latency of `ns` nanoseconds."""
+        self.buckets[min(ns.bit_length(), LATENCY_BUCKETS - 1)] += 1
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the histogram as a dict, with the non-empty buckets keyed
+        by their (exclusive) upper bound in nanoseconds."""
+        return {
+            'count': self.count,
+            'total_ns': self.total_ns,
+            'max_ns': self.max_ns,
+            'buckets': {2 ** i: n for i, n in enumerate(self.buckets) if n},
+        }
+
+
+@dataclass
+class Stats:
+    """Statistics of an instrumented structure (or class of structures).
+
+    Only the outermost public call is counted: the methods a public method
+    calls internally add their traversed nodes to the outer call.
+    """
+
+    calls: Counter[str] = field(default_factory=Counter)
+    """Number of calls of every public method."""
+    traversed: Counter[str] = field(default_factory=Counter)
+    """Number of nodes (or blocks) walked through by every public method."""
+    latency: dict[str, LatencyHistogram] = field(default_factory=dict)
+    """Latency histogram of every public method. Iterators are not timed."""
+    allocated: int = 0
+    """Number of nodes allocated or taken from a pool."""
+    freed: int = 0
+    """Number of nodes removed from the structure."""
+    _current: str | None = field(default=None, init=False, repr=False)
+    """Public method being executed."""
+
+    def traverse(self, count: int) -> None:
+        """Record `count` nodes walked through by the current method."""
+        self.traversed[self._current or 'internal'] += count
+
+    def record(self, method: str, ns: int) -> None:
+        """Record a call of `method` that took `ns` nanoseconds."""
+        self.calls[method] += 1
+        histogram = self.latency.get(method)
+        if histogram is None:
+            histogram = self.latency[method] = LatencyHistogram()
+        histogram.record(ns)
+
+    def reset(self) -> None:
+        """Drop all the recorded statistics."""
+        self.calls.clear()
+        self.traversed.clear()
+        self.latency.clear()
+        self.allocated = self.freed = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a copy of the statistics made of dicts and ints, ready to
+        be exported."""
+        return {
+            'calls': dict(self.calls),
+            'traversed': dict(self.traversed),
+            'allocated': self.allocated,
+            'freed': self.freed,
+            'latency_ns': {method: histogram.snapshot() for method, histogram in self.latency.items()},
+        }
+
+
+def _traced(stats: Stats, owner: str, iterator: Iterator[Any]) -> Iterator[Any]:
+    """Yield from `iterator`, counting every item as a traversed node of
+    `owner` and attributing the work done in between to `owner`."""
+    while True:
+        previous, stats._current = stats._current, owner
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            stats._current = previous
+        stats.traversed[owner] += 1
+        yield item
+
+
+def _wrap_method(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    if inspect.isgeneratorfunction(func):
+        @functools.wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            stats = self._stats
+            if stats is None:
+                return func(self, *args, **kwargs)
+            owner = stats._current
+            if owner is None:
+                stats.calls[name] += 1
+                owner = name
+            return _traced(stats, owner, func(self, *args, **kwargs))
+    else:
+        @functools.wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            stats = self._stats
+            if stats is None or stats._current is not None:
+                return func(self, *args, **kwargs)
+            stats._current = name
+            start = perf_counter_ns()
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                stats.record(name, perf_counter_ns() - start)
+                stats._current = None
+    return wrapper
+
+
+def _wrap_traversal(func: Callable[..., Any], cost: Callable[..., int]) -> Callable[..., Any]:
+    @functools.wraps(func)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        result = func(self, *args, **kwargs)
+        if self._stats is not None:
+            self._stats.traverse(cost(self, *args, **kwargs))
+        return result
+    return wrapper
+
+
+def _wrap_allocation(func: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(func)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if self._stats is not None:
+            self._stats.allocated += 1
+        return func(self, *args, **kwargs)
+    return wrapper
+
+
+def _wrap_release(func: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(func)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if self._stats is not None:
+            self._stats.freed += 1
+        return func(self, *args, **kwargs)
+    return wrapper
+
+
+_installed: dict[type, tuple[int, dict[str, Any]]] = {}
+"""Instrumented classes, with their number of instrumented targets and the
+attributes replaced in their `__dict__`."""
+_replaced_stats: dict[type, Any] = {}
+"""`_stats` attribute of the instrumented classes before instrumentation."""
+
+
+def _install(cls: type) -> None:
+    """Replace the methods of `cls` by instrumented wrappers, unless it was
+    done by another target."""
+    if cls in _installed:
+        count, originals = _installed[cls]
+        _installed[cls] = (count + 1, originals)
+        return
+
+    originals = {}
+    for name in dir(cls):
+        if not (name in TRACED_DUNDERS or name in ALLOCATING_METHODS or name in RELEASING_METHODS
+                or name in WALKING_METHODS or not name.startswith('_')):
+            continue
+        func = inspect.getattr_static(cls, name)
+        if not inspect.isfunction(func):
+            continue
+        # Don't wrap the wrappers installed on a parent class
+        func = getattr(func, '_instrumented', func)
+        cost = TRAVERSAL_COSTS.get(func)
+        if name in ALLOCATING_METHODS:
+            wrapper = _wrap_allocation(func)
+        elif name in RELEASING_METHODS:
+            wrapper = _wrap_release(func)
+        elif name in WALKING_METHODS:
+            wrapper = func if cost is None else _wrap_traversal(func, cost)
+        else:
+            wrapper = _wrap_method(name, func if cost is None else _wrap_traversal(func, cost))
+        wrapper._instrumented = func  # type: ignore[attr-defined]
+        originals[name] = cls.__dict__.get(name, _MISSING)
+        setattr(cls, name, wrapper)
+    _installed[cls] = (1, originals)
+
+
+def _uninstall(cls: type) -> None:
+    """Restore the methods of `cls` once no target uses the wrappers."""
+    count, originals = _installed[cls]
+    if count > 1:
+        _installed[cls] = (count - 1, originals)
+        return
+
+    del _installed[cls]
+    for name, original in originals.items():
+        if original is _MISSING:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, original)
+
+
+def _check_target(target: Any) -> type:
+    cls = target if isinstance(target, type) else type(target)
+    if not issubclass(cls, SinglyLinkedBase):
+        raise TypeError(f'Only the structures of oops.lists can be instrumented: {cls.__name__}')
+    return cls
+
+
+def _own_stats(target: Any) -> Stats | None:
+    """Return the statistics of `target` itself, not inherited from its class
+    or its parent classes."""
+    if isinstance(target, type):
+        return target.__dict__.get('_stats')
+    # Instance attributes are compared with the class attribute instead of
+    # looked up in `vars(target)`, which would make attribute access slower
+    stats = target._stats
+    return None if stats is type(target)._stats else stats
+
+
+def instrument(target: Any) -> Stats:
+    """Start recording the statistics of `target`, a structure class (for all
+    its instances) or a single structure, and return them.
+
+    The methods of the class are replaced by recording wrappers only while
+    the class or one of its instances is instrumented, so structures cost
+    nothing extra once `uninstrument` was called. Instances of an
+    instrumented class share its statistics, unless they are instrumented
+    on their own.
+
+    Raises
+    ------
+    TypeError
+        If `target` is not a structure of `oops.lists`.
+    """
+    cls = _check_target(target)
+    current = _own_stats(target)
+    if current is not None:
+        return current
+
+    _install(cls)
+    stats = Stats()
+    if isinstance(target, type):
+        _replaced_stats[cls] = cls.__dict__.get('_stats', _MISSING)
+        cls._stats = stats  # type: ignore[attr-defined]
+    else:
+        setattr(target, '_stats', stats)
+    return stats
+
+
+def uninstrument(target: Any) -> Stats | None:
+    """Stop recording the statistics of `target` and return them, or `None`
+    if `target` wasn't instrumented.
+
+    Raises
+    ------
+    TypeError
+        If `target` is not a structure of `oops.lists`.
+    """
+    cls = _check_target(target)
+    stats = _own_stats(target)
+    if stats is None:
+        return None
+    if isinstance(target, type):
+        original = _replaced_stats.pop(cls)
+        if original is _MISSING:
+            delattr(cls, '_stats')
+        else:
+            setattr(cls, '_stats', original)
+    else:
+        delattr(target, '_stats')
+    _uninstall(cls)
+    return stats
+
+
+def get_stats(target: Any) -> Stats | None:
+    """Return the statistics recorded for `target` (an instance or a class),
+    or `None` if it isn't instrumented."""
+    return target._stats
+
+
+@contextmanager
+def instrumented(target: Any) -> Iterator[Stats]:
+    """Context manager instrumenting `target` and yielding its statistics."""
+    recorded = instrument(target)
+    try:
+        yield recorded
+    finally:
+        uninstrument(target)
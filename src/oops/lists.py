@@ -1,12 +1,86 @@
 from __future__ import annotations
 
+import heapq
+from abc import ABC
+from abc import abstractmethod
+from array import array
+from collections.abc import Iterable
 from copy import deepcopy
 from dataclasses import dataclass
 from dataclasses import field
+from dataclasses import InitVar
+from itertools import islice
+from random import Random
+from reprlib import recursive_repr
 from typing import Any
+from typing import Callable
+from typing import ClassVar
+from typing import Iterator
+from typing import TypeVar
 
 
-@dataclass
+REPR_MAX_NODES = 100
+"""Maximum number of nodes expanded by the repr of a node, the following
+ones are shown as `...`."""
+
+
+def _node_repr(node: Any, links: tuple[str, ...]) -> str:
+    """Return the dataclass-style repr of `node` and of the nodes it links to
+    through `links`, built iteratively.
+
+    Like the recursive dataclass repr, a node already being printed is shown
+    as `...`, and so are the nodes past the first `REPR_MAX_NODES`.
+    """
+    parts: list[str] = []
+    path: set[int] = set()
+    expanded = 0
+    # Items are ('node', node), ('text', str) or ('close', node)
+    stack: list[tuple[str, Any]] = [('node', node)]
+    while stack:
+        kind, item = stack.pop()
+        if kind == 'text':
+            parts.append(item)
+        elif kind == 'close':
+            parts.append(')')
+            path.discard(id(item))
+        elif not isinstance(item, (ListNode, DoubleListNode)):
+            parts.append(repr(item))
+        elif id(item) in path or expanded >= REPR_MAX_NODES:
+            parts.append('...')
+        else:
+            expanded += 1
+            path.add(id(item))
+            parts.append(f'{type(item).__qualname__}(val={item.val!r}')
+            stack.append(('close', item))
+            for link in reversed(links):
+                stack.append(('node', getattr(item, link)))
+                stack.append(('text', f', {link}='))
+    return ''.join(parts)
+
+
+def _nodes_equal(node: Any, other: Any, links: tuple[str, ...]) -> bool:
+    """Compare the values of two node graphs linked through `links`,
+    iteratively, comparing every pair of nodes once (so cycles end)."""
+    pending = [(node, other)]
+    seen = set()
+    while pending:
+        a, b = pending.pop()
+        if a is b:
+            continue
+        if type(a) is not type(b) or not isinstance(a, (ListNode, DoubleListNode)):
+            if not a == b:
+                return False
+            continue
+        if (id(a), id(b)) in seen:
+            continue
+        seen.add((id(a), id(b)))
+        if not (a.val is b.val or a.val == b.val):
+            return False
+        pending.extend((getattr(a, link), getattr(b, link)) for link in links)
+    return True
+
+
+@dataclass(slots=True, repr=False, eq=False)
 class ListNode():
     """Contains a value (type: Any) and a reference to another ListNode type.
     """
@@ -19,8 +93,19 @@ class ListNode():
     next: ListNode | None = field(default=None, init=True)
     """Next `ListNode`."""
 
+    __hash__ = None  # type: ignore
 
-@dataclass
+    @recursive_repr()
+    def __repr__(self) -> str:
+        return _node_repr(self, ('next',))
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return _nodes_equal(self, other, ('next',))
+
+
+@dataclass(slots=True, repr=False, eq=False)
 class DoubleListNode():
     val: Any = field(default=None, init=True)
     """Value stored in `DoubleListNode`."""
@@ -29,11 +114,484 @@ class DoubleListNode():
     prev: DoubleListNode | None = field(default=None, init=True)
     """Previous `DoubleListNode`."""
 
+    __hash__ = None  # type: ignore
+
+    @recursive_repr()
+    def __repr__(self) -> str:
+        return _node_repr(self, ('next', 'prev'))
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return _nodes_equal(self, other, ('next', 'prev'))
+
+
+@dataclass
+class NodePool:
+    """Free-list of released nodes, reused by linked structures instead of
+    allocating new ones.
+
+    A pool can be given to a single structure or shared between structures
+    using the same node type. Nodes handed out by a structure (e.g. by
+    `SinglyLinkedList.__getitem__`) must not be kept after their value was
+    removed from a pooled structure, since the node can be reused.
+    """
+
+    node_type: type[Any] = ListNode
+    """Type of the pooled nodes, `ListNode` or `DoubleListNode`."""
+    maxsize: int = 1024
+    """Maximum number of nodes kept in the free-list."""
+    _free: list[Any] = field(default_factory=list, init=False, repr=False)
+    """Released nodes."""
+
+    def __post_init__(self) -> None:
+        if self.node_type not in (ListNode, DoubleListNode):
+            raise TypeError(f'NodePool: unsupported node type {self.node_type=}')
+        if self.maxsize < 0:
+            raise ValueError(f'NodePool: maxsize must be positive: {self.maxsize=}')
+
+    def __len__(self) -> int:
+        """Return the number of free nodes."""
+        return len(self._free)
+
+    def acquire(self) -> Any:
+        """Return a free node, or a new one if the free-list is empty."""
+        if self._free:
+            return self._free.pop()
+        return self.node_type()
+
+    def release(self, node: Any) -> None:
+        """Clear `node` and keep it for reuse, if the pool isn't full.
+
+        Raises
+        ------
+        TypeError
+            If `node` is not of the pool's node type.
+        """
+        if type(node) is not self.node_type:
+            raise TypeError(f'NodePool: expected {self.node_type.__name__}, got {type(node).__name__}')
+        node.val = node.next = None
+        if self.node_type is DoubleListNode:
+            node.prev = None
+        if len(self._free) < self.maxsize:
+            self._free.append(node)
+
+    def clear(self) -> None:
+        """Drop all free nodes."""
+        self._free.clear()
+
+
+def _iter_values(iterable: Iterable[Any], deep_copy: bool = False) -> Iterable[Any]:
+    """Return the values of `iterable`, lazily deep copied if `deep_copy` is
+    True. Singly linked lists give their values instead of their nodes."""
+    if isinstance(iterable, SinglyLinkedList):
+        iterable = iterable.values()
+    if deep_copy:
+        memo: dict[int, Any] = {}
+        return (deepcopy(x, memo) for x in iterable)
+    return iterable
+
+
+def _checked_values(values: Any, method: str, deep_copy: bool = False) -> Iterator[Any]:
+    """Return an iterator over the values of `values`.
+
+    Raises
+    ------
+    TypeError
+        If `values` is not iterable, naming the `method` it was given to.
+    """
+    try:
+        return iter(_iter_values(values, deep_copy))
+    except TypeError as exc:
+        raise TypeError(f"Object given to {method} is not iterable: {values=}") from exc
+
+
+def _check_count(k: int) -> None:
+    """Raise a `ValueError` if `k` is not a valid number of values to pop."""
+    if not type(k) is int or k < 0:
+        raise ValueError(f'Number of values must be a non-negative integer: {k=}')
+
+
+def _init_values(init_value: Any, deep_copy: bool = False) -> Iterable[Any]:
+    """Return the values a structure is created with: scalars are a single
+    value, iterables give all their values and anything else is ignored."""
+    match init_value:
+        case int() | float() | str() | bytes():
+            return (deepcopy(init_value) if deep_copy else init_value,)
+
+        case ListNode() | DoubleListNode() | None:
+            return ()
+
+        case Iterable():
+            return _iter_values(init_value, deep_copy)
+
+    return ()
+
+
+def _walk_values(node: Any, count: int) -> Iterator[Any]:
+    """Yield the values of `count` nodes linked from `node`."""
+    for _ in range(count):
+        yield node.val
+        node = node.next
+
+
+T = TypeVar('T', bound='SinglyLinkedBase')
+
+
+def _rebuild(cls: type[T], values: list[Any], kwargs: dict[str, Any]) -> T:
+    """Unpickle a structure pickled by `SinglyLinkedBase.__reduce__`."""
+    return cls.from_iterable(values, **kwargs)
+
+
+def _normalize_index(idx: int, size: int, name: str) -> int:
+    """Return the non-negative index of `idx` in a structure of `size`
+    values; negative indices count from the back.
+
+    Raises
+    ------
+    IndexError
+        If the `idx` index is out of bounds.
+    ValueError
+        If `idx` is not an integer.
+    """
+    if not type(idx) is int:
+        raise ValueError(f'{name}: index must be an integer.')
+    if idx < 0:
+        idx += size
+    if not 0 <= idx < size:
+        raise IndexError(f'{name}: index out of range.')
+    return idx
+
+
+def _range_items(indices: range, size: int, forward: Callable[[], Iterator[Any]],
+                 backward: Callable[[], Iterator[Any]] | None = None) -> Iterator[Any]:
+    """Return the items at `indices` of a structure of `size` items, walking
+    a single time through `forward` (or `backward`, if given and nearer to
+    the items). Items walked against the order of `indices` are collected
+    before being returned."""
+    if not indices:
+        return iter(())
+    step = abs(indices.step)
+    low, high = min(indices[0], indices[-1]), max(indices[0], indices[-1])
+    if backward is None or low <= size - 1 - high:
+        items = islice(forward(), low, high + 1, step)
+        return items if indices.step > 0 else reversed(list(items))
+    items = islice(backward(), size - 1 - high, size - low, step)
+    return items if indices.step < 0 else reversed(list(items))
+
+
+def _windows(items: Iterable[Any], size: int, step: int | None) -> Iterator[list[Any]]:
+    """Return an iterator over lists of `size` consecutive items of `items`,
+    starting every `step` items (by default `size`), in a single pass. The
+    last windows are shorter if the items run out.
+
+    Raises
+    ------
+    ValueError
+        If `size` or `step` is not a positive integer.
+    """
+    step = size if step is None else step
+    if not (type(size) is int and type(step) is int and size > 0 and step > 0):
+        raise ValueError(f'Window size and step must be positive integers: {size=}, {step=}')
+    return _iter_windows(iter(items), size, step)
+
+
+def _iter_windows(iterator: Iterator[Any], size: int, step: int) -> Iterator[list[Any]]:
+    window = list(islice(iterator, size))
+    while window:
+        yield window
+        if step >= size:
+            # Skip the items between two windows
+            for _ in islice(iterator, step - size):
+                pass
+            window = list(islice(iterator, size))
+        else:
+            added = list(islice(iterator, step))
+            if not added:
+                return
+            window = window[step:] + added
+
+
+def _check_splice(structure: SinglyLinkedBase, other: Any) -> None:
+    """Check that the nodes of `other` can be moved to `structure`."""
+    if not isinstance(other, type(structure)):
+        raise TypeError(f'{type(structure).__name__}: cannot splice a {type(other).__name__}.')
+    if other is structure:
+        raise ValueError(f'{type(structure).__name__}: cannot splice a structure into itself.')
+
+
+def _cut(node: Any, count: int) -> Any:
+    """Cut the chain from `node` after `count` nodes and return the rest of
+    the chain, or `None`."""
+    for _ in range(count - 1):
+        if node is None:
+            return None
+        node = node.next
+    if node is None:
+        return None
+    rest, node.next = node.next, None
+    return rest
+
+
+def _merge_runs(left: Any, right: Any, tail: Any, key: Callable[[Any], Any] | None, reverse: bool) -> Any:
+    """Link the nodes of the sorted `left` and `right` chains after `tail`,
+    in stable order, and return the last linked node. The key of every
+    node is computed once.
+
+    If a comparison raises, the remaining nodes are linked after the merged
+    ones before the exception is propagated.
+    """
+    if right is None:
+        tail.next = left
+    else:
+        try:
+            left_key = left.val if key is None else key(left.val)
+            right_key = right.val if key is None else key(right.val)
+            while True:
+                if (left_key < right_key) if reverse else (right_key < left_key):
+                    tail.next = tail = right
+                    right = right.next
+                    if right is None:
+                        tail.next = left
+                        break
+                    right_key = right.val if key is None else key(right.val)
+                else:
+                    tail.next = tail = left
+                    left = left.next
+                    if left is None:
+                        tail.next = right
+                        break
+                    left_key = left.val if key is None else key(left.val)
+        except BaseException:
+            tail.next = left
+            while tail.next is not None:
+                tail = tail.next
+            tail.next = right
+            raise
+    while tail.next is not None:
+        tail = tail.next
+    return tail
+
+
+def _merge_sort_chain(head: Any, key: Callable[[Any], Any] | None, reverse: bool) -> Any:
+    """Sort the chain of nodes after the `head` sentinel, ending with `None`,
+    with a bottom-up merge sort merging runs of 1, 2, 4, ... nodes, and
+    return its new last node.
+
+    If a comparison raises, the chain still holds all the nodes.
+    """
+    width = 1
+    while True:
+        tail, node, merges = head, head.next, 0
+        while node is not None:
+            left = node
+            right = _cut(left, width)
+            node = _cut(right, width)
+            try:
+                tail = _merge_runs(left, right, tail, key, reverse)
+            except BaseException:
+                # Keep the nodes of the runs that weren't merged yet
+                while tail.next is not None:
+                    tail = tail.next
+                tail.next = node
+                raise
+            merges += 1
+        if merges <= 1:
+            return tail
+        width *= 2
+
+
+def _sort_structure(structure: Any, key: Callable[[Any], Any] | None, reverse: bool) -> None:
+    """Sort the nodes of `structure` in place, see `SinglyLinkedList.sort`."""
+    if structure._sorted_by == (key, reverse):
+        return
+    first, last, count = structure._detach_chain()
+    if count:
+        last.next = None
+        head = ListNode(None, first)
+        try:
+            _merge_sort_chain(head, key, reverse)
+        finally:
+            # Find the last node in one pass, restoring the `prev` links
+            previous: Any = None
+            node: Any = head.next
+            while node is not None:
+                if structure._node_type is DoubleListNode:
+                    node.prev = previous
+                previous, node = node, node.next
+            structure._attach_chain(head.next, previous, count)
+    structure._sorted_by = (key, reverse)
+
+
+def _check_sorted(structure: Any, values: Iterator[Any], key: Callable[[Any], Any] | None, reverse: bool) -> bool:
+    """Return `True` if `values` are sorted by `key`, recording it in the
+    `_sorted_by` flag of `structure`."""
+    if structure._sorted_by == (key, reverse):
+        return True
+    values = iter(values) if key is None else map(key, values)
+    previous = next(values, None)
+    for current in values:
+        if (previous < current) if reverse else (current < previous):
+            return False
+        previous = current
+    structure._sorted_by = (key, reverse)
+    return True
+
+
+def _sorted_contains(values: Iterator[Any], value: Any) -> bool:
+    """Return `True` if `value` is in the ascending `values`, stopping at the
+    first larger value (or at any value that can't be compared with it)."""
+    for val in values:
+        if val is value or val == value:
+            return True
+        try:
+            if value < val:
+                return False
+        except TypeError:
+            continue
+    return False
+
+
+@dataclass(frozen=True, eq=False)
+class SliceView:
+    """Lazy view of the values (or nodes) of a structure at the `indices`,
+    resolved against the length of the structure when the view is made.
+
+    Nothing is copied: iterating the view walks the structure a single time,
+    from the nearest end when the structure has one, and slicing the view
+    returns another view. Changing the length of the structure invalidates
+    the view.
+    """
+
+    structure: Any
+    """Viewed structure."""
+    indices: range
+    """Indices of the viewed values in the structure."""
+
+    def __repr__(self) -> str:
+        return f'SliceView({type(self.structure).__name__}, {self.indices!r})'
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.structure._iter_range(self.indices)
+
+    def __reversed__(self) -> Iterator[Any]:
+        return self.structure._iter_range(self.indices[::-1])
+
+    def __getitem__(self, idx: int | slice) -> Any:
+        """Get the item at index `idx` of the view, or a view of a slice of
+        the view.
+
+        Raises
+        ------
+        IndexError
+            If the `idx` index is out of bounds.
+        ValueError
+            If an illegal `idx` index is given.
+        """
+        if isinstance(idx, slice):
+            return SliceView(self.structure, self.indices[idx])
+        return self.structure[self.indices[_normalize_index(idx, len(self), 'SliceView')]]
+
+    def windows(self, size: int, step: int | None = None) -> Iterator[list[Any]]:
+        """Yield lists of `size` consecutive items of the view, starting
+        every `step` items (by default `size`), in a single walk."""
+        return _windows(self, size, step)
+
 
 @dataclass
-class SinglyLinkedBase:
+class SinglyLinkedBase(ABC):
     _size: int = field(default=0, init=False, repr=False)
     """Number of contained list nodes."""
+    pool: NodePool | None = field(default=None, kw_only=True, repr=False, compare=False)
+    """Optional pool recycling the nodes released by the structure."""
+    deep_copy: InitVar[bool] = field(default=False, kw_only=True)
+    """Deep copy the initial values instead of storing them as they are."""
+
+    _node_type: ClassVar[type[Any]] = ListNode
+    """Type of the nodes used by the structure."""
+    _pooled: ClassVar[bool] = True
+    """Whether the structure can recycle its nodes through a `NodePool`."""
+    _stats: ClassVar[Any] = None
+    """Statistics recorded while the class or the instance is instrumented,
+    see `oops.instrument`."""
+
+    def __post_init__(self, deep_copy: bool = False) -> None:
+        if self.pool is None:
+            return
+        if not self._pooled:
+            raise TypeError(f'{type(self).__name__} does not support node pools.')
+        if self.pool.node_type is not self._node_type:
+            raise TypeError(f'{type(self).__name__} needs a pool of {self._node_type.__name__} nodes.')
+
+    @classmethod
+    def from_iterable(cls: type[T], iterable: Iterable[Any], deep_copy: bool = False, **kwargs: Any) -> T:
+        """Create the structure from the values of `iterable`, linked in a
+        single streaming pass.
+
+        Parameters
+        ----------
+        iterable : Iterable[Any]
+            Values to add, in insertion order. Generators are consumed lazily.
+        deep_copy : bool, optional
+            Deep copy the values instead of storing them, by default False.
+        **kwargs : Any
+            Keyword arguments of the structure (e.g. `pool`).
+
+        Raises
+        ------
+        TypeError
+            If `iterable` is not iterable.
+        """
+        structure = cls(**kwargs)
+        structure._link_values(_checked_values(iterable, 'from_iterable', deep_copy))
+        return structure
+
+    @abstractmethod
+    def _link_values(self, values: Iterable[Any]) -> int:
+        """Add all `values` in a single pass, the way the structure adds a
+        single value, and return their number."""
+
+    @abstractmethod
+    def _flat_values(self) -> Iterable[Any]:
+        """Return the values in the order that `_link_values` rebuilds the
+        structure from."""
+
+    def _init_kwargs(self) -> dict[str, Any]:
+        """Return the keyword arguments creating an empty copy of the
+        structure."""
+        return {} if self.pool is None else {'pool': self.pool}
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle the structure as a flat list of its values, rebuilt in a
+        single pass instead of recursing through the nodes."""
+        return _rebuild, (type(self), list(self._flat_values()), self._init_kwargs())
+
+    def __copy__(self: T) -> T:
+        """Return a structure holding the same values, in new nodes."""
+        copied = type(self)(**self._init_kwargs())
+        copied._link_values(self._flat_values())
+        return copied
+
+    def __deepcopy__(self: T, memo: dict[int, Any]) -> T:
+        """Return a structure holding deep copies of the values."""
+        copied = type(self)(**deepcopy(self._init_kwargs(), memo))
+        memo[id(self)] = copied
+        copied._link_values(deepcopy(val, memo) for val in self._flat_values())
+        return copied
+
+    def _build_chain(self, values: Iterable[Any]) -> tuple[Any, Any, int]:
+        """Link new nodes holding `values` in order and return the first
+        node, the last node and the number of nodes."""
+        new_node = self._new_node
+        head = tail = ListNode()
+        count = 0
+        for val in values:
+            tail.next = tail = new_node(val)
+            count += 1
+        return head.next, (tail if count else None), count
 
     def __len__(self) -> int:
         """Return list's size."""
@@ -43,6 +601,20 @@ class SinglyLinkedBase:
         """Return `True` if list is empty."""
         return self._size == 0
 
+    def _new_node(self, val: Any = None, next: Any = None) -> Any:
+        """Return a node holding `val` and `next`, taken from the pool if
+        there is one."""
+        if self.pool is None:
+            return ListNode(val, next)
+        node = self.pool.acquire()
+        node.val, node.next = val, next
+        return node
+
+    def _release_node(self, node: Any) -> None:
+        """Give a node removed from the structure back to the pool."""
+        if self.pool is not None:
+            self.pool.release(node)
+
 
 @dataclass
 class SinglyLinkedList(SinglyLinkedBase):
@@ -57,38 +629,39 @@ class SinglyLinkedList(SinglyLinkedBase):
     element_4: [value, None]
     """
 
-    _head: ListNode = field(default_factory=ListNode, init=True)
+    _head: ListNode | Iterable[Any] | None = field(default_factory=ListNode, init=True)
     """List head node."""
+    _tail: ListNode | None = field(default=None, init=False, repr=False, compare=False)
+    """List tail node, kept so that `add` doesn't walk the whole list."""
 
-    def __post_init__(self) -> None:
-        init_value = deepcopy(self._head)
-        self._head = ListNode(None, None)
-        match init_value:
-            case int() | float() | str():
-                self.add(init_value)
+    _sorted_by: tuple[Any, bool] | None = field(default=None, init=False, repr=False, compare=False)
+    """`key` and `reverse` the values are known to be sorted by."""
 
-            case list() | set() | frozenset() | SinglyLinkedList():
-                for x in init_value:
-                    self.add(x)
+    def __post_init__(self, deep_copy: bool = False) -> None:
+        super().__post_init__(deep_copy)
+        init_value = self._head
+        self._head = ListNode(None, None)
+        self._tail = None
+        self._link_values(_init_values(init_value, deep_copy))
 
     def __str__(self) -> str:
         if self.is_empty():
             return 'SinglyLinkedList()'
         return repr(self)
 
-    def __getitem__(self, idx: int) -> ListNode | None:
+    def __getitem__(self, idx: int | slice) -> Any:
         """Get the element from the SinglyLinkedList from the specified
-        `idx` index.
+        `idx` index, or a lazy view of the elements of a slice.
 
         Parameters
         ----------
-        idx : int
-            Index of searched element.
+        idx : int | slice
+            Index of searched element, negative indices count from the end.
 
         Returns
         -------
-        ListNode | None
-            Element from index `idx`.
+        ListNode | SliceView
+            Element from index `idx`, or `SliceView` of the slice `idx`.
 
         Raises
         ------
@@ -97,10 +670,12 @@ class SinglyLinkedList(SinglyLinkedBase):
         ValueError
             If an illegal `idx` index is given.
         """
-        if idx >= len(self):
-            raise IndexError('SinglyLinkedList: index out of range.')
-        if idx < 0 or not type(idx) is int:
-            raise ValueError('SinglyLinkedList: index must be positive integer.')
+        if isinstance(idx, slice):
+            return SliceView(self, range(*idx.indices(len(self))))
+        idx = _normalize_index(idx, len(self), 'SinglyLinkedList')
+
+        if idx == len(self) - 1:
+            return self._tail
 
         node_parser = self._head
         while idx != 0:
@@ -109,11 +684,75 @@ class SinglyLinkedList(SinglyLinkedBase):
 
         return node_parser
 
-    def __iter__(self):
-        """Implementing this only to make mypy happy, since this is not needed
-        when `__len__` and `__getitem__` are defined."""
-        for x in range(len(self)):
-            yield self[x]
+    def _iter_range(self, indices: range) -> Iterator[ListNode]:
+        """Iterate over the nodes at `indices`, in a single walk."""
+        return _range_items(indices, len(self), self.nodes)
+
+    def windows(self, size: int, step: int | None = None) -> Iterator[list[ListNode]]:
+        """Yield lists of `size` consecutive nodes, starting every `step`
+        nodes (by default `size`, i.e. pages), in a single walk.
+
+        Raises
+        ------
+        ValueError
+            If `size` or `step` is not a positive integer.
+        """
+        return _windows(self.nodes(), size, step)
+
+    def __iter__(self) -> Iterator[ListNode]:
+        """Iterate over the nodes of the list in a single pass."""
+        return self.nodes()
+
+    def __reversed__(self) -> Iterator[ListNode]:
+        """Iterate over the nodes of the list from the tail to the head.
+
+        The nodes are collected in a single forward pass, since they don't
+        have a reference to the previous node.
+        """
+        return reversed(list(self.nodes()))
+
+    def __contains__(self, value: Any) -> bool:
+        """Return `True` if `value` is stored in the list, in a single pass.
+        The pass stops at the first larger value if the list is known to be
+        sorted in ascending order.
+
+        `ListNode` objects are compared against the nodes themselves, like the
+        iteration-based membership test did.
+        """
+        if isinstance(value, ListNode):
+            return any(node == value for node in self.nodes())
+        if self._sorted_by == (None, False):
+            return _sorted_contains(self.values(), value)
+        return any(val is value or val == value for val in self.values())
+
+    def nodes(self) -> Iterator[ListNode]:
+        """Iterate over the nodes of the list, from head to tail."""
+        node = self._head
+        for _ in range(len(self)):
+            yield node  # type: ignore[misc]
+            node = node.next  # type: ignore
+
+    def values(self) -> Iterator[Any]:
+        """Iterate over the values stored in the list, from head to tail."""
+        node = self._head
+        for _ in range(len(self)):
+            yield node.val  # type: ignore[union-attr]
+            node = node.next  # type: ignore
+
+    def _flat_values(self) -> Iterable[Any]:
+        return self.values()
+
+    def _link_values(self, values: Iterable[Any]) -> int:
+        head, tail, count = self._build_chain(values)
+        if count:
+            if self.is_empty():
+                self._head = head
+            else:
+                self._tail.next = head  # type: ignore
+            self._tail = tail
+            self._size += count
+            self._sorted_by = None
+        return count
 
     def add(self, value: Any = None, iterate: bool = False) -> None:
         """Add ListNode object(s) with a specific `value` to the end of the
@@ -132,55 +771,118 @@ class SinglyLinkedList(SinglyLinkedBase):
             If `iterate` is True and `value` is not iterable.
         """
         if not iterate:
-            node_to_add = ListNode(val=value)
+            node_to_add = self._new_node(value)
 
             if self.is_empty():
-                self._head, self._size = node_to_add, 1
+                self._head = node_to_add
             else:
-                list_end = self._head
+                self._tail.next = node_to_add  # type: ignore
+            self._tail = node_to_add
+            self._size += 1
+            self._sorted_by = None
+        else:
+            self._link_values(_checked_values(value, 'add'))
 
-                if list_end is not None:
-                    while list_end.next is not None:
-                        list_end = list_end.next
+    def splice(self, other: SinglyLinkedList, front: bool = False) -> None:
+        """Move all the nodes of `other` to the back (or the front) of the
+        list, in O(1), leaving `other` empty.
 
-                    list_end.next = node_to_add
-                    self._size += 1
+        Raises
+        ------
+        TypeError
+            If `other` is not a `SinglyLinkedList`.
+        ValueError
+            If `other` is the list itself.
+        """
+        _check_splice(self, other)
+        self._attach_chain(*other._detach_chain(), front)
+
+    def _detach_chain(self) -> tuple[Any, Any, int]:
+        """Unlink all the nodes and return the first node, the last node and
+        their number, leaving the structure empty."""
+        chain = (self._head, self._tail, self._size) if self._size else (None, None, 0)
+        self._head, self._tail, self._size = ListNode(None, None), None, 0
+        return chain
+
+    def _attach_chain(self, first: Any, last: Any, count: int, front: bool = False) -> None:
+        """Link the `count` nodes from `first` to `last` (linked by `next`)
+        to the back, or the front, of the structure."""
+        if not count:
+            return
+        if self.is_empty():
+            last.next = None
+            self._head, self._tail = first, last
+        elif front:
+            last.next, self._head = self._head, first
         else:
-            try:
-                for x in value:
-                    self.add(x)
-            except TypeError as exc:
-                raise TypeError(
-                    f"Variable given to add_nodes is not iterable: {value=}") from exc
+            last.next = None
+            self._tail.next, self._tail = first, last  # type: ignore
+        self._size += count
+        self._sorted_by = None
+
+    def sort(self, key: Callable[[Any], Any] | None = None, reverse: bool = False) -> None:
+        """Sort the list in place with a stable bottom-up merge sort that
+        relinks the nodes: O(n log n) comparisons and O(1) extra space.
+
+        The list is then known to be sorted (see `is_sorted`) until a value
+        is added, which lets `in` and the searches of `oops.searches` stop
+        in a single pass; changing the values of its nodes isn't tracked. If a
+        comparison raises, the list keeps all its nodes, in any order.
+
+        Parameters
+        ----------
+        key : Callable[[Any], Any] | None, optional
+            Function applied to the values before comparing them, by default
+            None.
+        reverse : bool, optional
+            Sort in descending order, keeping equal values in order, by
+            default False.
+        """
+        _sort_structure(self, key, reverse)
+
+    def is_sorted(self, key: Callable[[Any], Any] | None = None, reverse: bool = False) -> bool:
+        """Return `True` if the values are sorted by `key` (in descending order
+        if `reverse`), in O(1) if the list is known to be sorted that way and
+        in a single pass otherwise."""
+        return _check_sorted(self, self.values(), key, reverse)
 
 
 @dataclass
 class SinglyLinkedStack(SinglyLinkedBase):
     """ADT implementation of a Stack."""
-    _head: ListNode = field(default_factory=ListNode, init=True)
+    _head: ListNode | Iterable[Any] | None = field(default_factory=ListNode, init=True)
     """Stack head."""
 
-    def __post_init__(self):
-        init_value = deepcopy(self._head)
-        self._head = None
-        match init_value:
-            case int() | float() | str():
-                self.push(init_value)
-
-            case list() | set() | frozenset() | SinglyLinkedList():
-                for x in init_value:
-                    self.push(x)
+    def __post_init__(self, deep_copy: bool = False) -> None:
+        super().__post_init__(deep_copy)
+        init_value = self._head
+        self._head = None  # type: ignore
+        self._link_values(_init_values(init_value, deep_copy))
 
     def __str__(self) -> str:
         if self.is_empty():
             return 'SinglyLinkedStack()'
         return repr(self)
 
+    def _flat_values(self) -> Iterable[Any]:
+        # From the bottom of the stack, pushed back in order
+        return reversed(list(_walk_values(self._head, self._size)))
+
+    def _link_values(self, values: Iterable[Any]) -> int:
+        new_node = self._new_node
+        head, count = self._head, 0
+        for val in values:
+            head = new_node(val, head)
+            count += 1
+        self._head = head
+        self._size += count
+        return count
+
     def top(self) -> Any:
         """Get the element at the top of the stack."""
         if self.is_empty():
             raise IndexError('Stack is empty.')
-        return self._head.val
+        return self._head.val  # type: ignore[union-attr]
 
     def push(self, value: Any = None, iterate: bool = False) -> None:
         """Push `ListNode` object(s) in the stack.
@@ -198,16 +900,22 @@ class SinglyLinkedStack(SinglyLinkedBase):
             If `iterate` is True and value is not iterable.
         """
         if not iterate:
-            node_to_add = ListNode(val=value, next=self._head)
+            node_to_add = self._new_node(value, self._head)
             self._head = node_to_add
             self._size += 1
         else:
-            try:
-                for x in value:
-                    self.push(x)
-            except TypeError as exc:
-                raise TypeError(
-                    f"Object given to push is not iterable: {value=}") from exc
+            self.push_many(value)
+
+    def push_many(self, values: Iterable[Any]) -> None:
+        """Push all `values` in the stack in a single pass, so that the last
+        value ends at the top.
+
+        Raises
+        ------
+        TypeError
+            If `values` is not iterable.
+        """
+        self._link_values(_checked_values(values, 'push_many'))
 
     def pop(self) -> Any:
         """Pop (remove and return) the value stored in the top of the stack.
@@ -220,41 +928,86 @@ class SinglyLinkedStack(SinglyLinkedBase):
 
         if self.is_empty():
             raise IndexError('Stack is empty.')
-        val = self._head.val
-        self._head = self._head.next  # type: ignore
+        node = self._head
+        val = node.val  # type: ignore[union-attr]
+        self._head = node.next  # type: ignore
         self._size -= 1
+        self._release_node(node)
         return val
 
+    def pop_many(self, k: int) -> list[Any]:
+        """Pop up to `k` values from the top of the stack and return them in
+        popping order, updating the size once.
+
+        Raises
+        ------
+        ValueError
+            If `k` is not a non-negative integer.
+        """
+        _check_count(k)
+        values = []
+        node = self._head
+        for _ in range(min(k, len(self))):
+            values.append(node.val)  # type: ignore[union-attr]
+            node, popped = node.next, node  # type: ignore
+            self._release_node(popped)
+        self._head = node
+        self._size -= len(values)
+        return values
+
+    def drain(self) -> Iterator[Any]:
+        """Pop and yield the values of the stack until it is empty.
+
+        Values are removed one at a time, as they are consumed, so stopping
+        the iteration early leaves the remaining values in the stack.
+        """
+        while self._size:
+            node = self._head
+            self._head = node.next  # type: ignore
+            self._size -= 1
+            val = node.val  # type: ignore[union-attr]
+            self._release_node(node)
+            yield val
+
 
 @dataclass
 class Queue(SinglyLinkedBase):
     """ADT implementation of a Queue."""
-    _head: ListNode = field(default_factory=ListNode, init=True)
+    _head: ListNode | Iterable[Any] | None = field(default_factory=ListNode, init=True)
     """Queue head."""
     _tail: ListNode = field(default_factory=ListNode, init=False, repr=False)
     """Queue tail."""
 
-    def __post_init__(self):
-        init_value = deepcopy(self._head)
-        self._head = None
-        match init_value:
-            case int() | float() | str():
-                self.enqueue(init_value)
-
-            case list() | set() | frozenset() | SinglyLinkedList():
-                for x in init_value:
-                    self.enqueue(x)
+    def __post_init__(self, deep_copy: bool = False) -> None:
+        super().__post_init__(deep_copy)
+        init_value = self._head
+        self._head = None  # type: ignore
+        self._link_values(_init_values(init_value, deep_copy))
 
     def __str__(self) -> str:
         if self.is_empty():
             return 'Queue()'
         return repr(self)
 
+    def _flat_values(self) -> Iterable[Any]:
+        return _walk_values(self._head, self._size)
+
+    def _link_values(self, values: Iterable[Any]) -> int:
+        head, tail, count = self._build_chain(values)
+        if count:
+            if self.is_empty():
+                self._head = head
+            else:
+                self._tail.next = head
+            self._tail = tail
+            self._size += count
+        return count
+
     def first(self) -> Any:
         """Get the element at the front of the queue."""
         if self.is_empty():
             raise IndexError('Queue is empty.')
-        return self._head.val
+        return self._head.val  # type: ignore[union-attr]
 
     def last(self) -> Any:
         """Get the element at the end of the queue."""
@@ -278,7 +1031,7 @@ class Queue(SinglyLinkedBase):
             If `iterate` is True and value is not iterable.
         """
         if not iterate:
-            node_to_add = ListNode(val=value, next=None)
+            node_to_add = self._new_node(value)
             if self.is_empty():
                 self._head = node_to_add
             else:
@@ -286,26 +1039,117 @@ class Queue(SinglyLinkedBase):
             self._tail = node_to_add
             self._size += 1
         else:
-            try:
-                for x in value:
-                    self.enqueue(x)
-            except TypeError as exc:
-                # TODO: make this a decorator? "value_type_checker"
-                raise TypeError(
-                    f"Object given to push is not iterable: {value=}") from exc
+            self.extend(value)
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Add all `values` to the end of the queue, in a single pass.
+
+        Raises
+        ------
+        TypeError
+            If `values` is not iterable.
+        """
+        self._link_values(_checked_values(values, 'extend'))
+
+    def extendleft(self, values: Iterable[Any]) -> None:
+        """Add all `values` to the front of the queue, in a single pass. Like
+        `collections.deque.extendleft`, the values end in reverse order.
+
+        Raises
+        ------
+        TypeError
+            If `values` is not iterable.
+        """
+        new_node = self._new_node
+        head, first, count = self._head, None, 0
+        for val in _checked_values(values, 'extendleft'):
+            head = new_node(val, head)
+            if first is None:
+                first = head
+            count += 1
+        if count:
+            if self.is_empty():
+                self._tail = first  # type: ignore
+            self._head = head
+            self._size += count
 
     def dequeue(self) -> Any:
         """Remove and return the element at the front of the queue."""
         if self.is_empty():
             raise IndexError('Queue is empty.')
 
-        val = self._head.val
-        self._head = self._head.next  # type: ignore
+        node = self._head
+        val = node.val  # type: ignore[union-attr]
+        self._head = node.next  # type: ignore
         self._size -= 1
         if self.is_empty():
             self._tail = ListNode()
+        self._release_node(node)
         return val
 
+    def pop_many(self, k: int) -> list[Any]:
+        """Remove up to `k` values from the front of the queue and return them
+        in queue order, updating the size once.
+
+        Raises
+        ------
+        ValueError
+            If `k` is not a non-negative integer.
+        """
+        _check_count(k)
+        values = []
+        node = self._head
+        for _ in range(min(k, len(self))):
+            values.append(node.val)  # type: ignore[union-attr]
+            node, dequeued = node.next, node  # type: ignore
+            self._release_node(dequeued)
+        self._head = node
+        self._size -= len(values)
+        if self.is_empty():
+            self._tail = ListNode()
+        return values
+
+    def drain(self) -> Iterator[Any]:
+        """Dequeue and yield the values of the queue until it is empty.
+
+        Values are removed one at a time, as they are consumed, so stopping
+        the iteration early leaves the remaining values in the queue.
+        """
+        while self._size:
+            yield self.dequeue()
+
+    def splice(self, other: Queue, front: bool = False) -> None:
+        """Move all the nodes of `other` to the back (or the front) of the
+        queue, in O(1), leaving `other` empty.
+
+        Raises
+        ------
+        TypeError
+            If `other` is not a `Queue`.
+        ValueError
+            If `other` is the queue itself.
+        """
+        _check_splice(self, other)
+        self._attach_chain(*other._detach_chain(), front)
+
+    def _detach_chain(self) -> tuple[Any, Any, int]:
+        chain = (self._head, self._tail, self._size) if self._size else (None, None, 0)
+        self._head, self._tail, self._size = None, ListNode(), 0  # type: ignore
+        return chain
+
+    def _attach_chain(self, first: Any, last: Any, count: int, front: bool = False) -> None:
+        if not count:
+            return
+        if self.is_empty():
+            last.next = None
+            self._head, self._tail = first, last
+        elif front:
+            last.next, self._head = self._head, first
+        else:
+            last.next = None
+            self._tail.next, self._tail = first, last
+        self._size += count
+
 
 @dataclass
 class CircularlyLinkedList(SinglyLinkedBase):
@@ -313,22 +1157,32 @@ class CircularlyLinkedList(SinglyLinkedBase):
     _tail: Any = field(default=None, init=True)
     """Queue tail."""
 
-    def __post_init__(self):
-        init_value = deepcopy(self._tail)
+    def __post_init__(self, deep_copy: bool = False) -> None:
+        super().__post_init__(deep_copy)
+        init_value = self._tail
         self._tail = None
-        match init_value:
-            case int() | float() | str():
-                self.enqueue(init_value)
-
-            case list() | set() | frozenset() | SinglyLinkedList():
-                for x in init_value:
-                    self.enqueue(x)
+        self._link_values(_init_values(init_value, deep_copy))
 
     def __str__(self) -> str:
         if self.is_empty():
             return 'CircularlyLinkedList()'
         return repr(self)
 
+    def _flat_values(self) -> Iterable[Any]:
+        return _walk_values(self._tail.next, self._size) if self._size else ()
+
+    def _link_values(self, values: Iterable[Any]) -> int:
+        head, tail, count = self._build_chain(values)
+        if count:
+            if self.is_empty():
+                tail.next = head
+            else:
+                tail.next = self._tail.next
+                self._tail.next = head
+            self._tail = tail
+            self._size += count
+        return count
+
     def first(self) -> Any:
         """Get the element at the front of the queue."""
         if self.is_empty():
@@ -357,7 +1211,7 @@ class CircularlyLinkedList(SinglyLinkedBase):
             If `iterate` is True and value is not iterable.
         """
         if not iterate:
-            node_to_add = ListNode(val=value, next=None)
+            node_to_add = self._new_node(value)
             if self.is_empty():
                 node_to_add.next = node_to_add
             else:
@@ -366,13 +1220,7 @@ class CircularlyLinkedList(SinglyLinkedBase):
             self._tail = node_to_add
             self._size += 1
         else:
-            try:
-                for x in value:
-                    self.enqueue(x)
-            except TypeError as exc:
-                # TODO: make this a decorator? "value_type_checker"
-                raise TypeError(
-                    f"Object given to push is not iterable: {value=}") from exc
+            self._link_values(_checked_values(value, 'enqueue'))
 
     def dequeue(self) -> Any:
         """Remove and return the element at the front of the queue."""
@@ -385,82 +1233,456 @@ class CircularlyLinkedList(SinglyLinkedBase):
         else:
             self._tail.next = head.next
         self._size -= 1
-        return head.val
+        val = head.val
+        self._release_node(head)
+        return val
 
+    def rotate(self, k: int = 1) -> None:
+        """Rotate the list `k` steps to the right (to the left if `k` is
+        negative), like `collections.deque.rotate`, by moving `_tail`
+        forward `-k % n` nodes.
 
-@dataclass
-class DoublyLinkedBase(SinglyLinkedBase):
-    _header: DoubleListNode = field(default_factory=DoubleListNode, init=True)
-    """Front sentinel node."""
-    _trailer: DoubleListNode = field(default_factory=DoubleListNode, init=False)
-    """End sentinel node."""
+        The round-robin step `rotate(-1)`, moving the first element to the
+        back, is O(1).
+        """
+        if self._size <= 1:
+            return
+        for _ in range(-k % self._size):
+            self._tail = self._tail.next
 
-    def __post_init__(self):
-        self._header.next = self._trailer
-        self._trailer.prev = self._header
+    def splice(self, other: CircularlyLinkedList, front: bool = False) -> None:
+        """Move all the nodes of `other` to the back (or the front) of the
+        list, in O(1), leaving `other` empty.
 
-    def _insert_between(self, val: Any, left: DoubleListNode, right: DoubleListNode) -> None:
-        node_to_add = DoubleListNode(val=val, prev=left, next=right)
-        left.next = node_to_add
-        right.prev = node_to_add
-        self._size += 1
+        Raises
+        ------
+        TypeError
+            If `other` is not a `CircularlyLinkedList`.
+        ValueError
+            If `other` is the list itself.
+        """
+        _check_splice(self, other)
+        self._attach_chain(*other._detach_chain(), front)
 
-    def _delete_node(self, node: DoubleListNode) -> None:
-        left, right = node.prev, node.next
-        left.next, right.prev = right, left  # type: ignore
-        self._size -= 1
+    def _detach_chain(self) -> tuple[Any, Any, int]:
+        chain = (self._tail.next, self._tail, self._size) if self._size else (None, None, 0)
+        self._tail, self._size = None, 0
+        return chain
 
-        # GC enablement
-        node.val = node.prev = node.next = None
+    def _attach_chain(self, first: Any, last: Any, count: int, front: bool = False) -> None:
+        if not count:
+            return
+        if self.is_empty():
+            last.next, self._tail = first, last
+        else:
+            last.next, self._tail.next = self._tail.next, first
+            if not front:
+                self._tail = last
+        self._size += count
 
 
-class LinkedDeque(DoublyLinkedBase):
+RING_OVERFLOW_POLICIES = ('overwrite', 'raise', 'drop')
+"""What a full `RingBuffer` does with a new value: overwrite the oldest
+value, raise an `IndexError` or drop the new value."""
 
-    def __post_init__(self):
-        init_value = deepcopy(self._header)
-        self._header = DoubleListNode()
-        super().__post_init__()
-        match init_value:
-            case int() | float() | str():
-                self.insert_back(init_value)
 
-            case list() | set() | frozenset() | SinglyLinkedList():
-                for x in init_value:
-                    self.insert_back(x)
+@dataclass
+class RingBuffer(SinglyLinkedBase):
+    """ADT implementation of a fixed-capacity Queue, storing its values in a
+    preallocated array used as a ring, with O(1) indexed reads.
+
+    Notes
+    -----
+
+    _data: [value_3, value_4, _, value_1, value_2]
+                              ^ _start
+    """
+
+    capacity: int = field(init=True)
+    """Maximum number of values."""
+    overflow: str = field(default='overwrite', init=True)
+    """Policy applied when enqueuing in a full buffer, see `RING_OVERFLOW_POLICIES`."""
+    typecode: str | None = field(default=None, kw_only=True, repr=False, compare=False)
+    """`array` typecode of the values, to store them in a typed array
+    instead of a list."""
+    _data: Any = field(default=None, init=False, repr=False)
+    """Value slots."""
+    _start: int = field(default=0, init=False, repr=False)
+    """Index of the oldest value in `_data`."""
+
+    # Values are stored in slots, not in nodes
+    _pooled: ClassVar[bool] = False
+
+    def __post_init__(self, deep_copy: bool = False) -> None:
+        super().__post_init__(deep_copy)
+        if not type(self.capacity) is int or self.capacity < 1:
+            raise ValueError(f'RingBuffer: capacity must be a positive integer: {self.capacity=}')
+        if self.overflow not in RING_OVERFLOW_POLICIES:
+            raise ValueError(f'RingBuffer: unknown overflow policy: {self.overflow=}')
+        if self.typecode is None:
+            self._data = [None] * self.capacity
+        else:
+            self._data = array(self.typecode, bytes(array(self.typecode).itemsize * self.capacity))
+
+    def __repr__(self) -> str:
+        return f'RingBuffer({list(self)!r}, capacity={self.capacity}, overflow={self.overflow!r})'
 
     def __str__(self) -> str:
         if self.is_empty():
-            return 'LinkedDeque()'
+            return 'RingBuffer()'
         return repr(self)
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RingBuffer):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the values, from the oldest to the newest, through a
+        `snapshot` (a copy of the references without a `typecode`)."""
+        for part in self.snapshot():
+            yield from part
+
+    def __getitem__(self, idx: int) -> Any:
+        """Get the value at index `idx` in O(1), 0 being the oldest value.
+        Negative indices count from the newest value.
+
+        Raises
+        ------
+        IndexError
+            If the `idx` index is out of bounds.
+        ValueError
+            If an illegal `idx` index is given.
+        """
+        return self._data[self._slot(idx)]
+
+    def __setitem__(self, idx: int, value: Any) -> None:
+        """Replace the value at index `idx`."""
+        self._data[self._slot(idx)] = value
+
+    def _slot(self, idx: int) -> int:
+        if not type(idx) is int:
+            raise ValueError('RingBuffer: index must be an integer.')
+        if idx < 0:
+            idx += self._size
+        if not 0 <= idx < self._size:
+            raise IndexError('RingBuffer: index out of range.')
+        return (self._start + idx) % self.capacity
+
+    def _flat_values(self) -> Iterable[Any]:
+        return iter(self)
+
+    def _init_kwargs(self) -> dict[str, Any]:
+        return {'capacity': self.capacity, 'overflow': self.overflow, 'typecode': self.typecode}
+
+    def _link_values(self, values: Iterable[Any]) -> int:
+        enqueue = self.enqueue
+        count = 0
+        for val in values:
+            enqueue(val)
+            count += 1
+        return count
+
+    def full(self) -> bool:
+        """Return `True` if the buffer holds `capacity` values."""
+        return self._size == self.capacity
+
     def first(self) -> Any:
-        """Get the value from the front of the deque."""
+        """Get the oldest value."""
         if self.is_empty():
-            raise IndexError('Deque is empty.')
-        return self._header.next.val  # type: ignore
+            raise IndexError('RingBuffer is empty.')
+        return self._data[self._start]
 
     def last(self) -> Any:
-        """Get the value from the back of the deque."""
+        """Get the newest value."""
         if self.is_empty():
-            raise IndexError('Deque is empty.')
-        return self._trailer.prev.val  # type: ignore
-
-    def insert_front(self, val: Any = None):
-        """Insert value at the front of the deque."""
-        self._insert_between(val=val, left=self._header, right=self._header.next)  # type: ignore
+            raise IndexError('RingBuffer is empty.')
+        return self._data[(self._start + self._size - 1) % self.capacity]
 
-    def insert_back(self, val: Any = None):
-        """Insert value at the back of the deque."""
-        self._insert_between(val=val, left=self._trailer.prev, right=self._trailer)  # type: ignore
+    def enqueue(self, value: Any = None, iterate: bool = False) -> None:
+        """Add object(s) after the newest value, applying the `overflow`
+        policy if the buffer is full.
 
-    def delete_front(self):
-        """Delete the node at the front of the deque."""
-        if self.is_empty():
-            raise IndexError('Deque is empty.')
-        self._delete_node(node=self._header.next)
+        Parameters
+        ----------
+        value : Any, optional
+            Value to be added, by default None.
+        iterate : bool, optional
+            Iterate over `value` and add individual values, by default False.
 
-    def pop_front(self) -> Any:
-        """Delete and return the value from the front of the deque."""
+        Raises
+        ------
+        IndexError
+            If the buffer is full and the overflow policy is 'raise'.
+        TypeError
+            If `iterate` is True and value is not iterable.
+        """
+        if iterate:
+            self._link_values(_checked_values(value, 'enqueue'))
+        elif self._size < self.capacity:
+            self._data[(self._start + self._size) % self.capacity] = value
+            self._size += 1
+        elif self.overflow == 'overwrite':
+            self._data[self._start] = value
+            self._start = (self._start + 1) % self.capacity
+        elif self.overflow == 'raise':
+            raise IndexError('RingBuffer is full.')
+
+    def dequeue(self) -> Any:
+        """Remove and return the oldest value."""
+        if self.is_empty():
+            raise IndexError('RingBuffer is empty.')
+        value = self._data[self._start]
+        if self.typecode is None:
+            self._data[self._start] = None
+        self._start = (self._start + 1) % self.capacity
+        self._size -= 1
+        return value
+
+    def clear(self) -> None:
+        """Remove all values."""
+        if self.typecode is None:
+            self._data[:] = [None] * self.capacity
+        self._start = self._size = 0
+
+    def rotate(self, k: int = 1) -> None:
+        """Rotate the buffer `k` steps to the right (to the left if `k` is
+        negative), like `collections.deque.rotate`.
+
+        A full buffer rotates in O(1), by moving its start. Otherwise
+        O(min(k, n - k)) values are moved around the free slots.
+        """
+        size = self._size
+        if size <= 1 or k % size == 0:
+            return
+        k %= size
+        if size == self.capacity:
+            self._start = (self._start - k) % self.capacity
+            return
+
+        data, capacity = self._data, self.capacity
+        if k <= size // 2:
+            # Move the last k values before the oldest one
+            for _ in range(k):
+                end = (self._start + size - 1) % capacity
+                self._start = (self._start - 1) % capacity
+                data[self._start] = data[end]
+                if self.typecode is None:
+                    data[end] = None
+        else:
+            # Move the first n - k values after the newest one
+            for _ in range(size - k):
+                data[(self._start + size) % capacity] = data[self._start]
+                if self.typecode is None:
+                    data[self._start] = None
+                self._start = (self._start + 1) % capacity
+
+    def snapshot(self) -> tuple[Any, Any]:
+        """Return the values, from the oldest to the newest, as two slices
+        of the ring: the values up to the end of the array and the values
+        wrapped to its beginning.
+
+        With a `typecode`, the slices are memoryviews of the array, so no
+        value is copied; they follow later changes to the buffer. Without
+        one, they are lists copying the references, in O(n).
+        """
+        data = self._data if self.typecode is None else memoryview(self._data)
+        end = self._start + self._size
+        if end <= self.capacity:
+            return data[self._start:end], data[0:0]
+        return data[self._start:], data[:end - self.capacity]
+
+
+@dataclass
+class DoublyLinkedBase(SinglyLinkedBase):
+    _header: DoubleListNode | Iterable[Any] | None = field(default_factory=DoubleListNode, init=True)
+    """Front sentinel node."""
+    _trailer: DoubleListNode = field(default_factory=DoubleListNode, init=False)
+    """End sentinel node."""
+
+    _node_type: ClassVar[type[Any]] = DoubleListNode
+
+    def __post_init__(self, deep_copy: bool = False) -> None:
+        super().__post_init__(deep_copy)
+        self._header.next = self._trailer  # type: ignore[union-attr]
+        self._trailer.prev = self._header  # type: ignore[assignment]
+
+    def _new_node(self, val: Any = None, next: Any = None, prev: Any = None) -> Any:
+        """Return a node holding `val`, `next` and `prev`, taken from the
+        pool if there is one."""
+        if self.pool is None:
+            return DoubleListNode(val, next, prev)
+        node = self.pool.acquire()
+        node.val, node.next, node.prev = val, next, prev
+        return node
+
+    def _link_between(self, values: Iterable[Any], left: DoubleListNode, right: DoubleListNode) -> int:
+        """Insert all `values` between the `left` and `right` nodes, in a
+        single pass, and return their number."""
+        new_node = self._new_node
+        head = tail = DoubleListNode()
+        count = 0
+        for val in values:
+            tail.next = tail = new_node(val, None, tail)
+            count += 1
+        if count:
+            first = head.next
+            first.prev, left.next = left, first  # type: ignore
+            tail.next, right.prev = right, tail
+            self._size += count
+        return count
+
+    def _insert_between(self, val: Any, left: DoubleListNode, right: DoubleListNode) -> DoubleListNode:
+        node_to_add = self._new_node(val, right, left)
+        left.next = node_to_add
+        right.prev = node_to_add
+        self._size += 1
+        return node_to_add
+
+    def _delete_node(self, node: DoubleListNode) -> None:
+        left, right = node.prev, node.next
+        left.next, right.prev = right, left  # type: ignore
+        self._size -= 1
+
+        # GC enablement
+        node.val = node.prev = node.next = None
+        self._release_node(node)
+
+
+class LinkedDeque(DoublyLinkedBase):
+
+    _sorted_by: tuple[Any, bool] | None = None
+    """`key` and `reverse` the values are known to be sorted by."""
+
+    def __post_init__(self, deep_copy: bool = False) -> None:
+        init_value = self._header
+        self._header = DoubleListNode()
+        super().__post_init__(deep_copy)
+        self._link_values(_init_values(init_value, deep_copy))
+
+    def __str__(self) -> str:
+        if self.is_empty():
+            return 'LinkedDeque()'
+        return repr(self)
+
+    def _flat_values(self) -> Iterable[Any]:
+        return iter(self)
+
+    def _link_values(self, values: Iterable[Any]) -> int:
+        self._sorted_by = None
+        return self._link_between(values, self._trailer.prev, self._trailer)  # type: ignore
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the values of the deque, from front to back."""
+        node = self._header.next  # type: ignore[union-attr]
+        while node is not self._trailer:
+            yield node.val  # type: ignore
+            node = node.next  # type: ignore
+
+    def __reversed__(self) -> Iterator[Any]:
+        """Iterate over the values of the deque, from back to front."""
+        node = self._trailer.prev
+        while node is not self._header:
+            yield node.val  # type: ignore
+            node = node.prev  # type: ignore
+
+    def __getitem__(self, idx: int | slice) -> Any:
+        """Get the value at index `idx`, walking from the nearest end, or a
+        lazy view of the values of a slice. Negative indices count from the
+        back.
+
+        Raises
+        ------
+        IndexError
+            If the `idx` index is out of bounds.
+        ValueError
+            If an illegal `idx` index is given.
+        """
+        if isinstance(idx, slice):
+            return SliceView(self, range(*idx.indices(len(self))))
+        idx = _normalize_index(idx, len(self), 'LinkedDeque')
+        size = len(self)
+        if idx < size // 2:
+            node = self._header.next  # type: ignore[union-attr]
+            for _ in range(idx):
+                node = node.next  # type: ignore
+        else:
+            node = self._trailer.prev
+            for _ in range(size - 1 - idx):
+                node = node.prev  # type: ignore
+        return node.val  # type: ignore
+
+    def _iter_range(self, indices: range) -> Iterator[Any]:
+        """Iterate over the values at `indices`, walking from the nearest end."""
+        return _range_items(indices, len(self), self.__iter__, self.__reversed__)
+
+    def windows(self, size: int, step: int | None = None) -> Iterator[list[Any]]:
+        """Yield lists of `size` consecutive values, starting every `step`
+        values (by default `size`, i.e. pages), in a single walk.
+
+        Raises
+        ------
+        ValueError
+            If `size` or `step` is not a positive integer.
+        """
+        return _windows(self, size, step)
+
+    def rotate(self, k: int = 1) -> None:
+        """Rotate the deque `k` steps to the right (to the left if `k` is
+        negative), by relinking the ends in O(min(k, n - k)).
+        """
+        size = len(self)
+        if size <= 1 or k % size == 0:
+            return
+        k %= size
+        self._sorted_by = None
+
+        # Find the node that becomes the front of the deque
+        if k <= size // 2:
+            new_first = self._trailer
+            for _ in range(k):
+                new_first = new_first.prev  # type: ignore
+        else:
+            new_first = self._header.next  # type: ignore
+            for _ in range(size - k):
+                new_first = new_first.next  # type: ignore
+        new_last = new_first.prev
+        old_first, old_last = self._header.next, self._trailer.prev  # type: ignore[union-attr]
+
+        old_last.next, old_first.prev = old_first, old_last  # type: ignore
+        self._header.next, new_first.prev = new_first, self._header  # type: ignore[assignment, union-attr]
+        self._trailer.prev, new_last.next = new_last, self._trailer  # type: ignore
+
+    def first(self) -> Any:
+        """Get the value from the front of the deque."""
+        if self.is_empty():
+            raise IndexError('Deque is empty.')
+        return self._header.next.val  # type: ignore
+
+    def last(self) -> Any:
+        """Get the value from the back of the deque."""
+        if self.is_empty():
+            raise IndexError('Deque is empty.')
+        return self._trailer.prev.val  # type: ignore
+
+    def insert_front(self, val: Any = None):
+        """Insert value at the front of the deque."""
+        self._sorted_by = None
+        self._insert_between(val=val, left=self._header, right=self._header.next)  # type: ignore
+
+    def insert_back(self, val: Any = None):
+        """Insert value at the back of the deque."""
+        self._sorted_by = None
+        self._insert_between(val=val, left=self._trailer.prev, right=self._trailer)  # type: ignore
+
+    def delete_front(self):
+        """Delete the node at the front of the deque."""
+        if self.is_empty():
+            raise IndexError('Deque is empty.')
+        self._delete_node(node=self._header.next)
+
+    def pop_front(self) -> Any:
+        """Delete and return the value from the front of the deque."""
         value = self.first()
         self.delete_front()
         return value
@@ -476,3 +1698,1009 @@ class LinkedDeque(DoublyLinkedBase):
         value = self.last()
         self.delete_back()
         return value
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Insert all `values` at the back of the deque, in a single pass.
+
+        Raises
+        ------
+        TypeError
+            If `values` is not iterable.
+        """
+        self._link_values(_checked_values(values, 'extend'))
+
+    def extendleft(self, values: Iterable[Any]) -> None:
+        """Insert all `values` at the front of the deque, in a single pass.
+        Like `collections.deque.extendleft`, the values end in reverse order.
+
+        Raises
+        ------
+        TypeError
+            If `values` is not iterable.
+        """
+        new_node = self._new_node
+        end = first = DoubleListNode()
+        count = 0
+        for val in _checked_values(values, 'extendleft'):
+            first.prev = first = new_node(val, first)
+            count += 1
+        if count:
+            last, right = end.prev, self._header.next  # type: ignore[union-attr]
+            self._header.next, first.prev = first, self._header  # type: ignore[assignment, union-attr]
+            last.next, right.prev = right, last  # type: ignore
+            self._size += count
+            self._sorted_by = None
+
+    def pop_many(self, k: int, back: bool = False) -> list[Any]:
+        """Delete up to `k` values from the front (or the back) of the deque
+        and return them in popping order, updating the size once.
+
+        Raises
+        ------
+        ValueError
+            If `k` is not a non-negative integer.
+        """
+        _check_count(k)
+        values = []
+        node = self._trailer.prev if back else self._header.next  # type: ignore[union-attr]
+        for _ in range(min(k, len(self))):
+            values.append(node.val)  # type: ignore
+            popped, node = node, (node.prev if back else node.next)  # type: ignore
+
+            # GC enablement
+            popped.val = popped.prev = popped.next = None  # type: ignore
+            self._release_node(popped)
+        if back:
+            node.next, self._trailer.prev = self._trailer, node  # type: ignore
+        else:
+            node.prev, self._header.next = self._header, node  # type: ignore
+        self._size -= len(values)
+        return values
+
+    def drain(self, back: bool = False) -> Iterator[Any]:
+        """Delete and yield the values from the front (or the back) of the
+        deque until it is empty.
+
+        Values are removed one at a time, as they are consumed, so stopping
+        the iteration early leaves the remaining values in the deque.
+        """
+        while self._size:
+            yield self.pop_back() if back else self.pop_front()
+
+    def splice(self, other: LinkedDeque, front: bool = False) -> None:
+        """Move all the nodes of `other` to the back (or the front) of the
+        deque, in O(1), leaving `other` empty.
+
+        Raises
+        ------
+        TypeError
+            If `other` is not a `LinkedDeque`.
+        ValueError
+            If `other` is the deque itself.
+        """
+        _check_splice(self, other)
+        self._attach_chain(*other._detach_chain(), front)
+
+    def _detach_chain(self) -> tuple[Any, Any, int]:
+        header: Any = self._header
+        chain = (header.next, self._trailer.prev, self._size) if self._size else (None, None, 0)
+        header.next, self._trailer.prev, self._size = self._trailer, header, 0
+        return chain
+
+    def _attach_chain(self, first: Any, last: Any, count: int, front: bool = False) -> None:
+        """Link the `count` nodes from `first` to `last`, whose `next` and
+        `prev` links are set between them, to the back or the front."""
+        if not count:
+            return
+        left = self._header if front else self._trailer.prev
+        right = left.next  # type: ignore
+        left.next, first.prev = first, left  # type: ignore
+        last.next, right.prev = right, last  # type: ignore
+        self._size += count
+        self._sorted_by = None
+
+    def __contains__(self, value: Any) -> bool:
+        """Return `True` if `value` is stored in the deque, in a single pass
+        that stops at the first larger value if the deque is known to be
+        sorted in ascending order."""
+        if self._sorted_by == (None, False):
+            return _sorted_contains(iter(self), value)
+        return any(val is value or val == value for val in self)
+
+    def sort(self, key: Callable[[Any], Any] | None = None, reverse: bool = False) -> None:
+        """Sort the deque in place with a stable bottom-up merge sort that
+        relinks the nodes: O(n log n) comparisons and O(1) extra space.
+
+        The deque is then known to be sorted (see `is_sorted`) until a value
+        is added or the deque is rotated; popping values keeps it sorted.
+        Takes the same parameters as `SinglyLinkedList.sort`.
+        """
+        _sort_structure(self, key, reverse)
+
+    def is_sorted(self, key: Callable[[Any], Any] | None = None, reverse: bool = False) -> bool:
+        """Return `True` if the values are sorted by `key` (in descending order
+        if `reverse`), in O(1) if the deque is known to be sorted that way and
+        in a single pass otherwise."""
+        return _check_sorted(self, iter(self), key, reverse)
+
+
+@dataclass(slots=True, frozen=True, eq=False, repr=False)
+class Position():
+    """Handle on a value of a `PositionalList`, valid until the value is
+    deleted from the list. Positions are equal if they refer to the same
+    value of the same list."""
+
+    _container: PositionalList
+    """List holding the value."""
+    _node: DoubleListNode
+    """Node holding the value."""
+
+    @property
+    def value(self) -> Any:
+        """Value at the position.
+
+        Raises
+        ------
+        ValueError
+            If the value was deleted from the list.
+        """
+        if self._node.next is None:
+            raise ValueError('Position is no longer valid.')
+        return self._node.val
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Position):
+            return NotImplemented
+        return self._node is other._node
+
+    def __hash__(self) -> int:
+        return hash(id(self._node))
+
+    def __repr__(self) -> str:
+        if self._node.next is None:
+            return 'Position(<deleted>)'
+        return f'Position({self._node.val!r})'
+
+
+class PositionalList(DoublyLinkedBase):
+    """List giving a `Position` handle on every value it adds, to insert,
+    replace or delete values next to it in O(1).
+
+    Deleted nodes are unlinked for good, so that their positions can be
+    detected as stale: pools are not supported.
+    """
+
+    # Recycled nodes would make stale positions valid again
+    _pooled: ClassVar[bool] = False
+
+    def __post_init__(self, deep_copy: bool = False) -> None:
+        init_value = self._header
+        self._header = DoubleListNode()
+        super().__post_init__(deep_copy)
+        self._link_values(_init_values(init_value, deep_copy))
+
+    def __str__(self) -> str:
+        if self.is_empty():
+            return 'PositionalList()'
+        return repr(self)
+
+    def _flat_values(self) -> Iterable[Any]:
+        return iter(self)
+
+    def _link_values(self, values: Iterable[Any]) -> int:
+        return self._link_between(values, self._trailer.prev, self._trailer)  # type: ignore
+
+    def _validate(self, position: Position) -> DoubleListNode:
+        """Return the node of `position`.
+
+        Raises
+        ------
+        TypeError
+            If `position` is not a `Position`.
+        ValueError
+            If `position` belongs to another list or its value was deleted.
+        """
+        if not isinstance(position, Position):
+            raise TypeError(f'PositionalList: expected a Position, got {type(position).__name__}.')
+        if position._container is not self:
+            raise ValueError('PositionalList: position belongs to another list.')
+        if position._node.next is None:
+            raise ValueError('PositionalList: position is no longer valid.')
+        return position._node
+
+    def _position(self, node: DoubleListNode) -> Position | None:
+        """Return the position of `node`, or `None` for a sentinel."""
+        if node is self._header or node is self._trailer:
+            return None
+        return Position(self, node)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the values, from first to last."""
+        node = self._header.next  # type: ignore[union-attr]
+        while node is not self._trailer:
+            yield node.val  # type: ignore
+            node = node.next  # type: ignore
+
+    def __reversed__(self) -> Iterator[Any]:
+        """Iterate over the values, from last to first."""
+        node = self._trailer.prev
+        while node is not self._header:
+            yield node.val  # type: ignore
+            node = node.prev  # type: ignore
+
+    def first(self) -> Position | None:
+        """Return the first position, or `None` if the list is empty."""
+        return self._position(self._header.next)  # type: ignore
+
+    def last(self) -> Position | None:
+        """Return the last position, or `None` if the list is empty."""
+        return self._position(self._trailer.prev)  # type: ignore
+
+    def before(self, position: Position) -> Position | None:
+        """Return the position before `position`, or `None` if it is first."""
+        return self._position(self._validate(position).prev)  # type: ignore
+
+    def after(self, position: Position) -> Position | None:
+        """Return the position after `position`, or `None` if it is last."""
+        return self._position(self._validate(position).next)  # type: ignore
+
+    def positions(self, start: Position | None = None, reverse: bool = False) -> Iterator[Position]:
+        """Yield the positions from `start` (by default the first or the last
+        position) to the end of the list, backward if `reverse` is True.
+
+        The list can be edited while iterating: the cursor continues from
+        the position that follows the yielded one at the time it moves, or,
+        if the yielded position was deleted, from the position that followed
+        it or the position that preceded it, whichever is still in the list.
+
+        Raises
+        ------
+        RuntimeError
+            If the yielded position and both its neighbours were deleted.
+        """
+        header, trailer = self._header, self._trailer
+        end = header if reverse else trailer
+
+        def linked(node: Any) -> bool:
+            return node is header or node is trailer or node.next is not None
+
+        node: Any
+        if start is not None:
+            node = self._validate(start)
+        else:
+            node = trailer.prev if reverse else header.next  # type: ignore[union-attr]
+        while node is not end:
+            behind, following = (node.next, node.prev) if reverse else (node.prev, node.next)
+            yield Position(self, node)
+            if linked(node):
+                # Values may have been inserted after it
+                node = node.prev if reverse else node.next
+            elif linked(following):
+                node = following
+            elif linked(behind):
+                node = behind.prev if reverse else behind.next
+            else:
+                raise RuntimeError('PositionalList: lost the cursor, positions around it were deleted.')
+
+    def find(self, value: Any) -> Position | None:
+        """Return the first position holding `value`, or `None`, in O(n)."""
+        for position in self.positions():
+            if position._node.val == value:
+                return position
+        return None
+
+    def add_first(self, value: Any) -> Position:
+        """Insert `value` at the front of the list and return its position."""
+        return Position(self, self._insert_between(value, self._header, self._header.next))  # type: ignore
+
+    def add_last(self, value: Any) -> Position:
+        """Insert `value` at the back of the list and return its position."""
+        return Position(self, self._insert_between(value, self._trailer.prev, self._trailer))  # type: ignore
+
+    def add_before(self, position: Position, value: Any) -> Position:
+        """Insert `value` before `position` and return its position."""
+        node = self._validate(position)
+        return Position(self, self._insert_between(value, node.prev, node))  # type: ignore
+
+    def add_after(self, position: Position, value: Any) -> Position:
+        """Insert `value` after `position` and return its position."""
+        node = self._validate(position)
+        return Position(self, self._insert_between(value, node, node.next))  # type: ignore
+
+    def replace(self, position: Position, value: Any) -> Any:
+        """Replace the value at `position` and return the old value."""
+        node = self._validate(position)
+        old, node.val = node.val, value
+        return old
+
+    def delete(self, position: Position) -> Any:
+        """Delete the value at `position` and return it. The position, and
+        any copy of it, is no longer valid afterwards."""
+        node = self._validate(position)
+        value = node.val
+        self._delete_node(node)
+        return value
+
+
+BLOCK_SIZE = 64
+"""Default number of values stored in a `DequeBlock`."""
+
+
+@dataclass(slots=True)
+class DequeBlock():
+    """Fixed-size block of values, doubly linked to its neighbour blocks."""
+
+    values: list[Any] = field(default_factory=list, init=True)
+    """Value slots of the block."""
+    next: DequeBlock | None = field(default=None, init=True, repr=False)
+    """Next `DequeBlock`."""
+    prev: DequeBlock | None = field(default=None, init=True, repr=False)
+    """Previous `DequeBlock`."""
+
+
+@dataclass
+class BlockDeque(SinglyLinkedBase):
+    """ADT implementation of a Deque storing its values in doubly linked
+    blocks of `block_size` values, like CPython's `collections.deque`.
+
+    Notes
+    -----
+
+    block_1: [_, _, value_1, value_2]  <- _left, _left_idx=2
+    block_2: [value_3, value_4, _, _]  <- _right, _right_idx=1
+    """
+
+    _left: Any = field(default=None, init=True, repr=False)
+    """Front block."""
+    _right: DequeBlock = field(default_factory=DequeBlock, init=False, repr=False)
+    """Back block."""
+    _left_idx: int = field(default=0, init=False, repr=False)
+    """Index of the front value in the front block."""
+    _right_idx: int = field(default=-1, init=False, repr=False)
+    """Index of the back value in the back block."""
+    block_size: int = field(default=BLOCK_SIZE, kw_only=True, repr=False, compare=False)
+    """Number of values stored in a block."""
+
+    _node_type: ClassVar[type[Any]] = DequeBlock
+    # Blocks hold many values and aren't list nodes, a `NodePool` can't recycle them
+    _pooled: ClassVar[bool] = False
+
+    def __post_init__(self, deep_copy: bool = False) -> None:
+        super().__post_init__(deep_copy)
+        if self.block_size < 2:
+            raise ValueError(f'BlockDeque: block_size must be at least 2: {self.block_size=}')
+        init_value = self._left
+        self._left = self._right = self._new_block()
+        self._recenter()
+        self._link_values(_init_values(init_value, deep_copy))
+
+    def __repr__(self) -> str:
+        return f'BlockDeque({list(self)!r})'
+
+    def __str__(self) -> str:
+        if self.is_empty():
+            return 'BlockDeque()'
+        return repr(self)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BlockDeque):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the values of the deque, from front to back."""
+        block, idx = self._left, self._left_idx
+        for _ in range(len(self)):
+            yield block.values[idx]
+            idx += 1
+            if idx == self.block_size:
+                block, idx = block.next, 0
+
+    def __reversed__(self) -> Iterator[Any]:
+        """Iterate over the values of the deque, from back to front."""
+        block, idx = self._right, self._right_idx
+        for _ in range(len(self)):
+            yield block.values[idx]
+            idx -= 1
+            if idx < 0:
+                block, idx = block.prev, self.block_size - 1  # type: ignore
+
+    def __getitem__(self, idx: int | slice) -> Any:
+        """Get the value at index `idx`, walking O(n / block_size) blocks
+        from the nearest end, or a lazy view of the values of a slice.
+        Negative indices count from the back.
+
+        Raises
+        ------
+        IndexError
+            If the `idx` index is out of bounds.
+        """
+        if isinstance(idx, slice):
+            return SliceView(self, range(*idx.indices(len(self))))
+        block, slot = self._locate(idx)
+        return block.values[slot]
+
+    def _iter_range(self, indices: range) -> Iterator[Any]:
+        """Iterate over the values at `indices`: the first one is located
+        from the nearest end, then the walk jumps `step` slots at a time."""
+        if not indices:
+            return
+        block, slot = self._locate(indices[0])
+        step, size = indices.step, self.block_size
+        for remaining in range(len(indices) - 1, -1, -1):
+            yield block.values[slot]
+            if not remaining:
+                return
+            slot += step
+            while slot >= size:
+                block, slot = block.next, slot - size  # type: ignore
+            while slot < 0:
+                block, slot = block.prev, slot + size  # type: ignore
+
+    def windows(self, size: int, step: int | None = None) -> Iterator[list[Any]]:
+        """Yield lists of `size` consecutive values, starting every `step`
+        values (by default `size`, i.e. pages), in a single walk.
+
+        Raises
+        ------
+        ValueError
+            If `size` or `step` is not a positive integer.
+        """
+        return _windows(self, size, step)
+
+    def __setitem__(self, idx: int, value: Any) -> None:
+        """Replace the value at index `idx`."""
+        block, slot = self._locate(idx)
+        block.values[slot] = value
+
+    def _flat_values(self) -> Iterable[Any]:
+        return iter(self)
+
+    def _init_kwargs(self) -> dict[str, Any]:
+        return {**super()._init_kwargs(), 'block_size': self.block_size}
+
+    def _link_values(self, values: Iterable[Any]) -> int:
+        insert_back = self.insert_back
+        size = len(self)
+        for val in values:
+            insert_back(val)
+        return len(self) - size
+
+    def _new_block(self) -> DequeBlock:
+        """Return an empty block of `block_size` values."""
+        return DequeBlock([None] * self.block_size)
+
+    def _recenter(self) -> None:
+        """Reset the empty deque to the middle of its block, so both ends
+        can grow without allocating."""
+        self._left_idx = self.block_size // 2
+        self._right_idx = self._left_idx - 1
+
+    def _locate(self, idx: int) -> tuple[DequeBlock, int]:
+        """Return the block and slot holding the value at index `idx`."""
+        if not type(idx) is int:
+            raise ValueError('BlockDeque: index must be an integer.')
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError('BlockDeque: index out of range.')
+
+        if idx < len(self) // 2:
+            block, pos = self._left, self._left_idx + idx
+            for _ in range(pos // self.block_size):
+                block = block.next
+            return block, pos % self.block_size
+
+        block, pos = self._right, (self.block_size - 1 - self._right_idx) + (len(self) - 1 - idx)
+        for _ in range(pos // self.block_size):
+            block = block.prev  # type: ignore
+        return block, self.block_size - 1 - pos % self.block_size
+
+    def first(self) -> Any:
+        """Get the value from the front of the deque."""
+        if self.is_empty():
+            raise IndexError('Deque is empty.')
+        return self._left.values[self._left_idx]
+
+    def last(self) -> Any:
+        """Get the value from the back of the deque."""
+        if self.is_empty():
+            raise IndexError('Deque is empty.')
+        return self._right.values[self._right_idx]
+
+    def insert_front(self, val: Any = None) -> None:
+        """Insert value at the front of the deque."""
+        if self._left_idx == 0:
+            block = self._new_block()
+            block.next, self._left.prev = self._left, block
+            self._left, self._left_idx = block, self.block_size
+        self._left_idx -= 1
+        self._left.values[self._left_idx] = val
+        self._size += 1
+
+    def insert_back(self, val: Any = None) -> None:
+        """Insert value at the back of the deque."""
+        if self._right_idx == self.block_size - 1:
+            block = self._new_block()
+            block.prev, self._right.next = self._right, block
+            self._right, self._right_idx = block, -1
+        self._right_idx += 1
+        self._right.values[self._right_idx] = val
+        self._size += 1
+
+    def pop_front(self) -> Any:
+        """Delete and return the value from the front of the deque."""
+        if self.is_empty():
+            raise IndexError('Deque is empty.')
+        block = self._left
+        value, block.values[self._left_idx] = block.values[self._left_idx], None
+        self._size -= 1
+        if self.is_empty():
+            self._recenter()
+        elif self._left_idx == self.block_size - 1:
+            self._left, self._left_idx = block.next, 0
+            self._left.prev = block.next = None
+            self._release_node(block)
+        else:
+            self._left_idx += 1
+        return value
+
+    def pop_back(self) -> Any:
+        """Delete and return the value from the back of the deque."""
+        if self.is_empty():
+            raise IndexError('Deque is empty.')
+        block = self._right
+        value, block.values[self._right_idx] = block.values[self._right_idx], None
+        self._size -= 1
+        if self.is_empty():
+            self._recenter()
+        elif self._right_idx == 0:
+            self._right, self._right_idx = block.prev, self.block_size - 1  # type: ignore
+            self._right.next = block.prev = None
+            self._release_node(block)
+        else:
+            self._right_idx -= 1
+        return value
+
+    def delete_front(self) -> None:
+        """Delete the value at the front of the deque."""
+        self.pop_front()
+
+    def delete_back(self) -> None:
+        """Delete the value at the back of the deque."""
+        self.pop_back()
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Insert all `values` at the back of the deque.
+
+        Raises
+        ------
+        TypeError
+            If `values` is not iterable.
+        """
+        self._link_values(_checked_values(values, 'extend'))
+
+    def extendleft(self, values: Iterable[Any]) -> None:
+        """Insert all `values` at the front of the deque, ending in reverse
+        order.
+
+        Raises
+        ------
+        TypeError
+            If `values` is not iterable.
+        """
+        insert_front = self.insert_front
+        for val in _checked_values(values, 'extendleft'):
+            insert_front(val)
+
+    def pop_many(self, k: int, back: bool = False) -> list[Any]:
+        """Delete up to `k` values from the front (or the back) of the deque
+        and return them in popping order.
+
+        Raises
+        ------
+        ValueError
+            If `k` is not a non-negative integer.
+        """
+        _check_count(k)
+        pop = self.pop_back if back else self.pop_front
+        return [pop() for _ in range(min(k, len(self)))]
+
+    def drain(self, back: bool = False) -> Iterator[Any]:
+        """Delete and yield the values from the front (or the back) of the
+        deque until it is empty."""
+        while self._size:
+            yield self.pop_back() if back else self.pop_front()
+
+    def rotate(self, k: int = 1) -> None:
+        """Rotate the deque `k` steps to the right (to the left if `k` is
+        negative), moving O(min(k, n - k)) values between the ends.
+        """
+        size = len(self)
+        if size <= 1:
+            return
+        k %= size
+        if k > size // 2:
+            k -= size
+
+        if k > 0:
+            for _ in range(k):
+                self.insert_front(self.pop_back())
+        else:
+            for _ in range(-k):
+                self.insert_back(self.pop_front())
+
+
+DEQUE_BACKENDS: dict[str, type[Any]] = {'linked': LinkedDeque, 'block': BlockDeque}
+"""Deque implementations selectable by `make_deque`."""
+
+
+def make_deque(init_value: Any = None, backend: str = 'linked', **kwargs: Any) -> LinkedDeque | BlockDeque:
+    """Create a deque with the selected `backend`.
+
+    Parameters
+    ----------
+    init_value : Any, optional
+        Initial value(s) of the deque, by default None.
+    backend : str, optional
+        'linked' for a `LinkedDeque` with one node per value, or 'block' for a
+        `BlockDeque` storing values in fixed-size blocks, by default 'linked'.
+    **kwargs : Any
+        Keyword arguments of the selected deque type (e.g. `pool`, `block_size`).
+
+    Raises
+    ------
+    ValueError
+        If `backend` is not a known deque backend.
+    """
+    try:
+        deque_type = DEQUE_BACKENDS[backend]
+    except KeyError as exc:
+        raise ValueError(f'Unknown deque backend: {backend=}') from exc
+    return deque_type(init_value, **kwargs)  # type: ignore
+
+
+def _chain_nodes(first: Any, count: int) -> Iterator[Any]:
+    """Iterate over `count` linked nodes from `first`, reading every `next`
+    link before the node is yielded, so that it can be relinked."""
+    node = first
+    for _ in range(count):
+        following = node.next
+        yield node
+        node = following
+
+
+def _check_chainable(structures: tuple[SinglyLinkedBase, ...], function: str) -> type[SinglyLinkedBase]:
+    """Return the type of the first structure, after checking that the nodes
+    of all `structures` can be relinked into it."""
+    if not structures:
+        raise ValueError(f'{function}: at least one structure is needed.')
+    kind = type(structures[0])
+    for structure in structures:
+        if not hasattr(structure, '_detach_chain') or structure._node_type is not kind._node_type:
+            raise TypeError(f'{function}: cannot relink the nodes of a {type(structure).__name__} '
+                            f'into a {kind.__name__}.')
+    if len(set(map(id, structures))) != len(structures):
+        raise ValueError(f'{function}: a structure is given more than once.')
+    return kind
+
+
+def concat(*structures: T) -> T:
+    """Return a new structure, of the type and parameters of the first one,
+    holding the nodes of all `structures` in order. The nodes are moved, in
+    O(1) per structure, and the structures are left empty.
+
+    Raises
+    ------
+    TypeError
+        If the structures don't all hold the same type of nodes, or don't
+        support relinking.
+    ValueError
+        If no structure is given, or a structure is given twice.
+    """
+    kind = _check_chainable(structures, 'concat')
+    result = kind(**structures[0]._init_kwargs())
+    for structure in structures:
+        result._attach_chain(*structure._detach_chain())  # type: ignore
+    return result  # type: ignore
+
+
+def merge_sorted(*structures: T, key: Callable[[Any], Any] | None = None) -> T:
+    """Merge sorted structures into a new sorted structure, of the type and
+    parameters of the first one, by relinking their nodes: no node is
+    allocated, and the structures are left empty.
+
+    The merge goes through the k structures with a heap of their next
+    nodes, in O(n log k), and only relinks the nodes once they are all
+    ordered: if a comparison (or `key`) raises, every structure keeps its
+    nodes. Equal values keep the order of the structures.
+    `SinglyLinkedList`, `Queue`, `CircularlyLinkedList` and `LinkedDeque`
+    can be merged, as long as they all hold the same type of nodes.
+
+    Raises
+    ------
+    TypeError
+        If the structures can't be relinked together.
+    ValueError
+        If no structure is given, or a structure is given twice.
+    """
+    kind = _check_chainable(structures, 'merge_sorted')
+    result = kind(**structures[0]._init_kwargs())
+    chains = [structure._detach_chain() for structure in structures]  # type: ignore
+    try:
+        nodes = list(heapq.merge(*(_chain_nodes(first, count) for first, _, count in chains),
+                                 key=(lambda node: node.val) if key is None else (lambda node: key(node.val))))
+    except BaseException:
+        for structure, chain in zip(structures, chains):
+            structure._attach_chain(*chain)  # type: ignore
+        raise
+
+    doubly = kind._node_type is DoubleListNode
+    head = tail = kind._node_type()
+    count = 0
+    for node in nodes:
+        tail.next = node
+        if doubly:
+            node.prev = tail
+        tail = node
+        count += 1
+    result._attach_chain(head.next, tail, count)  # type: ignore
+    return result  # type: ignore
+
+
+SKIP_MAX_LEVEL = 32
+"""Maximum number of levels of an `IndexableSkipList`."""
+
+
+@dataclass(slots=True)
+class SkipNode():
+    """Contains a value and, for each of its levels, a reference to the next
+    `SkipNode` and the number of elements it skips over."""
+
+    val: Any = field(default=None, init=True)
+    """Value stored in `SkipNode`."""
+    next: list[SkipNode | None] = field(default_factory=list, init=True, repr=False)
+    """Next `SkipNode` on every level."""
+    width: list[int] = field(default_factory=list, init=True, repr=False)
+    """Distance to the next `SkipNode` on every level, in elements."""
+
+
+@dataclass
+class IndexableSkipList(SinglyLinkedBase):
+    """Contains a list of SkipNode type elements, with O(log n) expected
+    positional access, insertion and deletion.
+
+    Notes
+    -----
+
+    level_2: head --------------------3--------------------> element_3
+    level_1: head -------1-------> element_1 -------2------> element_3
+    level_0: head -1-> element_1 -1-> element_2 -1-> element_3 -1-> end
+
+    Every link records its width, the number of elements it skips over,
+    so an index is found by walking down the levels.
+    """
+
+    _head: Any = field(default=None, init=True, repr=False)
+    """Head sentinel node, linked on every level."""
+    _levels: int = field(default=1, init=False, repr=False)
+    """Number of levels in use."""
+    seed: int | None = field(default=None, kw_only=True, repr=False, compare=False)
+    """Seed of the random level generator."""
+    _rng: Random = field(default_factory=Random, init=False, repr=False, compare=False)
+    """Random level generator."""
+
+    _node_type: ClassVar[type[Any]] = SkipNode
+    # Skip nodes have a link per level, a `NodePool` can't recycle them
+    _pooled: ClassVar[bool] = False
+
+    def __post_init__(self, deep_copy: bool = False) -> None:
+        super().__post_init__(deep_copy)
+        init_value = self._head
+        self._head = SkipNode(None, [None] * SKIP_MAX_LEVEL, [1] * SKIP_MAX_LEVEL)
+        self._levels = 1
+        self._rng = Random(self.seed)
+        self._link_values(_init_values(init_value, deep_copy))
+
+    def __repr__(self) -> str:
+        return f'IndexableSkipList({list(self.values())!r})'
+
+    def __str__(self) -> str:
+        if self.is_empty():
+            return 'IndexableSkipList()'
+        return repr(self)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IndexableSkipList):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self.values(), other.values()))
+
+    def __getitem__(self, idx: int) -> SkipNode:
+        """Get the element from the IndexableSkipList from the specified
+        `idx` index, in O(log n).
+
+        Parameters
+        ----------
+        idx : int
+            Index of searched element.
+
+        Returns
+        -------
+        SkipNode
+            Element from index `idx`.
+
+        Raises
+        ------
+        IndexError
+            If the `idx` index is out of bounds.
+        ValueError
+            If an illegal `idx` index is given.
+        """
+        self._check_index(idx, len(self) - 1)
+        node, remaining = self._head, idx + 1
+        for level in reversed(range(self._levels)):
+            while node.next[level] is not None and node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.next[level]
+        return node  # type: ignore
+
+    def __iter__(self) -> Iterator[SkipNode]:
+        """Iterate over the nodes of the list in a single pass."""
+        return self.nodes()
+
+    def __contains__(self, value: Any) -> bool:
+        """Return `True` if `value` is stored in the list, in a single pass."""
+        return any(val is value or val == value for val in self.values())
+
+    def nodes(self) -> Iterator[SkipNode]:
+        """Iterate over the nodes of the list, from head to tail."""
+        node = self._head.next[0]
+        while node is not None:
+            yield node
+            node = node.next[0]
+
+    def values(self) -> Iterator[Any]:
+        """Iterate over the values stored in the list, from head to tail."""
+        for node in self.nodes():
+            yield node.val
+
+    @staticmethod
+    def _check_index(idx: int, last: int) -> None:
+        if not type(idx) is int or idx < 0:
+            raise ValueError('IndexableSkipList: index must be positive integer.')
+        if idx > last:
+            raise IndexError('IndexableSkipList: index out of range.')
+
+    def _random_level(self) -> int:
+        """Return a level from a geometric distribution with p=1/2."""
+        bits = self._rng.getrandbits(SKIP_MAX_LEVEL - 1)
+        return (~bits & (bits + 1)).bit_length()
+
+    def _new_node(self, val: Any = None, height: int = 1) -> SkipNode:
+        """Return a node holding `val`, linked on `height` levels."""
+        return SkipNode(val, [None] * height, [1] * height)
+
+    def _predecessors(self, idx: int) -> tuple[list[SkipNode], list[int]]:
+        """Return, for every level in use, the last node before index `idx`
+        and its position (the head being at position 0)."""
+        update: list[SkipNode] = [self._head] * self._levels
+        steps = [0] * self._levels
+        node, position = self._head, 0
+        for level in reversed(range(self._levels)):
+            while node.next[level] is not None and position + node.width[level] <= idx:
+                position += node.width[level]
+                node = node.next[level]
+            update[level], steps[level] = node, position
+        return update, steps
+
+    def _flat_values(self) -> Iterable[Any]:
+        return self.values()
+
+    def _init_kwargs(self) -> dict[str, Any]:
+        return {**super()._init_kwargs(), 'seed': self.seed}
+
+    def _link_values(self, values: Iterable[Any]) -> int:
+        # Append after the last node of every level, keeping track of them
+        last, steps = self._predecessors(len(self))
+        last += [self._head] * (SKIP_MAX_LEVEL - self._levels)
+        steps += [0] * (SKIP_MAX_LEVEL - self._levels)
+        random_level = self._random_level
+        new_node = self._new_node
+        start = position = len(self)
+        try:
+            for val in values:
+                height = random_level()
+                if height > self._levels:
+                    self._levels = height
+                node = new_node(val, height)
+                position += 1
+                for level in range(height):
+                    prev = last[level]
+                    prev.next[level] = node
+                    prev.width[level] = position - steps[level]
+                    last[level], steps[level] = node, position
+        finally:
+            # The last node of every level spans up to the end of the list
+            for level in range(self._levels):
+                last[level].width[level] = position + 1 - steps[level]
+            self._size = position
+        return position - start
+
+    def add(self, value: Any = None, iterate: bool = False) -> None:
+        """Add SkipNode object(s) with a specific `value` to the end of the
+        IndexableSkipList.
+
+        Parameters
+        ----------
+        value : Any, optional.
+            Value to be added, by default None.
+        iterate : bool, optional.
+            Iterate over `value` and add individual nodes, by default False.
+
+        Raises
+        ------
+        TypeError
+            If `iterate` is True and `value` is not iterable.
+        """
+        if not iterate:
+            self.insert(len(self), value)
+        else:
+            self._link_values(_checked_values(value, 'add'))
+
+    def insert(self, idx: int, value: Any = None) -> None:
+        """Insert `value` so that it ends at index `idx`, in O(log n).
+
+        Raises
+        ------
+        IndexError
+            If the `idx` index is greater than the list's size.
+        ValueError
+            If an illegal `idx` index is given.
+        """
+        self._check_index(idx, len(self))
+        height = self._random_level()
+        if height > self._levels:
+            for level in range(self._levels, height):
+                self._head.next[level] = None
+                self._head.width[level] = len(self) + 1
+            self._levels = height
+
+        update, steps = self._predecessors(idx)
+        node = self._new_node(value, height)
+        for level in range(height):
+            prev = update[level]
+            node.next[level] = prev.next[level]
+            node.width[level] = steps[level] + prev.width[level] - idx
+            prev.next[level] = node
+            prev.width[level] = idx + 1 - steps[level]
+        for level in range(height, self._levels):
+            update[level].width[level] += 1
+        self._size += 1
+
+    def delete(self, idx: int) -> Any:
+        """Delete the element at index `idx` and return its value, in
+        O(log n).
+
+        Raises
+        ------
+        IndexError
+            If the `idx` index is out of bounds.
+        ValueError
+            If an illegal `idx` index is given.
+        """
+        self._check_index(idx, len(self) - 1)
+        update, _ = self._predecessors(idx)
+        target = update[0].next[0]
+        for level in range(self._levels):
+            prev = update[level]
+            if prev.next[level] is target:
+                prev.width[level] += target.width[level] - 1  # type: ignore
+                prev.next[level] = target.next[level]  # type: ignore
+            else:
+                prev.width[level] -= 1
+        while self._levels > 1 and self._head.next[self._levels - 1] is None:
+            self._levels -= 1
+        self._size -= 1
+        val = target.val  # type: ignore
+        self._release_node(target)
+        return val
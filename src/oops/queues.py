@@ -0,0 +1,1269 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import mmap
+import multiprocessing
+import os
+import pickle
+import queue
+import re
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from dataclasses import field
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+from typing import Callable
+
+from oops.lists import _checked_values
+from oops.lists import LinkedDeque
+from oops.lists import ListNode
+from oops.lists import Queue
+
+
+def _wakeup_next(waiters: deque[asyncio.Future[None]]) -> None:
+    """Wake up the first waiter that isn't done."""
+    while waiters:
+        waiter = waiters.popleft()
+        if not waiter.done():
+            waiter.set_result(None)
+            break
+
+
+@dataclass(eq=False)
+class AsyncQueue:
+    """asyncio Queue storing its items in a linked `Queue`.
+
+    Producers and consumers await `put` and `get` instead of polling, and
+    producers block while the queue holds `maxsize` items. The non-waiting
+    methods raise `asyncio.QueueEmpty` and `asyncio.QueueFull`, like
+    `asyncio.Queue`.
+    """
+
+    maxsize: int = 0
+    """Maximum number of items in the queue, unbounded if 0."""
+    _queue: Queue = field(default_factory=Queue, init=False, repr=False)
+    """Queued items."""
+    _getters: deque[asyncio.Future[None]] = field(default_factory=deque, init=False, repr=False)
+    """Consumers waiting for an item."""
+    _putters: deque[asyncio.Future[None]] = field(default_factory=deque, init=False, repr=False)
+    """Producers waiting for a free slot."""
+    _unfinished_tasks: int = field(default=0, init=False, repr=False)
+    """Number of items not marked as done by `task_done`."""
+    _finished: asyncio.Event = field(default_factory=asyncio.Event, init=False, repr=False)
+    """Set when all the items were marked as done."""
+
+    def __post_init__(self) -> None:
+        if self.maxsize < 0:
+            raise ValueError(f'AsyncQueue: maxsize must be positive: {self.maxsize=}')
+        self._finished.set()
+
+    def __len__(self) -> int:
+        """Return the number of queued items."""
+        return len(self._queue)
+
+    def qsize(self) -> int:
+        """Return the number of queued items."""
+        return len(self._queue)
+
+    def is_empty(self) -> bool:
+        """Return `True` if the queue is empty."""
+        return self._queue.is_empty()
+
+    empty = is_empty
+
+    def full(self) -> bool:
+        """Return `True` if the queue holds `maxsize` items."""
+        return 0 < self.maxsize <= len(self._queue)
+
+    async def _wait(self, waiters: deque[asyncio.Future[None]], ready: Callable[[], bool],
+                    timeout: float | None = None) -> bool:
+        """Wait until woken up through `waiters`, or until `timeout` seconds
+        passed. Return `False` on timeout.
+
+        If the wait is cancelled after being woken up, the wakeup is passed
+        on to the next waiter, as long as `ready()` is still true.
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            if timeout is None:
+                await waiter
+            else:
+                await asyncio.wait_for(waiter, timeout)
+            return True
+        except BaseException as exc:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            if ready() and not waiter.cancelled():
+                _wakeup_next(waiters)
+            if isinstance(exc, asyncio.TimeoutError):
+                return False
+            raise
+
+    def put_nowait(self, item: Any) -> None:
+        """Add `item` to the end of the queue without waiting.
+
+        Raises
+        ------
+        asyncio.QueueFull
+            If the queue holds `maxsize` items.
+        """
+        if self.full():
+            raise asyncio.QueueFull
+        self._queue.enqueue(item)
+        self._unfinished_tasks += 1
+        self._finished.clear()
+        if self._getters:
+            _wakeup_next(self._getters)
+
+    async def put(self, item: Any) -> None:
+        """Add `item` to the end of the queue, waiting for a free slot while
+        the queue is full."""
+        while self.full():
+            await self._wait(self._putters, lambda: not self.full())
+        self.put_nowait(item)
+
+    def get_nowait(self) -> Any:
+        """Remove and return the item at the front of the queue without
+        waiting.
+
+        Raises
+        ------
+        asyncio.QueueEmpty
+            If the queue is empty.
+        """
+        if self.is_empty():
+            raise asyncio.QueueEmpty
+        item = self._queue.dequeue()
+        if self._putters:
+            _wakeup_next(self._putters)
+        return item
+
+    async def get(self) -> Any:
+        """Remove and return the item at the front of the queue, waiting for
+        an item while the queue is empty."""
+        while self.is_empty():
+            await self._wait(self._getters, lambda: not self.is_empty())
+        return self.get_nowait()
+
+    async def get_many(self, max_items: int, timeout: float | None = None) -> list[Any]:
+        """Remove and return up to `max_items` items from the front of the
+        queue, in a single batch.
+
+        Parameters
+        ----------
+        max_items : int
+            Maximum number of returned items.
+        timeout : float | None, optional
+            Seconds to wait for the first item, by default None (no limit).
+
+        Returns
+        -------
+        list[Any]
+            Between 1 and `max_items` items, or no items if `timeout` passed
+            while the queue was empty.
+
+        Raises
+        ------
+        ValueError
+            If `max_items` is not a positive integer.
+        """
+        if not type(max_items) is int or max_items < 1:
+            raise ValueError(f'AsyncQueue: max_items must be a positive integer: {max_items=}')
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while self.is_empty():
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return []
+            await self._wait(self._getters, lambda: not self.is_empty(), remaining)
+
+        items = self._queue.pop_many(max_items)
+        for _ in range(min(len(items), len(self._putters))):
+            _wakeup_next(self._putters)
+        return items
+
+    def task_done(self) -> None:
+        """Mark an item taken from the queue as processed.
+
+        Raises
+        ------
+        ValueError
+            If called more times than there were items put in the queue.
+        """
+        if self._unfinished_tasks <= 0:
+            raise ValueError('AsyncQueue: task_done() called too many times.')
+        self._unfinished_tasks -= 1
+        if self._unfinished_tasks == 0:
+            self._finished.set()
+
+    async def join(self) -> None:
+        """Wait until every item put in the queue was marked as processed by
+        `task_done`."""
+        if self._unfinished_tasks > 0:
+            await self._finished.wait()
+
+
+@dataclass(eq=False)
+class ConcurrentQueue:
+    """Thread-safe Queue using the two-lock algorithm of Michael and Scott.
+
+    The queue always starts with a dummy node: producers only take the tail
+    lock to link a node after `_tail`, consumers only take the head lock to
+    move `_head` to the next node, so they don't contend with each other.
+    Consumers waiting in `get` are signalled through a condition variable
+    on the head lock.
+
+    Notes
+    -----
+
+    _head -> [dummy] -> [value_1] -> [value_2] <- _tail
+    """
+
+    _head: ListNode = field(default_factory=ListNode, init=False, repr=False)
+    """Dummy node before the front of the queue."""
+    _tail: ListNode = field(init=False, repr=False)
+    """Back of the queue, the dummy node if the queue is empty."""
+    _head_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    """Lock taken by consumers."""
+    _tail_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    """Lock taken by producers."""
+    _not_empty: threading.Condition = field(init=False, repr=False)
+    """Condition on the head lock, notified when a waiting consumer can go on."""
+    _enqueued: int = field(default=0, init=False, repr=False)
+    """Number of enqueued values, updated under the tail lock."""
+    _dequeued: int = field(default=0, init=False, repr=False)
+    """Number of dequeued values, updated under the head lock."""
+    _waiting: int = field(default=0, init=False, repr=False)
+    """Number of consumers waiting for a value."""
+
+    def __post_init__(self) -> None:
+        self._tail = self._head
+        self._not_empty = threading.Condition(self._head_lock)
+
+    def __len__(self) -> int:
+        """Return the queue's size. It can be outdated as soon as it is
+        returned, if other threads use the queue."""
+        return self._enqueued - self._dequeued
+
+    def is_empty(self) -> bool:
+        """Return `True` if the queue is empty."""
+        return self._head.next is None
+
+    def first(self) -> Any:
+        """Get the element at the front of the queue."""
+        with self._head_lock:
+            node = self._head.next
+            if node is None:
+                raise IndexError('Queue is empty.')
+            return node.val
+
+    def last(self) -> Any:
+        """Get the element at the end of the queue."""
+        with self._tail_lock, self._head_lock:
+            if self._tail is self._head:
+                raise IndexError('Queue is empty.')
+            return self._tail.val
+
+    def enqueue(self, value: Any = None) -> None:
+        """Add `value` to the end of the queue."""
+        node = ListNode(value)
+        with self._tail_lock:
+            self._tail.next = node
+            self._tail = node
+            self._enqueued += 1
+        # Consumers register as waiting before checking for a value, so
+        # either they see the node or the producer sees them.
+        if self._waiting:
+            with self._not_empty:
+                self._not_empty.notify()
+
+    put = enqueue
+
+    def extend(self, values: Any) -> None:
+        """Add all `values` to the end of the queue, linked in a single pass
+        and published at once."""
+        head = tail = ListNode()
+        count = 0
+        for val in values:
+            tail.next = tail = ListNode(val)
+            count += 1
+        if not count:
+            return
+        with self._tail_lock:
+            self._tail.next = head.next
+            self._tail = tail
+            self._enqueued += count
+        if self._waiting:
+            with self._not_empty:
+                self._not_empty.notify(count)
+
+    def _pop_locked(self, k: int = 1) -> list[Any]:
+        """Remove up to `k` values from the front, with the head lock held."""
+        values = []
+        head = self._head
+        for _ in range(k):
+            node = head.next
+            if node is None:
+                break
+            values.append(node.val)
+            node.val = None
+            head = node
+        self._head = head
+        self._dequeued += len(values)
+        return values
+
+    def dequeue(self) -> Any:
+        """Remove and return the element at the front of the queue.
+
+        Raises
+        ------
+        IndexError
+            If the queue is empty.
+        """
+        with self._head_lock:
+            values = self._pop_locked()
+        if not values:
+            raise IndexError('Queue is empty.')
+        return values[0]
+
+    def _wait_not_empty(self, timeout: float | None) -> bool:
+        """Wait, with the head lock held, until the queue has a value or
+        `timeout` seconds passed. Return `False` on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self._waiting += 1
+        try:
+            while self._head.next is None:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._not_empty.wait(remaining)
+            return True
+        finally:
+            self._waiting -= 1
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Any:
+        """Remove and return the element at the front of the queue, waiting
+        for a value if `block` is True.
+
+        Parameters
+        ----------
+        block : bool, optional
+            Wait while the queue is empty, by default True.
+        timeout : float | None, optional
+            Seconds to wait, by default None (no limit).
+
+        Raises
+        ------
+        queue.Empty
+            If no value is available in time.
+        """
+        with self._not_empty:
+            if block and not self._wait_not_empty(timeout):
+                raise queue.Empty
+            values = self._pop_locked()
+        if not values:
+            raise queue.Empty
+        return values[0]
+
+    def get_nowait(self) -> Any:
+        """Remove and return the element at the front of the queue without
+        waiting.
+
+        Raises
+        ------
+        queue.Empty
+            If the queue is empty.
+        """
+        return self.get(block=False)
+
+    def get_batch(self, max_items: int, timeout: float | None = None) -> list[Any]:
+        """Remove and return up to `max_items` values from the front of the
+        queue, waiting up to `timeout` seconds for the first one.
+
+        Returns
+        -------
+        list[Any]
+            Between 1 and `max_items` values, or no values on timeout.
+
+        Raises
+        ------
+        ValueError
+            If `max_items` is not a positive integer.
+        """
+        if not type(max_items) is int or max_items < 1:
+            raise ValueError(f'ConcurrentQueue: max_items must be a positive integer: {max_items=}')
+        with self._not_empty:
+            if not self._wait_not_empty(timeout):
+                return []
+            return self._pop_locked(max_items)
+
+
+@dataclass(eq=False)
+class ConcurrentDeque:
+    """Thread-safe `LinkedDeque`, guarded by a single lock.
+
+    The two ends of a short deque touch the same nodes, so unlike
+    `ConcurrentQueue` a single lock protects the links and the size.
+    Consumers waiting in `get` are signalled through a condition variable.
+    """
+
+    _deque: LinkedDeque = field(default_factory=LinkedDeque, init=False, repr=False)
+    """Stored values."""
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    """Lock guarding `_deque`."""
+    _not_empty: threading.Condition = field(init=False, repr=False)
+    """Condition on the lock, notified when a value is inserted."""
+
+    def __post_init__(self) -> None:
+        self._not_empty = threading.Condition(self._lock)
+
+    def __len__(self) -> int:
+        """Return the deque's size."""
+        return len(self._deque)
+
+    def is_empty(self) -> bool:
+        """Return `True` if the deque is empty."""
+        return self._deque.is_empty()
+
+    def first(self) -> Any:
+        """Get the value from the front of the deque."""
+        with self._lock:
+            return self._deque.first()
+
+    def last(self) -> Any:
+        """Get the value from the back of the deque."""
+        with self._lock:
+            return self._deque.last()
+
+    def insert_front(self, val: Any = None) -> None:
+        """Insert value at the front of the deque."""
+        with self._not_empty:
+            self._deque.insert_front(val)
+            self._not_empty.notify()
+
+    def insert_back(self, val: Any = None) -> None:
+        """Insert value at the back of the deque."""
+        with self._not_empty:
+            self._deque.insert_back(val)
+            self._not_empty.notify()
+
+    put = insert_back
+
+    def extend(self, values: Any) -> None:
+        """Insert all `values` at the back of the deque.
+
+        Raises
+        ------
+        TypeError
+            If `values` is not iterable.
+        """
+        values = _checked_values(values, 'extend')
+        with self._not_empty:
+            count = self._deque._link_values(values)
+            self._not_empty.notify(count)
+
+    def pop_front(self) -> Any:
+        """Delete and return the value from the front of the deque."""
+        with self._lock:
+            return self._deque.pop_front()
+
+    def pop_back(self) -> Any:
+        """Delete and return the value from the back of the deque."""
+        with self._lock:
+            return self._deque.pop_back()
+
+    def _wait_not_empty(self, timeout: float | None) -> bool:
+        """Wait, with the lock held, until the deque has a value or `timeout`
+        seconds passed. Return `False` on timeout."""
+        return self._not_empty.wait_for(lambda: not self._deque.is_empty(), timeout)
+
+    def get(self, block: bool = True, timeout: float | None = None, back: bool = False) -> Any:
+        """Delete and return the value from the front (or the back) of the
+        deque, waiting for a value if `block` is True.
+
+        Raises
+        ------
+        queue.Empty
+            If no value is available in time.
+        """
+        with self._not_empty:
+            if block:
+                self._wait_not_empty(timeout)
+            if self._deque.is_empty():
+                raise queue.Empty
+            return self._deque.pop_back() if back else self._deque.pop_front()
+
+    def get_nowait(self, back: bool = False) -> Any:
+        """Delete and return the value from the front (or the back) of the
+        deque without waiting.
+
+        Raises
+        ------
+        queue.Empty
+            If the deque is empty.
+        """
+        return self.get(block=False, back=back)
+
+    def get_batch(self, max_items: int, timeout: float | None = None, back: bool = False) -> list[Any]:
+        """Delete and return up to `max_items` values from the front (or the
+        back) of the deque, waiting up to `timeout` seconds for the first one.
+
+        Returns
+        -------
+        list[Any]
+            Between 1 and `max_items` values, or no values on timeout.
+
+        Raises
+        ------
+        ValueError
+            If `max_items` is not a positive integer.
+        """
+        if not type(max_items) is int or max_items < 1:
+            raise ValueError(f'ConcurrentDeque: max_items must be a positive integer: {max_items=}')
+        with self._not_empty:
+            if not self._wait_not_empty(timeout):
+                return []
+            return self._deque.pop_many(max_items, back=back)
+
+
+@dataclass(eq=False)
+class WorkStealingDeque:
+    """Task deque of a work-stealing scheduler, owned by one worker thread.
+
+    The owner pushes and pops at the back (LIFO, so it runs the newest and
+    cache-warm tasks first), other threads steal from the front (FIFO, so
+    they take the oldest tasks, usually the largest in recursive work).
+    A single lock guards the `LinkedDeque`: the owner takes it uncontended
+    on its fast path, while thieves only try it without blocking and take
+    half of the tasks at once, so they rarely meet the owner twice.
+    """
+
+    _deque: LinkedDeque = field(default_factory=LinkedDeque, init=False, repr=False)
+    """Stored tasks, the newest at the back."""
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    """Lock guarding `_deque`."""
+
+    def __len__(self) -> int:
+        """Return the deque's size. It can be outdated as soon as it is
+        returned, if other threads use the deque."""
+        return len(self._deque)
+
+    def is_empty(self) -> bool:
+        """Return `True` if the deque is empty."""
+        return self._deque.is_empty()
+
+    def push(self, value: Any) -> None:
+        """Add `value` at the back of the deque. Owner side."""
+        with self._lock:
+            self._deque.insert_back(value)
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Add all `values` at the back of the deque, in order. Owner side.
+
+        Raises
+        ------
+        TypeError
+            If `values` is not iterable.
+        """
+        values = _checked_values(values, 'extend')
+        with self._lock:
+            self._deque._link_values(values)
+
+    def pop(self) -> Any:
+        """Delete and return the newest value, from the back of the deque.
+        Owner side.
+
+        Raises
+        ------
+        IndexError
+            If the deque is empty.
+        """
+        with self._lock:
+            return self._deque.pop_back()
+
+    def _steal(self, half: bool, blocking: bool) -> list[Any]:
+        if not len(self._deque) or not self._lock.acquire(blocking):
+            return []
+        try:
+            size = len(self._deque)
+            if not size:
+                return []
+            return self._deque.pop_many((size + 1) // 2 if half else 1)
+        finally:
+            self._lock.release()
+
+    def steal(self, blocking: bool = False) -> Any:
+        """Delete and return the oldest value, from the front of the deque.
+        Thief side.
+
+        Parameters
+        ----------
+        blocking : bool, optional
+            Wait for the lock if another thread holds it, by default False.
+
+        Raises
+        ------
+        queue.Empty
+            If the deque is empty, or if its lock is held and not `blocking`.
+        """
+        values = self._steal(False, blocking)
+        if not values:
+            raise queue.Empty
+        return values[0]
+
+    def steal_half(self, blocking: bool = False) -> list[Any]:
+        """Delete and return the oldest half of the values (rounded up), in
+        order. Thief side.
+
+        Returns
+        -------
+        list[Any]
+            The stolen values, no values if the deque is empty or if its lock
+            is held and not `blocking`.
+        """
+        return self._steal(True, blocking)
+
+
+_SHM_HEADER = struct.Struct('<QQQQ')
+"""Shared queue header: capacity, record size, dequeued and enqueued counts."""
+_SHM_LENGTH = struct.Struct('<I')
+"""Length prefix of a shared queue record."""
+
+
+@dataclass(eq=False)
+class SharedMemoryQueue:
+    """Queue of byte records stored in a ring buffer in shared memory, for
+    producers and consumers in different processes.
+
+    Records are copied into fixed-width slots with a length prefix, so the
+    values are handed between processes without pickling the container.
+    The queue is shared with child processes by passing it as an argument
+    when they are started: only the name of the shared memory block and the
+    locks are pickled.
+
+    Notes
+    -----
+
+    [header][len_1, record_1][len_2, record_2][free]...[free]
+    """
+
+    capacity: int = 1024
+    """Maximum number of records."""
+    record_size: int = 256
+    """Maximum size of a record, in bytes."""
+    name: str | None = field(default=None, repr=False)
+    """Name of the shared memory block, generated if None."""
+    ctx: Any = field(default=None, repr=False)
+    """Multiprocessing context creating the locks, the default one if None."""
+    _shm: SharedMemory = field(init=False, repr=False)
+    """Shared memory block."""
+    _buf: memoryview = field(init=False, repr=False)
+    """Contents of the shared memory block."""
+    _lock: Any = field(init=False, repr=False)
+    """Lock guarding the header."""
+    _not_empty: Any = field(init=False, repr=False)
+    """Condition notified when a record is enqueued."""
+    _not_full: Any = field(init=False, repr=False)
+    """Condition notified when a record is dequeued."""
+
+    def __post_init__(self) -> None:
+        if self.capacity < 1 or self.record_size < 1:
+            raise ValueError(f'SharedMemoryQueue: capacity and record_size must be positive: '
+                             f'{self.capacity=}, {self.record_size=}')
+        self._shm = SharedMemory(name=self.name, create=True, size=self._slot_offset(self.capacity))
+        self._buf = self._shm.buf  # type: ignore
+        self.name = self._shm.name
+        _SHM_HEADER.pack_into(self._buf, 0, self.capacity, self.record_size, 0, 0)
+
+        ctx = multiprocessing.get_context() if self.ctx is None else self.ctx
+        self._lock = ctx.Lock()
+        self._not_empty = ctx.Condition(self._lock)
+        self._not_full = ctx.Condition(self._lock)
+        self.ctx = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {'name': self.name, 'lock': self._lock, 'not_empty': self._not_empty, 'not_full': self._not_full}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._shm = SharedMemory(name=state['name'])
+        self._buf = self._shm.buf  # type: ignore
+        self.name = self._shm.name
+        self.capacity, self.record_size, _, _ = _SHM_HEADER.unpack_from(self._buf, 0)
+        self.ctx = None
+        self._lock, self._not_empty, self._not_full = state['lock'], state['not_empty'], state['not_full']
+
+    def __enter__(self) -> SharedMemoryQueue:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the queue's size."""
+        with self._lock:
+            return self._count()
+
+    def is_empty(self) -> bool:
+        """Return `True` if the queue is empty."""
+        return len(self) == 0
+
+    def full(self) -> bool:
+        """Return `True` if the queue holds `capacity` records."""
+        return len(self) == self.capacity
+
+    def close(self) -> None:
+        """Close this process' access to the shared memory block."""
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Free the shared memory block, once every process closed it."""
+        self._shm.unlink()
+
+    def _slot_offset(self, slot: int) -> int:
+        return _SHM_HEADER.size + slot * (_SHM_LENGTH.size + self.record_size)
+
+    def _counters(self) -> tuple[int, int]:
+        """Return the dequeued and enqueued counts, with the lock held."""
+        _, _, dequeued, enqueued = _SHM_HEADER.unpack_from(self._buf, 0)
+        return dequeued, enqueued
+
+    def _count(self) -> int:
+        dequeued, enqueued = self._counters()
+        return enqueued - dequeued
+
+    def _set_counters(self, dequeued: int, enqueued: int) -> None:
+        _SHM_HEADER.pack_into(self._buf, 0, self.capacity, self.record_size, dequeued, enqueued)
+
+    def _read(self, position: int) -> memoryview:
+        """Return a view of the record at `position`, with the lock held."""
+        offset = self._slot_offset(position % self.capacity)
+        length, = _SHM_LENGTH.unpack_from(self._buf, offset)
+        start = offset + _SHM_LENGTH.size
+        return self._buf[start:start + length]
+
+    def _wait(self, condition: Any, ready: Callable[[], bool], block: bool, timeout: float | None,
+              message: str) -> None:
+        """Wait, with the lock held, until `ready()` if `block` is True.
+
+        Raises
+        ------
+        IndexError
+            With `message`, if `ready()` is still false.
+        """
+        if block:
+            condition.wait_for(ready, timeout)
+        if not ready():
+            raise IndexError(message)
+
+    def first(self) -> bytes:
+        """Get a copy of the record at the front of the queue."""
+        with self._lock:
+            dequeued, enqueued = self._counters()
+            if dequeued == enqueued:
+                raise IndexError('Queue is empty.')
+            return bytes(self._read(dequeued))
+
+    def last(self) -> bytes:
+        """Get a copy of the record at the end of the queue."""
+        with self._lock:
+            dequeued, enqueued = self._counters()
+            if dequeued == enqueued:
+                raise IndexError('Queue is empty.')
+            return bytes(self._read(enqueued - 1))
+
+    def enqueue(self, value: Any, block: bool = False, timeout: float | None = None) -> None:
+        """Copy the bytes-like `value` to the end of the queue.
+
+        Parameters
+        ----------
+        value : Any
+            Bytes-like object, at most `record_size` bytes long.
+        block : bool, optional
+            Wait for a free slot while the queue is full, by default False.
+        timeout : float | None, optional
+            Seconds to wait, by default None (no limit).
+
+        Raises
+        ------
+        IndexError
+            If the queue is full.
+        ValueError
+            If `value` is longer than `record_size` bytes.
+        """
+        data = memoryview(value).cast('B')
+        if data.nbytes > self.record_size:
+            raise ValueError(f'SharedMemoryQueue: record of {data.nbytes} bytes exceeds {self.record_size=}')
+        with self._lock:
+            self._wait(self._not_full, lambda: self._count() < self.capacity, block, timeout, 'Queue is full.')
+            dequeued, enqueued = self._counters()
+            offset = self._slot_offset(enqueued % self.capacity)
+            _SHM_LENGTH.pack_into(self._buf, offset, data.nbytes)
+            start = offset + _SHM_LENGTH.size
+            self._buf[start:start + data.nbytes] = data
+            self._set_counters(dequeued, enqueued + 1)
+            self._not_empty.notify()
+
+    def dequeue(self, block: bool = False, timeout: float | None = None) -> bytes:
+        """Remove and return the record at the front of the queue.
+
+        Parameters
+        ----------
+        block : bool, optional
+            Wait for a record while the queue is empty, by default False.
+        timeout : float | None, optional
+            Seconds to wait, by default None (no limit).
+
+        Raises
+        ------
+        IndexError
+            If the queue is empty.
+        """
+        with self._lock:
+            self._wait(self._not_empty, lambda: self._count() > 0, block, timeout, 'Queue is empty.')
+            dequeued, enqueued = self._counters()
+            value = bytes(self._read(dequeued))
+            self._set_counters(dequeued + 1, enqueued)
+            self._not_full.notify()
+        return value
+
+    def dequeue_many(self, max_items: int, block: bool = False, timeout: float | None = None) -> list[memoryview]:
+        """Remove up to `max_items` records from the front of the queue.
+
+        The records are copied out of the ring buffer into a single buffer,
+        and returned as memoryviews over it.
+
+        Parameters
+        ----------
+        max_items : int
+            Maximum number of returned records.
+        block : bool, optional
+            Wait for a first record while the queue is empty, by default
+            False.
+        timeout : float | None, optional
+            Seconds to wait, by default None (no limit).
+
+        Raises
+        ------
+        IndexError
+            If the queue is empty.
+        ValueError
+            If `max_items` is not a positive integer.
+        """
+        if not type(max_items) is int or max_items < 1:
+            raise ValueError(f'SharedMemoryQueue: max_items must be a positive integer: {max_items=}')
+        with self._lock:
+            self._wait(self._not_empty, lambda: self._count() > 0, block, timeout, 'Queue is empty.')
+            dequeued, enqueued = self._counters()
+            records = [self._read(position) for position in range(dequeued, min(enqueued, dequeued + max_items))]
+            buffer = bytearray(sum(record.nbytes for record in records))
+            bounds = []
+            start = 0
+            for record in records:
+                buffer[start:start + record.nbytes] = record
+                bounds.append((start, start + record.nbytes))
+                start += record.nbytes
+                record.release()
+            self._set_counters(dequeued + len(records), enqueued)
+            self._not_full.notify(len(records))
+        view = memoryview(buffer)
+        return [view[start:end] for start, end in bounds]
+
+
+_SPILL_RECORD = struct.Struct('<BII')
+"""Header of a spilled record: written flag, payload length and CRC32."""
+SPILL_SEGMENT = 'segment-{:010d}.spill'
+"""File name of the spilled segment number `n`."""
+SPILL_CURSOR = 'cursor.json'
+"""File name of the read position of a recoverable `SpillingQueue`."""
+
+
+@dataclass(eq=False)
+class SpillingQueue:
+    """Queue keeping at most `memory_items` values in memory, and spilling
+    the others to append-only memory-mapped segment files in `directory`.
+
+    Values are enqueued to an in-memory tail, which is serialized to the
+    current segment once full, and dequeued from an in-memory head, refilled
+    lazily from the segments. A segment file is deleted once all its values
+    were dequeued.
+
+    With `recover=True`, a queue opened on the directory of a closed queue
+    resumes with its values: `close` spills the values held in memory, and
+    the read position is saved in a cursor file whenever the head is refilled
+    from disk (or on `checkpoint`). After a crash, the values that were only
+    in memory are lost and the spilled values dequeued since the last
+    checkpoint are delivered again.
+
+    Notes
+    -----
+
+    segment: [1, length_1, crc_1, record_1][1, length_2, crc_2, record_2][0...]
+    """
+
+    directory: str | os.PathLike[str]
+    """Directory of the segment files, created if needed."""
+    memory_items: int = 1024
+    """Maximum number of values held in memory, half for the head and half
+    for the tail."""
+    segment_size: int = 1 << 20
+    """Size of a segment file in bytes, larger for a record that doesn't fit."""
+    serializer: Any = field(default=pickle, repr=False)
+    """Object with `dumps(value) -> bytes` and `loads(data) -> value`
+    functions, like `pickle` or `marshal`."""
+    recover: bool = False
+    """Resume from the segments left in `directory` and keep the values on
+    `close`. Otherwise the existing segments are deleted."""
+    sync: bool = False
+    """Flush the segments and the cursor file to the disk, not only to the
+    OS, when a segment is done and on checkpoints."""
+    _head: Queue = field(default_factory=Queue, init=False, repr=False)
+    """Values dequeued first, read from disk or never spilled."""
+    _head_on_disk: bool = field(default=False, init=False, repr=False)
+    """Whether the values of `_head` were read from disk."""
+    _positions: deque[tuple[int, int]] = field(default_factory=deque, init=False, repr=False)
+    """Segment and offset of the values of `_head` read from disk."""
+    _tail: Queue = field(default_factory=Queue, init=False, repr=False)
+    """Values enqueued since the last spill."""
+    _disk_count: int = field(default=0, init=False, repr=False)
+    """Number of spilled values not read back yet."""
+    _last_spilled: Any = field(default=None, init=False, repr=False)
+    """Last spilled value."""
+    _next_segment: int = field(default=0, init=False, repr=False)
+    """Number of the next segment file."""
+    _pending: deque[tuple[int, int]] = field(default_factory=deque, init=False, repr=False)
+    """Segments (and start offsets) with values not read back, not opened yet."""
+    _consumed: list[tuple[int, int]] = field(default_factory=list, init=False, repr=False)
+    """Segments (and start offsets) read back but not deleted, in reading order."""
+    _write_segment: int | None = field(default=None, init=False, repr=False)
+    """Number of the segment being written."""
+    _write_map: mmap.mmap | None = field(default=None, init=False, repr=False)
+    """Mapping of the segment being written."""
+    _write_offset: int = field(default=0, init=False, repr=False)
+    """Offset of the next written record."""
+    _read_segment: int | None = field(default=None, init=False, repr=False)
+    """Number of the segment being read."""
+    _read_map: mmap.mmap | None = field(default=None, init=False, repr=False)
+    """Mapping of the segment being read."""
+    _read_start: int = field(default=0, init=False, repr=False)
+    """Offset of the first value of the segment being read."""
+    _read_offset: int = field(default=0, init=False, repr=False)
+    """Offset of the next read record."""
+
+    def __post_init__(self) -> None:
+        if self.memory_items < 2:
+            raise ValueError(f'SpillingQueue: memory_items must be at least 2: {self.memory_items=}')
+        if self.segment_size < 1:
+            raise ValueError(f'SpillingQueue: segment_size must be positive: {self.segment_size=}')
+        os.makedirs(self.directory, exist_ok=True)
+        if self.recover:
+            self._recover()
+        else:
+            for segment in self._segment_files():
+                os.remove(self._path(segment))
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(self.directory, SPILL_CURSOR))
+
+    def __enter__(self) -> SpillingQueue:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the queue's size."""
+        return len(self._head) + self._disk_count + len(self._tail)
+
+    def is_empty(self) -> bool:
+        """Return `True` if the queue is empty."""
+        return len(self) == 0
+
+    def spilled(self) -> int:
+        """Return the number of values stored on disk only."""
+        return self._disk_count
+
+    def first(self) -> Any:
+        """Get the element at the front of the queue."""
+        if self._head.is_empty():
+            self._refill()
+            if self._head.is_empty():
+                raise IndexError('Queue is empty.')
+        return self._head.first()
+
+    def last(self) -> Any:
+        """Get the element at the end of the queue."""
+        if not self._tail.is_empty():
+            return self._tail.last()
+        if self._disk_count:
+            return self._last_spilled
+        if not self._head.is_empty():
+            return self._head.last()
+        raise IndexError('Queue is empty.')
+
+    def enqueue(self, value: Any = None, iterate: bool = False) -> None:
+        """Add object(s) to the end of the queue, spilling the in-memory tail
+        to disk once it is full.
+
+        Parameters
+        ----------
+        value : Any, optional
+            Value to be added, by default None.
+        iterate : bool, optional
+            Iterate over `value` and add individual values, by default False.
+
+        Raises
+        ------
+        TypeError
+            If `iterate` is True and value is not iterable.
+        Exception
+            Any error of the serializer while spilling, in which case the
+            values that weren't spilled stay in memory.
+        """
+        if iterate:
+            self.extend(value)
+        # The head only takes new values if they come right after it
+        elif (not self._head_on_disk and not self._disk_count and self._tail.is_empty()
+              and len(self._head) < self.memory_items // 2):
+            self._head.enqueue(value)
+        else:
+            self._tail.enqueue(value)
+            if len(self._tail) >= self.memory_items - self.memory_items // 2:
+                self._spill()
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Add all `values` to the end of the queue."""
+        for value in values:
+            self.enqueue(value)
+
+    def dequeue(self) -> Any:
+        """Remove and return the element at the front of the queue, reading
+        the next values back from disk when the in-memory head is empty."""
+        if self._head.is_empty():
+            self._refill()
+            if self._head.is_empty():
+                raise IndexError('Queue is empty.')
+        if self._head_on_disk:
+            self._positions.popleft()
+        return self._head.dequeue()
+
+    def checkpoint(self) -> None:
+        """Save the position of the first spilled value not dequeued to the
+        cursor file, and delete the segments whose values were all dequeued.
+
+        Does nothing unless the queue is recoverable.
+        """
+        if self.recover:
+            self._save_cursor([])
+
+    def close(self) -> None:
+        """Close the segment files. A recoverable queue spills the values held
+        in memory first and saves its cursor, the others delete their files."""
+        if not self.recover:
+            self._close_writer()
+            self._close_reader()
+            for segment in self._segment_files():
+                os.remove(self._path(segment))
+            return
+
+        if not self._tail.is_empty():
+            self._spill()
+        # Values never spilled come before the spilled values: write them to
+        # new segments placed first in the cursor
+        front: list[tuple[int, int]] = []
+        if not self._head_on_disk and not self._head.is_empty():
+            self._close_writer()
+            pending = len(self._pending)
+            for data in [self.serializer.dumps(value) for value in self._head._flat_values()]:
+                self._write_record(data)
+                self._head.dequeue()
+            for _ in range(len(self._pending) - pending):
+                front.append(self._pending.pop())
+            front.reverse()
+        self._close_writer()
+        self._save_cursor(front)
+        self._close_reader()
+        self._pending.clear()
+        self._consumed.clear()
+        self._head, self._tail, self._disk_count = Queue(), Queue(), 0
+        self._head_on_disk = False
+
+    def _path(self, segment: int) -> str:
+        return os.path.join(self.directory, SPILL_SEGMENT.format(segment))
+
+    def _segment_files(self) -> list[int]:
+        """Return the numbers of the segment files in `directory`, sorted."""
+        matches = (re.fullmatch(r'segment-(\d+)\.spill', name) for name in os.listdir(self.directory))
+        return sorted(int(match[1]) for match in matches if match)
+
+    @staticmethod
+    def _record_at(segment_map: mmap.mmap, offset: int) -> bytes | None:
+        """Return the payload of the record at `offset`, or None if no valid
+        record was written there."""
+        start = offset + _SPILL_RECORD.size
+        if start > len(segment_map):
+            return None
+        written, length, crc = _SPILL_RECORD.unpack_from(segment_map, offset)
+        if not written or start + length > len(segment_map):
+            return None
+        data = segment_map[start:start + length]
+        return data if zlib.crc32(data) == crc else None
+
+    def _open_map(self, segment: int) -> mmap.mmap:
+        with open(self._path(segment), 'rb') as file:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _recover(self) -> None:
+        """Find the spilled values from the cursor file and the segments."""
+        files = self._segment_files()
+        self._next_segment = files[-1] + 1 if files else 0
+        try:
+            with open(os.path.join(self.directory, SPILL_CURSOR)) as file:
+                cursor = [(segment, offset) for segment, offset in json.load(file)['segments']]
+        except FileNotFoundError:
+            cursor = []
+        # Segments created after the last checkpoint follow the listed ones
+        last_listed = max((segment for segment, _ in cursor), default=-1)
+        entries = [(segment, offset) for segment, offset in cursor if segment in files]
+        entries += [(segment, 0) for segment in files if segment > last_listed]
+        # Empty files are left by a crash before their first record
+        entries = [(segment, offset) for segment, offset in entries if os.path.getsize(self._path(segment))]
+        kept = {segment for segment, _ in entries}
+        for segment in files:
+            if segment not in kept:
+                os.remove(self._path(segment))
+
+        last = None
+        for segment, offset in entries:
+            with self._open_map(segment) as segment_map:
+                while (data := self._record_at(segment_map, offset)) is not None:
+                    offset += _SPILL_RECORD.size + len(data)
+                    self._disk_count += 1
+                    last = data
+        if last is not None:
+            self._last_spilled = self.serializer.loads(last)
+        self._pending.extend(entries)
+
+    def _write_record(self, data: bytes) -> None:
+        size = _SPILL_RECORD.size + len(data)
+        if self._write_map is None or self._write_offset + size > len(self._write_map):
+            self._close_writer()
+            segment, self._next_segment = self._next_segment, self._next_segment + 1
+            with open(self._path(segment), 'w+b') as file:
+                file.truncate(max(self.segment_size, size))
+                self._write_map = mmap.mmap(file.fileno(), 0)
+            self._write_segment, self._write_offset = segment, 0
+            self._pending.append((segment, 0))
+        # The header is written last, so a torn record is never valid
+        start = self._write_offset + _SPILL_RECORD.size
+        self._write_map[start:start + len(data)] = data
+        _SPILL_RECORD.pack_into(self._write_map, self._write_offset, 1, len(data), zlib.crc32(data))
+        self._write_offset += size
+
+    def _close_writer(self) -> None:
+        if self._write_map is not None:
+            if self.sync:
+                self._write_map.flush()
+            self._write_map.close()
+            self._write_map = self._write_segment = None
+
+    def _close_reader(self) -> None:
+        """Close the segment being read, and delete it unless the queue is
+        recoverable (a checkpoint deletes it once its values are dequeued)."""
+        if self._read_map is None:
+            return
+        self._read_map.close()
+        if self.recover:
+            self._consumed.append((self._read_segment, self._read_start))  # type: ignore
+        else:
+            os.remove(self._path(self._read_segment))  # type: ignore
+        self._read_map = self._read_segment = None
+
+    def _spill(self) -> None:
+        """Serialize the values of the tail to the current segment.
+
+        All the values are serialized before any is written, and each one
+        leaves the tail once written, so that an error of the serializer or
+        of the disk leaves every value in the tail or on disk.
+        """
+        for data in [self.serializer.dumps(value) for value in self._tail._flat_values()]:
+            self._write_record(data)
+            self._last_spilled = self._tail.dequeue()
+            self._disk_count += 1
+
+    def _read_record(self) -> tuple[tuple[int, int], Any]:
+        """Return the position and the value of the next spilled record."""
+        while True:
+            if self._read_map is not None:
+                data = self._record_at(self._read_map, self._read_offset)
+                if data is not None:
+                    position = (self._read_segment, self._read_offset)
+                    self._read_offset += _SPILL_RECORD.size + len(data)
+                    return position, self.serializer.loads(data)  # type: ignore
+                self._close_reader()
+            segment, start = self._pending.popleft()
+            self._read_map = self._open_map(segment)
+            self._read_segment, self._read_start, self._read_offset = segment, start, start
+
+    def _refill(self) -> None:
+        """Fill the empty head with spilled values, or with the tail if
+        nothing is on disk."""
+        self._head_on_disk = False
+        self._positions.clear()
+        if not self._disk_count:
+            self._head, self._tail = self._tail, self._head
+            return
+
+        self.checkpoint()
+        for _ in range(min(self.memory_items // 2, self._disk_count)):
+            position, value = self._read_record()
+            self._positions.append(position)
+            self._head.enqueue(value)
+        self._disk_count -= len(self._positions)
+        self._head_on_disk = True
+        if not self._disk_count:
+            # Start the next spill in a new segment, so this one is deleted
+            self._close_writer()
+            self._close_reader()
+
+    def _save_cursor(self, front: list[tuple[int, int]]) -> None:
+        """Write the cursor file: the `front` segments, then the segments
+        from the first spilled value not dequeued. Delete the others."""
+        segments = list(self._consumed)
+        if self._read_segment is not None:
+            segments.append((self._read_segment, self._read_start))
+        segments += self._pending
+
+        if self._head_on_disk and self._positions:
+            position: tuple[int, int] | None = self._positions[0]
+        elif self._read_segment is not None:
+            position = (self._read_segment, self._read_offset)
+        else:
+            position = None
+        if position is None:
+            done, kept = len(self._consumed), segments[len(self._consumed):]
+        else:
+            done = next(i for i, (segment, _) in enumerate(segments) if segment == position[0])
+            kept = [position] + segments[done + 1:]
+
+        path = os.path.join(self.directory, SPILL_CURSOR)
+        with open(path + '.tmp', 'w') as file:
+            json.dump({'segments': front + kept}, file)
+            if self.sync:
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(path + '.tmp', path)
+
+        for segment, _ in self._consumed[:done]:
+            os.remove(self._path(segment))
+        del self._consumed[:done]
@@ -1,30 +1,626 @@
+from __future__ import annotations
 
-def binary_search(sorted_list: list | tuple, target: int | float) -> bool:
-    """Binary search recursive algorithm implemented for any sorted iterable.
+import mmap
+import os
+import struct
+from collections.abc import Sequence
+from dataclasses import dataclass
+from dataclasses import field
+from itertools import islice
+from typing import Any
+from typing import Callable
+from typing import Iterator
+
+
+def _bounds(sorted_list: Sequence[Any], lo: int, hi: int | None) -> tuple[int, int]:
+    """Return the `lo` and `hi` search bounds, with `hi` defaulting to the
+    length of `sorted_list`.
+
+    Raises
+    ------
+    ValueError
+        If `lo` is negative.
+    """
+    if lo < 0:
+        raise ValueError(f'lo must be a non-negative integer: {lo=}')
+    if hi is None:
+        hi = len(sorted_list)
+    return lo, hi
+
+
+def _sorted_keys(sorted_list: Sequence[Any], lo: int, hi: int, key: Callable[[Any], Any] | None
+                 ) -> Iterator[Any] | None:
+    """Return an iterator over the keys of the elements from `lo` to `hi`
+    if `sorted_list` is a linked structure known to be sorted by `key` in
+    ascending order (see `LinkedDeque.sort`), else None.
+
+    Indexing such a structure walks its nodes, so a single pass stopping at
+    the target beats a binary search. The keys of a `SinglyLinkedList` are
+    those of its values, which is what it is sorted by.
+    """
+    if getattr(sorted_list, '_sorted_by', None) != (key, False):
+        return None
+    values = getattr(sorted_list, 'values', sorted_list.__iter__)()
+    values = islice(values, lo, hi)
+    return values if key is None else map(key, values)
+
+
+def bisect_left(sorted_list: Sequence[Any], target: Any, lo: int = 0, hi: int | None = None,
+                key: Callable[[Any], Any] | None = None) -> int:
+    """Return the leftmost index where `target` can be inserted in
+    `sorted_list` while keeping it sorted.
+
+    Parameters
+    ----------
+    sorted_list : Sequence[Any]
+        Sorted sequence, any object supporting `__len__` and `__getitem__`.
+    target : Any
+        Target searched, compared with `key(element)`.
+    lo : int, optional
+        First index of the searched slice, by default 0.
+    hi : int | None, optional
+        End (exclusive) of the searched slice, by default `len(sorted_list)`.
+    key : Callable[[Any], Any] | None, optional
+        Function applied to the elements (not to `target`), by default None.
+
+    Returns
+    -------
+    int
+        Index `i` such that all elements before `i` are smaller than `target`.
+
+    Raises
+    ------
+    ValueError
+        If `lo` is negative.
+
+    Notes
+    -----
+    Linked structures of `oops.lists` known to be sorted by `key` (see
+    `SinglyLinkedList.sort`) are searched in a single pass over their nodes.
+    """
+    lo, hi = _bounds(sorted_list, lo, hi)
+    keys = _sorted_keys(sorted_list, lo, hi, key)
+    if keys is not None:
+        for value in keys:
+            if not value < target:
+                break
+            lo += 1
+        return lo
+    if key is None:
+        while lo < hi:
+            middle_index = (lo + hi) // 2
+            if sorted_list[middle_index] < target:
+                lo = middle_index + 1
+            else:
+                hi = middle_index
+    else:
+        while lo < hi:
+            middle_index = (lo + hi) // 2
+            if key(sorted_list[middle_index]) < target:
+                lo = middle_index + 1
+            else:
+                hi = middle_index
+    return lo
+
+
+def bisect_right(sorted_list: Sequence[Any], target: Any, lo: int = 0, hi: int | None = None,
+                 key: Callable[[Any], Any] | None = None) -> int:
+    """Return the rightmost index where `target` can be inserted in
+    `sorted_list` while keeping it sorted.
+
+    Takes the same parameters as `bisect_left`.
+
+    Returns
+    -------
+    int
+        Index `i` such that all elements from `i` on are greater than `target`.
+    """
+    lo, hi = _bounds(sorted_list, lo, hi)
+    keys = _sorted_keys(sorted_list, lo, hi, key)
+    if keys is not None:
+        for value in keys:
+            if target < value:
+                break
+            lo += 1
+        return lo
+    if key is None:
+        while lo < hi:
+            middle_index = (lo + hi) // 2
+            if target < sorted_list[middle_index]:
+                hi = middle_index
+            else:
+                lo = middle_index + 1
+    else:
+        while lo < hi:
+            middle_index = (lo + hi) // 2
+            if target < key(sorted_list[middle_index]):
+                hi = middle_index
+            else:
+                lo = middle_index + 1
+    return lo
+
+
+lower_bound = bisect_left
+"""Index of the first element not smaller than the target (`bisect_left`)."""
+upper_bound = bisect_right
+"""Index of the first element greater than the target (`bisect_right`)."""
+
+
+def find_index(sorted_list: Sequence[Any], target: Any, lo: int = 0, hi: int | None = None,
+               key: Callable[[Any], Any] | None = None) -> int:
+    """Return the index of the first element equal to `target`, or -1 if
+    `target` is not in `sorted_list`.
+
+    Takes the same parameters as `bisect_left`.
+    """
+    lo, hi = _bounds(sorted_list, lo, hi)
+    keys = _sorted_keys(sorted_list, lo, hi, key)
+    if keys is not None:
+        for idx, value in enumerate(keys, lo):
+            if not value < target:
+                return idx if value == target else -1
+        return -1
+    idx = bisect_left(sorted_list, target, lo, hi, key)
+    if idx < hi:
+        value = sorted_list[idx] if key is None else key(sorted_list[idx])
+        if value == target:
+            return idx
+    return -1
+
+
+def count_range(sorted_list: Sequence[Any], lower: Any, upper: Any, lo: int = 0, hi: int | None = None,
+                key: Callable[[Any], Any] | None = None) -> int:
+    """Return the number of elements `x` of `sorted_list` such that
+    `lower <= x <= upper`, with two searches.
+
+    Takes the same `lo`, `hi` and `key` parameters as `bisect_left`.
+    """
+    lo, hi = _bounds(sorted_list, lo, hi)
+    start = bisect_left(sorted_list, lower, lo, hi, key)
+    return max(0, bisect_right(sorted_list, upper, start, hi, key) - start)
+
+
+def binary_search(sorted_list: Sequence[Any], target: Any, lo: int = 0, hi: int | None = None,
+                  key: Callable[[Any], Any] | None = None) -> bool:
+    """Binary search algorithm implemented for any sorted sequence.
 
     Parameters
     ----------
-    sorted_list : list | tuple
-        Sorted iterable.
-    target : int | float
+    sorted_list : Sequence[Any]
+        Sorted sequence, any object supporting `__len__` and `__getitem__`.
+    target : Any
         Target searched.
+    lo : int, optional
+        First index of the searched slice, by default 0.
+    hi : int | None, optional
+        End (exclusive) of the searched slice, by default `len(sorted_list)`.
+    key : Callable[[Any], Any] | None, optional
+        Function applied to the elements (not to `target`), by default None.
 
     Returns
     -------
     bool
         True if `target` in `sorted_list`.
     """
-    left = 0
-    right = len(sorted_list) - 1
+    return find_index(sorted_list, target, lo, hi, key) != -1
+
 
-    while left <= right:
+INTERPOLATION_MIN_SIZE = 256
+"""Smallest searched slice for which `search` considers interpolation."""
+UNIFORMITY_TOLERANCE = 0.1
+"""Largest deviation of the sampled keys from a straight line, as a share of
+the key range, for which `search` considers the keys uniform."""
 
-        middle_index = (right + left) // 2
 
-        if target == sorted_list[middle_index]:
-            return True
-        elif target < sorted_list[middle_index]:
-            right = middle_index - 1
+def _gallop(before: Callable[[int], bool], hint: int, lo: int, hi: int) -> int:
+    """Return the first index of `[lo, hi]` for which the monotonic `before`
+    predicate is False, probing at exponentially growing distances from
+    `hint` before bisecting: O(log d) probes for a result at distance d."""
+    if lo >= hi:
+        return lo
+    hint = min(max(hint, lo), hi - 1)
+    if before(hint):
+        # The result is in (hint, hi]
+        last, offset = hint, 1
+        while hint + offset < hi and before(hint + offset):
+            last = hint + offset
+            offset = 2 * offset + 1
+        left, right = last + 1, min(hint + offset, hi)
+    else:
+        # The result is in [lo, hint]
+        first, offset = hint, 1
+        while hint - offset >= lo and not before(hint - offset):
+            first = hint - offset
+            offset = 2 * offset + 1
+        left, right = max(hint - offset + 1, lo), first
+    while left < right:
+        middle_index = (left + right) // 2
+        if before(middle_index):
+            left = middle_index + 1
         else:
+            right = middle_index
+    return left
+
+
+def gallop_left(sorted_list: Sequence[Any], target: Any, hint: int = 0, lo: int = 0, hi: int | None = None,
+                key: Callable[[Any], Any] | None = None) -> int:
+    """Return the same index as `bisect_left`, galloping from the `hint`
+    index: the search takes O(log d) probes when the result is at distance d
+    from `hint`, e.g. for lookups near a previously found position.
+
+    Takes the same parameters as `bisect_left`. `hint` is clamped to the
+    searched slice.
+    """
+    lo, hi = _bounds(sorted_list, lo, hi)
+    if key is None:
+        return _gallop(lambda i: sorted_list[i] < target, hint, lo, hi)
+    return _gallop(lambda i: key(sorted_list[i]) < target, hint, lo, hi)
+
+
+def gallop_right(sorted_list: Sequence[Any], target: Any, hint: int = 0, lo: int = 0, hi: int | None = None,
+                 key: Callable[[Any], Any] | None = None) -> int:
+    """Return the same index as `bisect_right`, galloping from the `hint`
+    index. See `gallop_left`.
+    """
+    lo, hi = _bounds(sorted_list, lo, hi)
+    if key is None:
+        return _gallop(lambda i: not target < sorted_list[i], hint, lo, hi)
+    return _gallop(lambda i: not target < key(sorted_list[i]), hint, lo, hi)
+
+
+def exponential_search(source: Any, target: Any, key: Callable[[Any], Any] | None = None) -> int:
+    """Return the leftmost index where `target` can be inserted in the sorted
+    `source`, without knowing its length.
+
+    `source` only needs `__getitem__` with non-negative indices, raising
+    `IndexError` past its end, e.g. a lazily computed sequence; it may be
+    unbounded. Indices 1, 3, 7, ... are probed until an element is not
+    smaller than `target`, then the last range is bisected: O(log i) probes
+    for a result at index i.
+    """
+    def before(idx: int) -> bool:
+        try:
+            value = source[idx]
+        except IndexError:
+            return False
+        return (value if key is None else key(value)) < target
+
+    bound = 1
+    while before(bound - 1):
+        bound *= 2
+    left, right = bound // 2, bound - 1
+    while left < right:
+        middle_index = (left + right) // 2
+        if before(middle_index):
             left = middle_index + 1
-    return False
+        else:
+            right = middle_index
+    return left
+
+
+def interpolation_search(sorted_list: Sequence[Any], target: Any, lo: int = 0, hi: int | None = None,
+                         key: Callable[[Any], Any] | None = None) -> int:
+    """Return the same index as `bisect_left`, probing where `target` would
+    be if the numeric keys were evenly spread: O(log log n) probes for
+    uniform keys. A probe that doesn't halve the searched range is followed
+    by a bisection step, so skewed keys take at most about twice the probes
+    of `bisect_left`.
+
+    Takes the same parameters as `bisect_left`. Keys and `target` must
+    support subtraction and division, like numbers.
+    """
+    lo, hi = _bounds(sorted_list, lo, hi)
+    if lo >= hi:
+        return lo
+    if key is None:
+        def value(idx: int) -> Any:
+            return sorted_list[idx]
+    else:
+        def value(idx: int) -> Any:
+            return key(sorted_list[idx])
+
+    left_value, right_value = value(lo), value(hi - 1)
+    if not left_value < target:
+        return lo
+    if right_value < target:
+        return hi
+
+    # value(left) < target <= value(right), the result is in (left, right]
+    left, right = lo, hi - 1
+    bisect_next = False
+    while right - left > 1:
+        size = right - left
+        if bisect_next:
+            probe = (left + right) // 2
+        else:
+            share = (target - left_value) / (right_value - left_value)
+            probe = min(max(left + int(share * size), left + 1), right - 1)
+        probe_value = value(probe)
+        if probe_value < target:
+            left, left_value = probe, probe_value
+        else:
+            right, right_value = probe, probe_value
+        bisect_next = not bisect_next and 2 * (right - left) > size
+    return right
+
+
+def choose_strategy(sorted_list: Sequence[Any], lo: int = 0, hi: int | None = None,
+                    key: Callable[[Any], Any] | None = None) -> str:
+    """Return 'interpolation' if the keys of the searched slice look evenly
+    spread numbers, else 'bisect', from five sampled keys.
+
+    Takes the same `lo`, `hi` and `key` parameters as `bisect_left`.
+    """
+    lo, hi = _bounds(sorted_list, lo, hi)
+    if hi - lo < INTERPOLATION_MIN_SIZE:
+        return 'bisect'
+    samples = [sorted_list[lo + (hi - 1 - lo) * quarter // 4] for quarter in range(5)]
+    if key is not None:
+        samples = [key(sample) for sample in samples]
+    if not all(isinstance(sample, (int, float)) and not isinstance(sample, bool) for sample in samples):
+        return 'bisect'
+    first, last = samples[0], samples[-1]
+    spread = last - first
+    if not spread > 0:
+        return 'bisect'
+    for quarter in (1, 2, 3):
+        if abs(samples[quarter] - (first + spread * quarter / 4)) > UNIFORMITY_TOLERANCE * spread:
+            return 'bisect'
+    return 'interpolation'
+
+
+SEARCH_STRATEGIES: dict[str, Callable[..., int]] = {
+    'bisect': bisect_left,
+    'interpolation': interpolation_search,
+}
+"""Searches `search` can use, by strategy name."""
+
+
+def search(sorted_list: Sequence[Any], target: Any, lo: int = 0, hi: int | None = None,
+           key: Callable[[Any], Any] | None = None, hint: int | None = None, strategy: str | None = None) -> int:
+    """Return the same index as `bisect_left`, with the search strategy that
+    suits the data best:
+
+    - galloping from `hint`, when a position near the result is known;
+    - the given `strategy` ('bisect' or 'interpolation'), e.g. chosen once
+      with `choose_strategy` for many searches in the same data;
+    - else the strategy that `choose_strategy` picks from sampled keys.
+
+    Takes the same `lo`, `hi` and `key` parameters as `bisect_left`.
+
+    Raises
+    ------
+    ValueError
+        If `lo` is negative or `strategy` is unknown.
+    """
+    if hint is not None:
+        return gallop_left(sorted_list, target, hint, lo, hi, key)
+    if strategy is None:
+        strategy = choose_strategy(sorted_list, lo, hi, key)
+    elif strategy not in SEARCH_STRATEGIES:
+        raise ValueError(f'Unknown search strategy: {strategy=}, expected one of {tuple(SEARCH_STRATEGIES)}')
+    return SEARCH_STRATEGIES[strategy](sorted_list, target, lo, hi, key)
+
+
+RECORD_CACHE_SIZE = 4096
+"""Default number of sampled keys a `RecordView` keeps in memory."""
+
+_MISSING = object()
+
+
+@dataclass(eq=False)
+class RecordView(Sequence[Any]):
+    """Read-only sequence of the keys of fixed-width records stored in a
+    buffer, e.g. an `mmap` of a sorted file, a `memoryview` or `bytes`.
+
+    A key is decoded from the record only when it is probed, so searches
+    only touch the pages their probes land on, and the buffer is never
+    copied. The view supports `len` and indexing, so every search of this
+    module works on it; its own `bisect_left`, `bisect_right` and
+    `find_index` first search a bounded cache of keys sampled at regular
+    intervals, which holds the top levels of every search and is filled by
+    the probes of the first lookups.
+
+    Parameters
+    ----------
+    buffer : Any
+        Buffer holding the records after `offset` bytes, sorted by key.
+    record_size : int
+        Width of a record, in bytes.
+    key_offset : int, optional
+        Position of the key in a record, by default 0.
+    key_size : int | None, optional
+        Width of the key, by default the rest of the record, or the size
+        of the `decoder` format.
+    decoder : Callable[[memoryview], Any] | str | None, optional
+        Function decoding the key bytes, or a `struct` format of the key,
+        e.g. '>Q', by default None (the key bytes, compared as `bytes`).
+    offset : int, optional
+        Position of the first record in `buffer`, e.g. after a header, by
+        default 0.
+    cache_size : int, optional
+        Largest number of sampled keys kept in memory, 0 to disable the
+        cache, by default `RECORD_CACHE_SIZE`.
+
+    Raises
+    ------
+    ValueError
+        If the sizes and offsets don't fit the records in the buffer.
+    """
+
+    buffer: Any
+    record_size: int
+    key_offset: int = 0
+    key_size: int | None = None
+    decoder: Callable[[memoryview], Any] | str | None = None
+    offset: int = 0
+    cache_size: int = RECORD_CACHE_SIZE
+    _view: memoryview = field(init=False, repr=False)
+    """Bytes of the records."""
+    _unpack: Callable[[Any, int], tuple[Any, ...]] | None = field(default=None, init=False, repr=False)
+    """`unpack_from` of the `decoder` format."""
+    _decode: Callable[[memoryview], Any] = field(default=bytes, init=False, repr=False)
+    """Decoder of the key bytes, when there is no format."""
+    _size: int = field(default=0, init=False, repr=False)
+    """Number of records."""
+    _stride: int = field(default=1, init=False, repr=False)
+    """Number of records between two sampled keys."""
+    _samples: list[Any] = field(default_factory=list, init=False, repr=False)
+    """Keys of the records `0, stride, 2 * stride, ...`, decoded on demand."""
+
+    def __post_init__(self) -> None:
+        if isinstance(self.decoder, str):
+            layout = struct.Struct(self.decoder)
+            self._unpack = layout.unpack_from
+            if self.key_size is None:
+                self.key_size = layout.size
+            elif self.key_size != layout.size:
+                raise ValueError(f'RecordView: key_size differs from the decoder size: {self.key_size=}')
+        else:
+            if self.decoder is not None:
+                self._decode = self.decoder
+            if self.key_size is None:
+                self.key_size = self.record_size - self.key_offset
+        if self.record_size < 1 or self.key_offset < 0 or self.key_size < 1 or self.offset < 0:
+            raise ValueError(f'RecordView: invalid record layout: {self.record_size=}, {self.key_offset=}, '
+                             f'{self.key_size=}, {self.offset=}')
+        if self.key_offset + self.key_size > self.record_size:
+            raise ValueError(f'RecordView: the key ends after the record: {self.key_offset=}, {self.key_size=}')
+        if self.cache_size < 0:
+            raise ValueError(f'RecordView: cache_size must not be negative: {self.cache_size=}')
+        view = memoryview(self.buffer).cast('B')
+        if self.offset > len(view) or (len(view) - self.offset) % self.record_size:
+            view.release()
+            raise ValueError(f'RecordView: the buffer is not a whole number of records: {self.record_size=}')
+        self._view = view[self.offset:]
+        view.release()
+        self._size = len(self._view) // self.record_size
+        if self.cache_size and self._size:
+            self._stride = -(-self._size // self.cache_size)
+            self._samples = [_MISSING] * -(-self._size // self._stride)
+
+    @classmethod
+    def from_file(cls, path: str | os.PathLike[str], record_size: int, **kwargs: Any) -> RecordView:
+        """Return a view of the records of the file at `path`, mapped
+        read-only in memory. Pages are read when probed, without read-ahead
+        where the platform allows it. Close the view (or use it as a context
+        manager) to unmap the file.
+
+        Takes the same keyword arguments as `RecordView`.
+        """
+        with open(path, 'rb') as file:
+            if not os.fstat(file.fileno()).st_size:
+                return cls(b'', record_size, **kwargs)
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if hasattr(mapping, 'madvise') and hasattr(mmap, 'MADV_RANDOM'):
+            mapping.madvise(mmap.MADV_RANDOM)
+        try:
+            return cls(mapping, record_size, **kwargs)
+        except BaseException:
+            mapping.close()
+            raise
+
+    def close(self) -> None:
+        """Release the buffer, and close it if it is an `mmap`. An `mmap`
+        can't be closed while a record (or a key made of its bytes by the
+        `decoder`) is still held: the view is then left usable.
+
+        Raises
+        ------
+        BufferError
+            If the buffer is an `mmap` and memoryviews returned by `record`
+            or by the `decoder` aren't released yet.
+        """
+        self._view.release()
+        if isinstance(self.buffer, mmap.mmap) and not self.buffer.closed:
+            try:
+                self.buffer.close()
+            except BufferError:
+                view = memoryview(self.buffer).cast('B')
+                self._view = view[self.offset:]
+                view.release()
+                raise BufferError('RecordView: release the records and keys taken from the view before closing it.'
+                                  ) from None
+
+    def __enter__(self) -> RecordView:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, idx: int) -> Any:  # type: ignore[override]
+        """Return the decoded key of the record at `idx`."""
+        if not type(idx) is int:
+            raise ValueError('RecordView: index must be an integer.')
+        if idx < 0:
+            idx += self._size
+        if not 0 <= idx < self._size:
+            raise IndexError('RecordView: index out of range.')
+        start = idx * self.record_size + self.key_offset
+        if self._unpack is not None:
+            return self._unpack(self._view, start)[0]
+        return self._decode(self._view[start:start + self.key_size])  # type: ignore[operator]
+
+    def __contains__(self, target: object) -> bool:
+        return self.find_index(target) != -1
+
+    def record(self, idx: int) -> memoryview:
+        """Return the bytes of the record at `idx`, without copying them.
+
+        If the buffer is an `mmap`, the memoryview must be released (or
+        dropped) before `close`; copy it with `bytes` to keep it longer.
+        """
+        if not type(idx) is int:
+            raise ValueError('RecordView: index must be an integer.')
+        if idx < 0:
+            idx += self._size
+        if not 0 <= idx < self._size:
+            raise IndexError('RecordView: index out of range.')
+        start = idx * self.record_size
+        return self._view[start:start + self.record_size]
+
+    def _sample(self, pos: int) -> Any:
+        key = self._samples[pos]
+        if key is _MISSING:
+            key = self._samples[pos] = self[pos * self._stride]
+        return key
+
+    def _narrow(self, before: Callable[[Any], bool]) -> tuple[int, int]:
+        """Return the range of records holding the first record whose key
+        isn't `before` the target, bisecting the sampled keys."""
+        if not self._samples:
+            return 0, self._size
+        left, right = 0, len(self._samples)
+        while left < right:
+            middle_index = (left + right) // 2
+            if before(self._sample(middle_index)):
+                left = middle_index + 1
+            else:
+                right = middle_index
+        # Sampled key `left - 1` is before the target, sampled key `left` isn't
+        return (left - 1) * self._stride + 1 if left else 0, min(left * self._stride, self._size)
+
+    def bisect_left(self, target: Any) -> int:
+        """Return the index of the first record whose key is not smaller
+        than `target`, like `bisect_left` with the sampled keys cached."""
+        lo, hi = self._narrow(lambda key: key < target)
+        return bisect_left(self, target, lo, hi)
+
+    def bisect_right(self, target: Any) -> int:
+        """Return the index of the first record whose key is greater than
+        `target`, like `bisect_right` with the sampled keys cached."""
+        lo, hi = self._narrow(lambda key: not target < key)
+        return bisect_right(self, target, lo, hi)
+
+    def find_index(self, target: Any) -> int:
+        """Return the index of the first record whose key is `target`, or
+        -1, like `find_index` with the sampled keys cached."""
+        idx = self.bisect_left(target)
+        return idx if idx < self._size and self[idx] == target else -1
+
+    def cached_keys(self) -> int:
+        """Return the number of sampled keys decoded so far."""
+        return sum(key is not _MISSING for key in self._samples)
@@ -0,0 +1,466 @@
+from __future__ import annotations
+
+from array import array
+from array import typecodes
+from collections.abc import Iterable
+from dataclasses import dataclass
+from dataclasses import field
+from itertools import islice
+from typing import Any
+from typing import ClassVar
+from typing import Iterator
+
+from oops.lists import _check_count
+from oops.lists import SinglyLinkedBase
+
+
+_ITEM_KINDS = {**dict.fromkeys('bhilq', 'signed'), **dict.fromkeys('BHILQ', 'unsigned'), 'f': 'float', 'd': 'float'}
+"""Kind of the numbers of every `struct` format letter supported by `array`."""
+
+
+def _same_items(view: memoryview, typecode: str) -> bool:
+    """Return `True` if the items of `view` have the same kind and size as
+    the `typecode` items, so that its bytes can be copied as they are."""
+    item = view.format.lstrip('@=')
+    return (len(item) == 1 and _ITEM_KINDS.get(item) is not None and _ITEM_KINDS.get(item) == _ITEM_KINDS.get(typecode)
+            and view.itemsize == array(typecode).itemsize)
+
+
+@dataclass
+class TypedArrayBase(SinglyLinkedBase):
+    """Base of the structures storing numbers in a contiguous `array` of a
+    fixed `typecode`, instead of one node and one boxed value each.
+
+    The values are exported without copy through the buffer protocol, see
+    `view`. A structure that needs to grow its array while a view is
+    exported moves to a new array, and the view keeps the old values.
+
+    Notes
+    -----
+
+    _data: [_, _, value_1, value_2, value_3, _]
+                  ^ _start
+    """
+
+    typecode: str = field(init=True)
+    """`array` typecode of the values, e.g. 'q' for 64-bit ints or 'd' for
+    doubles."""
+    _data: Any = field(default=None, init=True, repr=False)
+    """Contiguous storage of the values."""
+    _start: int = field(default=0, init=False, repr=False)
+    """Index of the first value in `_data`."""
+
+    # Values are stored in an array, not in nodes
+    _pooled: ClassVar[bool] = False
+
+    def __post_init__(self, deep_copy: bool = False) -> None:
+        super().__post_init__(deep_copy)
+        if self.typecode not in typecodes:
+            raise ValueError(f'{type(self).__name__}: unknown typecode: {self.typecode=}')
+        init_value = self._data
+        self._data = array(self.typecode)
+        self._start = 0
+        # Values are copied to the array, deep copies aren't needed
+        if isinstance(init_value, (int, float)):
+            self._push_back(init_value)
+        elif init_value is not None:
+            self._link_values(init_value)
+
+    def __repr__(self) -> str:
+        if self.is_empty():
+            return f'{type(self).__name__}({self.typecode!r})'
+        return f'{type(self).__name__}({self.typecode!r}, {self._live().tolist()!r})'
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        return self._live() == other._live()
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the values, in storage order."""
+        return islice(self._data, self._start, self._start + self._size)
+
+    def __getitem__(self, idx: int) -> Any:
+        """Get the value at index `idx` in storage order, in O(1). Negative
+        indices count from the end.
+
+        Raises
+        ------
+        IndexError
+            If the `idx` index is out of bounds.
+        ValueError
+            If an illegal `idx` index is given.
+        """
+        return self._data[self._slot(idx)]
+
+    def __setitem__(self, idx: int, value: Any) -> None:
+        """Replace the value at index `idx`."""
+        self._data[self._slot(idx)] = value
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # The values are pickled as an array, i.e. as their raw bytes
+        return type(self), (self.typecode, self._live())
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> TypedArrayBase:
+        # Numbers don't need deep copies
+        copied = self.__copy__()
+        memo[id(self)] = copied
+        return copied
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Export the values through the buffer protocol (Python 3.12+)."""
+        return self.view()
+
+    def __release_buffer__(self, view: memoryview) -> None:
+        view.release()
+
+    @property
+    def itemsize(self) -> int:
+        """Size of a value in bytes."""
+        return self._data.itemsize
+
+    def view(self) -> memoryview:
+        """Return a memoryview of the values, in storage order, without copy.
+
+        It can be given to `numpy.asarray` or `numpy.frombuffer`. It shows
+        later changes to the values until the structure moves to a new array.
+        """
+        return memoryview(self._data)[self._start:self._start + self._size]
+
+    def tobytes(self) -> bytes:
+        """Return the values as machine values, like `array.tobytes`."""
+        return self._live().tobytes()
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self._data = array(self.typecode)
+        self._start = self._size = 0
+
+    def _slot(self, idx: int) -> int:
+        if not type(idx) is int:
+            raise ValueError(f'{type(self).__name__}: index must be an integer.')
+        if idx < 0:
+            idx += self._size
+        if not 0 <= idx < self._size:
+            raise IndexError(f'{type(self).__name__}: index out of range.')
+        return self._start + idx
+
+    def _live(self) -> array[Any]:
+        """Return a copy of the values as an array."""
+        return self._data[self._start:self._start + self._size]
+
+    def _load(self, values: Any) -> array[Any]:
+        """Return `values` as an array of the typecode. Bytes are loaded as
+        raw machine values (like `array.frombytes`), other buffers of the same
+        item type are copied at once, and other iterables value by value.
+
+        Raises
+        ------
+        TypeError
+            If `values` is not iterable or holds values of the wrong type.
+        """
+        if isinstance(values, array) and values.typecode == self.typecode:
+            return values
+        loaded = array(self.typecode)
+        if isinstance(values, (bytes, bytearray)):
+            loaded.frombytes(values)
+            return loaded
+        try:
+            view = memoryview(values)
+        except TypeError:
+            if not isinstance(values, Iterable):
+                raise TypeError(f'Object given to {type(self).__name__} is not iterable: {values!r}')
+            loaded.extend(values)
+            return loaded
+        with view:
+            if view.c_contiguous and view.ndim <= 1 and _same_items(view, self.typecode):
+                loaded.frombytes(view.cast('B'))
+            else:
+                loaded.extend(view.tolist())
+        return loaded
+
+    def _flat_values(self) -> array[Any]:
+        return self._live()
+
+    def _init_kwargs(self) -> dict[str, Any]:
+        return {'typecode': self.typecode}
+
+    def _link_values(self, values: Iterable[Any]) -> int:
+        loaded = self._load(values)
+        end = self._start + self._size
+        try:
+            if end < len(self._data):
+                del self._data[end:]
+            self._data.extend(loaded)
+        except BufferError:
+            self._reallocate()
+            self._data.extend(loaded)
+        self._size += len(loaded)
+        return len(loaded)
+
+    def _reallocate(self, front: int = 0) -> None:
+        """Move the values to a new array, after `front` free slots."""
+        self._data = array(self.typecode, bytes(front * self.itemsize)) + self._live()
+        self._start = front
+
+    def _shrink(self) -> None:
+        """Drop the free slots once they take most of the array."""
+        if len(self._data) > 64 and self._size < len(self._data) // 4:
+            self._reallocate()
+
+    def _push_back(self, value: Any) -> None:
+        end = self._start + self._size
+        if end < len(self._data):
+            self._data[end] = value
+        else:
+            try:
+                self._data.append(value)
+            except BufferError:
+                self._reallocate()
+                self._data.append(value)
+        self._size += 1
+
+    def _push_front(self, value: Any) -> None:
+        if self._start == 0:
+            self._reallocate(front=max(8, self._size))
+        self._data[self._start - 1] = value
+        self._start -= 1
+        self._size += 1
+
+    def _pop_back(self, message: str) -> Any:
+        if self.is_empty():
+            raise IndexError(message)
+        self._size -= 1
+        value = self._data[self._start + self._size]
+        self._shrink()
+        return value
+
+    def _pop_front(self, message: str) -> Any:
+        if self.is_empty():
+            raise IndexError(message)
+        value = self._data[self._start]
+        self._start += 1
+        self._size -= 1
+        self._shrink()
+        return value
+
+    def _pop_many(self, k: int, back: bool) -> array[Any]:
+        _check_count(k)
+        k = min(k, self._size)
+        if back:
+            end = self._start + self._size
+            values = self._data[end - k:end]
+            values.reverse()
+        else:
+            values = self._data[self._start:self._start + k]
+            self._start += k
+        self._size -= k
+        self._shrink()
+        return values
+
+
+@dataclass(repr=False, eq=False)
+class TypedQueue(TypedArrayBase):
+    """ADT implementation of a Queue of numbers stored in a contiguous
+    `array`, e.g. `TypedQueue('d', [1.0, 2.0])`."""
+
+    def first(self) -> Any:
+        """Get the element at the front of the queue."""
+        if self.is_empty():
+            raise IndexError('Queue is empty.')
+        return self._data[self._start]
+
+    def last(self) -> Any:
+        """Get the element at the end of the queue."""
+        if self.is_empty():
+            raise IndexError('Queue is empty.')
+        return self._data[self._start + self._size - 1]
+
+    def enqueue(self, value: Any = None, iterate: bool = False) -> None:
+        """Add number(s) to the end of the queue.
+
+        Parameters
+        ----------
+        value : Any, optional
+            Number to be added, or numbers if `iterate` is True.
+        iterate : bool, optional
+            Add all the values of the iterable or buffer `value`, by default
+            False.
+
+        Raises
+        ------
+        TypeError
+            If `value` is not a number of the queue's type, or if `iterate`
+            is True and `value` is not iterable.
+        """
+        if iterate:
+            self._link_values(value)
+        else:
+            self._push_back(value)
+
+    def extend(self, values: Any) -> None:
+        """Add all `values`, an iterable or a buffer, to the end of the queue.
+
+        Raises
+        ------
+        TypeError
+            If `values` is not iterable.
+        """
+        self._link_values(values)
+
+    def dequeue(self) -> Any:
+        """Remove and return the element at the front of the queue."""
+        return self._pop_front('Queue is empty.')
+
+    def pop_many(self, k: int) -> array[Any]:
+        """Remove up to `k` values from the front of the queue and return
+        them as an array, in queue order.
+
+        Raises
+        ------
+        ValueError
+            If `k` is not a non-negative integer.
+        """
+        return self._pop_many(k, back=False)
+
+
+@dataclass(repr=False, eq=False)
+class TypedStack(TypedArrayBase):
+    """ADT implementation of a Stack of numbers stored in a contiguous
+    `array`, from the bottom to the top of the stack."""
+
+    def top(self) -> Any:
+        """Get the value at the top of the stack."""
+        if self.is_empty():
+            raise IndexError('Stack is empty.')
+        return self._data[self._start + self._size - 1]
+
+    def push(self, value: Any = None, iterate: bool = False) -> None:
+        """Push number(s) to the top of the stack.
+
+        Parameters
+        ----------
+        value : Any, optional
+            Number to be added, or numbers if `iterate` is True.
+        iterate : bool, optional
+            Push all the values of the iterable or buffer `value`, by default
+            False.
+
+        Raises
+        ------
+        TypeError
+            If `value` is not a number of the stack's type, or if `iterate`
+            is True and `value` is not iterable.
+        """
+        if iterate:
+            self._link_values(value)
+        else:
+            self._push_back(value)
+
+    def push_many(self, values: Any) -> None:
+        """Push all `values`, an iterable or a buffer, in order.
+
+        Raises
+        ------
+        TypeError
+            If `values` is not iterable.
+        """
+        self._link_values(values)
+
+    def pop(self) -> Any:
+        """Remove and return the value at the top of the stack."""
+        return self._pop_back('Stack is empty.')
+
+    def pop_many(self, k: int) -> array[Any]:
+        """Remove up to `k` values from the top of the stack and return them
+        as an array, in popping order.
+
+        Raises
+        ------
+        ValueError
+            If `k` is not a non-negative integer.
+        """
+        return self._pop_many(k, back=True)
+
+
+@dataclass(repr=False, eq=False)
+class TypedDeque(TypedArrayBase):
+    """ADT implementation of a Deque of numbers stored in a contiguous
+    `array`, with free slots kept at both ends."""
+
+    def first(self) -> Any:
+        """Get the value from the front of the deque."""
+        if self.is_empty():
+            raise IndexError('Deque is empty.')
+        return self._data[self._start]
+
+    def last(self) -> Any:
+        """Get the value from the back of the deque."""
+        if self.is_empty():
+            raise IndexError('Deque is empty.')
+        return self._data[self._start + self._size - 1]
+
+    def insert_front(self, val: Any = None) -> None:
+        """Insert value at the front of the deque."""
+        self._push_front(val)
+
+    def insert_back(self, val: Any = None) -> None:
+        """Insert value at the back of the deque."""
+        self._push_back(val)
+
+    def pop_front(self) -> Any:
+        """Delete and return the value from the front of the deque."""
+        return self._pop_front('Deque is empty.')
+
+    def pop_back(self) -> Any:
+        """Delete and return the value from the back of the deque."""
+        return self._pop_back('Deque is empty.')
+
+    def delete_front(self) -> None:
+        """Delete the value at the front of the deque."""
+        self.pop_front()
+
+    def delete_back(self) -> None:
+        """Delete the value at the back of the deque."""
+        self.pop_back()
+
+    def extend(self, values: Any) -> None:
+        """Insert all `values`, an iterable or a buffer, at the back of the
+        deque.
+
+        Raises
+        ------
+        TypeError
+            If `values` is not iterable.
+        """
+        self._link_values(values)
+
+    def extendleft(self, values: Any) -> None:
+        """Insert all `values` at the front of the deque, ending in reverse
+        order.
+
+        Raises
+        ------
+        TypeError
+            If `values` is not iterable.
+        """
+        loaded = self._load(values)
+        if loaded is values:
+            loaded = loaded[:]
+        loaded.reverse()
+        if self._start < len(loaded):
+            self._reallocate(front=max(len(loaded), self._size))
+        self._data[self._start - len(loaded):self._start] = loaded
+        self._start -= len(loaded)
+        self._size += len(loaded)
+
+    def pop_many(self, k: int, back: bool = False) -> array[Any]:
+        """Delete up to `k` values from the front (or the back) of the deque
+        and return them as an array, in popping order.
+
+        Raises
+        ------
+        ValueError
+            If `k` is not a non-negative integer.
+        """
+        return self._pop_many(k, back)
@@ -0,0 +1,158 @@
+"""Unit testing for caches.py
+"""
+
+
+import pickle
+
+import pytest
+
+from oops import caches
+from oops import lists
+
+
+class TestLRUCache:
+    def test_get_and_put(self):
+        cache = caches.LRUCache(maxsize=2)
+        cache['a'] = 1
+        cache.put('b', 2)
+        assert cache['a'] == 1
+        cache['c'] = 3
+        assert 'b' not in cache
+        assert list(cache) == ['a', 'c']
+        assert cache.get('b', 0) == 0
+        with pytest.raises(KeyError):
+            cache['b']
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.evictions) == (1, 2, 1)
+        assert cache.stats.hit_ratio == 1 / 3
+
+        # Peeking doesn't change the order, replacing a value does
+        assert cache.peek('a') == 1
+        cache['a'] = 10
+        assert list(cache.items()) == [('c', 3), ('a', 10)]
+        assert cache.pop('c') == 3
+        assert cache.pop('c', None) is None
+        del cache['a']
+        assert len(cache) == 0
+        with pytest.raises(KeyError):
+            cache.pop('a')
+        assert cache.stats.evictions == 1
+
+    def test_weights_and_callbacks(self):
+        evicted = []
+        cache = caches.LRUCache(maxsize=None, maxweight=10, weigher=lambda key, value: len(value),
+                                on_evict=lambda key, value: evicted.append(key))
+        cache['a'] = 'xxxx'
+        cache['b'] = 'xxxx'
+        cache['c'] = 'xx'
+        assert cache.weight == 10
+        cache['a']
+        cache['d'] = 'xxx'
+        assert evicted == ['b']
+        assert list(cache) == ['c', 'a', 'd']
+        # A heavier value evicts other entries, never its own
+        cache['d'] = 'xxxxxx'
+        assert evicted == ['b', 'c']
+        assert (list(cache), cache.weight) == (['a', 'd'], 10)
+        with pytest.raises(ValueError):
+            cache['e'] = 'x' * 11
+        cache.clear()
+        assert (len(cache), cache.weight, evicted) == (0, 0, ['b', 'c'])
+
+    def test_pool_and_pickle(self):
+        pool = lists.NodePool(lists.DoubleListNode)
+        cache = caches.LRUCache(maxsize=3, pool=pool)
+        for i in range(10):
+            cache[i] = i * i
+        # Evicted nodes are reused by the next insertions
+        assert len(pool) == 0
+        cache.clear()
+        assert len(pool) == 3
+        assert list(pickle.loads(pickle.dumps(caches.LRUCache(2, 5))).items()) == []
+
+        copied = pickle.loads(pickle.dumps(caches.LRUCache.from_iterable([(1, 'a'), (2, 'b')], maxsize=5)))
+        assert (list(copied.items()), copied.maxsize) == ([(1, 'a'), (2, 'b')], 5)
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            caches.LRUCache(maxsize=0)
+        with pytest.raises(ValueError):
+            caches.LFUCache(maxweight=-1)
+
+
+class TestLFUCache:
+    def test_eviction_order(self):
+        evicted = []
+        cache = caches.LFUCache(maxsize=3, on_evict=lambda key, value: evicted.append(key))
+        for key in 'abc':
+            cache[key] = key.upper()
+        for key in 'aab':
+            cache[key]
+        assert list(cache) == ['c', 'b', 'a']
+        cache['d'] = 'D'
+        cache['e'] = 'E'
+        assert evicted == ['c', 'd']
+        cache['e']
+        cache['e']
+        assert list(cache) == ['b', 'a', 'e']
+        cache['e'] = 'E2'
+        assert list(cache) == ['b', 'a', 'e']
+        assert cache.pop('a') == 'A'
+        cache['f'] = 'F'
+        assert list(cache) == ['f', 'b', 'e']
+
+    def test_counts_are_sorted(self):
+        cache = caches.LFUCache(maxsize=50)
+        for i in range(200):
+            cache[i % 60] = i
+            cache.get((i * 7) % 60)
+            counts = [node.val.count for node in cache._tails.values()]
+            assert all(node.val.count == count for count, node in cache._tails.items())
+            entries = []
+            node = cache._header.next
+            while node is not cache._trailer:
+                entries.append(node.val.count)
+                node = node.next
+            assert entries == sorted(entries)
+            assert sorted(set(entries)) == sorted(counts)
+            assert len(cache) == len(cache._index) <= 50
+
+
+class TestMemoize:
+    def test_memoize(self):
+        calls = []
+
+        @caches.memoize
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        assert [square(2), square(3), square(2)] == [4, 9, 4]
+        assert calls == [2, 3]
+        assert square.cache.stats.hits == 1
+        square.cache_clear()
+        square(2)
+        assert calls == [2, 3, 2]
+        assert square.__name__ == 'square'
+
+    def test_options(self):
+        @caches.memoize(maxsize=2, policy='lfu', typed=True)
+        def add(x, y=0):
+            return x + y
+
+        assert add(1) == add(1.0) == add(1, y=0) == 1
+        assert len(add.cache) == 2
+        assert isinstance(add.cache, caches.LFUCache)
+
+        @caches.memoize(maxweight=5, weigher=lambda key, value: len(value))
+        def text(n):
+            return 'x' * n
+
+        assert text(10) == 'x' * 10
+        assert text(3) == 'xxx'
+        assert list(text.cache) == [(3,)]
+
+        with pytest.raises(ValueError):
+            caches.memoize(policy='fifo')
+        with pytest.raises(ValueError):
+            caches.memoize(maxweight=0.5)
+        assert caches.memoize(maxweight=0.5, weigher=lambda key, value: 0.1)
@@ -0,0 +1,82 @@
+"""Unit testing for executors.py
+"""
+
+
+import threading
+import time
+from concurrent.futures import TimeoutError
+
+import pytest
+
+from oops import executors
+
+
+def fib(executor, n):
+    """Naive recursive Fibonacci, with a task per call."""
+    if n < 2:
+        return n
+    left = executor.submit(fib, executor, n - 1)
+    right = executor.submit(fib, executor, n - 2)
+    return executor.result(left) + executor.result(right)
+
+
+class TestWorkStealingExecutor:
+    def test_submit_and_map(self):
+        with executors.WorkStealingExecutor(max_workers=3) as executor:
+            assert executor.submit(pow, 2, exp=10).result(timeout=5) == 1024
+            assert list(executor.map(pow, range(5), [2] * 5)) == [0, 1, 4, 9, 16]
+            failed = executor.submit(int, 'x')
+            with pytest.raises(ValueError):
+                failed.result(timeout=5)
+        assert executor._shutdown
+        with pytest.raises(RuntimeError):
+            executor.submit(int)
+
+    @pytest.mark.parametrize('workers', [1, 2, 4])
+    def test_recursive_tasks(self, workers):
+        with executors.WorkStealingExecutor(max_workers=workers) as executor:
+            # Far more nested waits than workers
+            assert executor.submit(fib, executor, 15).result(timeout=30) == 610
+            assert list(executor.submit(lambda: list(executor.map(abs, [-1, -2]))).result(timeout=5)) == [1, 2]
+        stats = executor.stats
+        assert sum(worker.executed for worker in stats) == 1973 + 3
+        assert sum(worker.spawned for worker in stats) == 1972 + 2
+        assert sum(worker.injected for worker in stats) == 2
+        assert sum(worker.stolen for worker in stats) >= sum(worker.steals for worker in stats)
+        if workers == 1:
+            assert stats[0].steals == 0
+        stats[0].reset()
+        assert stats[0] == executors.WorkerStats()
+
+    def test_result_timeout(self):
+        event = threading.Event()
+        with executors.WorkStealingExecutor(max_workers=2) as executor:
+            blocked = executor.submit(event.wait, 5)
+
+            def waiter():
+                with pytest.raises(TimeoutError):
+                    executor.result(blocked, timeout=0.01)
+                return 'timed out'
+
+            assert executor.submit(waiter).result(timeout=5) == 'timed out'
+            with pytest.raises(TimeoutError):
+                executor.result(blocked, timeout=0.01)
+            with pytest.raises(TimeoutError):
+                list(executor.map(time.sleep, [0.5], timeout=0.01))
+            event.set()
+
+    def test_shutdown(self):
+        started, event = threading.Event(), threading.Event()
+        executor = executors.WorkStealingExecutor(max_workers=1)
+        running = executor.submit(lambda: started.set() or event.wait(5))
+        assert started.wait(5)
+        pending = [executor.submit(abs, -x) for x in range(10)]
+        executor.shutdown(wait=False, cancel_futures=True)
+        event.set()
+        assert running.result(timeout=5) is True
+        assert all(future.cancelled() for future in pending)
+        executor.shutdown()
+        assert not any(thread.is_alive() for thread in executor._threads)
+
+        with pytest.raises(ValueError):
+            executors.WorkStealingExecutor(max_workers=0)
@@ -0,0 +1,107 @@
+"""Unit testing for heaps.py
+"""
+
+
+import copy
+import pickle
+import random
+
+import pytest
+
+from oops import heaps
+from oops import lists
+
+
+class TestPriorityQueue:
+    @pytest.mark.parametrize('arity', [2, 3, 4, 8])
+    def test_push_and_pop(self, arity):
+        rng = random.Random(arity)
+        pairs = [(rng.randrange(20), i) for i in range(300)]
+        queue = heaps.PriorityQueue(pairs[:100], arity=arity)
+        for priority, value in pairs[100:]:
+            queue.push(priority, value)
+        assert len(queue) == 300
+        assert queue.peek() == min(pairs)
+        # Equal priorities are popped in insertion order
+        assert list(queue.drain()) == sorted(pairs)
+        assert queue.is_empty()
+
+    def test_values_are_not_compared(self):
+        queue = heaps.PriorityQueue(arity=3)
+        for value in ({'a': 1}, {'b': 2}, {'c': 3}):
+            queue.push(1, value)
+        queue.extend([(0, None), (1, object())])
+        assert queue.pop() == (0, None)
+        assert queue.pop() == (1, {'a': 1})
+        assert sorted(priority for priority, _ in queue) == [1, 1, 1]
+        queue.clear()
+        assert len(queue) == 0
+
+    def test_deep_copy(self):
+        pairs = [(2, ['b']), (1, ['a'])]
+        queue = heaps.PriorityQueue(pairs, deep_copy=True)
+        pairs[1][1].append('changed')
+        assert list(queue.drain()) == [(1, ['a']), (2, ['b'])]
+        assert heaps.PriorityQueue(pairs).pop() == (1, ['a', 'changed'])
+        with pytest.raises(TypeError, match='not iterable'):
+            heaps.PriorityQueue(5)
+
+    def test_empty(self):
+        queue = heaps.PriorityQueue()
+        with pytest.raises(IndexError, match='Priority queue is empty.'):
+            queue.pop()
+        with pytest.raises(IndexError, match='Priority queue is empty.'):
+            queue.peek()
+        with pytest.raises(ValueError):
+            heaps.PriorityQueue(arity=1)
+        with pytest.raises(TypeError, match='PriorityQueue does not support node pools.'):
+            heaps.PriorityQueue(pool=lists.NodePool())
+
+    def test_copy_and_pickle(self):
+        queue = heaps.PriorityQueue([(2, 'b'), (1, 'a'), (2, 'c')], arity=4)
+        assert repr(queue) == "PriorityQueue([(1, 'a'), (2, 'b'), (2, 'c')], arity=4)"
+        for copied in (copy.copy(queue), copy.deepcopy(queue), pickle.loads(pickle.dumps(queue))):
+            assert copied == queue
+            assert copied.arity == 4
+            assert list(copied.drain()) == [(1, 'a'), (2, 'b'), (2, 'c')]
+        assert queue != heaps.PriorityQueue([(1, 'a')])
+
+
+class TestAdaptablePriorityQueue:
+    @pytest.mark.parametrize('arity', [2, 5])
+    def test_update_and_remove(self, arity):
+        rng = random.Random(arity)
+        queue = heaps.AdaptablePriorityQueue(arity=arity)
+        expected = {}
+        locators = {}
+        for i in range(200):
+            locators[i] = queue.push(rng.randrange(50), i)
+            expected[i] = locators[i].priority
+        for i in rng.sample(range(200), 80):
+            expected[i] = rng.randrange(50)
+            queue.update(locators[i], expected[i])
+        for i in rng.sample(sorted(expected), 50):
+            assert queue.remove(locators[i]) == (expected.pop(i), i)
+            assert not locators[i].is_valid()
+        popped = list(queue.drain())
+        assert [priority for priority, _ in popped] == sorted(expected.values())
+        assert sorted(value for _, value in popped) == sorted(expected)
+
+    def test_locators(self):
+        queue = heaps.AdaptablePriorityQueue([(5, 'bulk')])
+        task = queue.push(3, 'task')
+        other = queue.push(3, 'other')
+        assert repr(task) == "Locator(3, 'task')"
+        queue.update(task, value='renamed')
+        assert (task.priority, task.value) == (3, 'renamed')
+        queue.update(other, 1)
+        assert queue.pop() == (1, 'other')
+        assert repr(other) == 'Locator(<removed>)'
+        with pytest.raises(ValueError):
+            queue.update(other, 0)
+        with pytest.raises(ValueError):
+            queue.remove(heaps.AdaptablePriorityQueue().push(1))
+        with pytest.raises(TypeError):
+            queue.remove((3, 'task'))
+        queue.clear()
+        assert not task.is_valid()
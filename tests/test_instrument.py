@@ -0,0 +1,118 @@
+"""Unit testing for instrument.py
+"""
+
+
+import pytest
+
+from oops import instrument
+from oops import lists
+
+
+class TestInstrument:
+    def test_instance_stats(self):
+        sll = lists.SinglyLinkedList([1, 2, 3, 4, 5])
+        other = lists.SinglyLinkedList([1, 2, 3, 4, 5])
+        stats = instrument.instrument(sll)
+        assert instrument.instrument(sll) is stats
+        assert instrument.get_stats(sll) is stats
+        assert instrument.get_stats(other) is None
+
+        sll[2]
+        sll[4]
+        sll.add(6)
+        assert 4 in sll
+        assert list(sll.values()) == [1, 2, 3, 4, 5, 6]
+        other[3]
+
+        snapshot = stats.snapshot()
+        assert snapshot['calls'] == {'__getitem__': 2, 'add': 1, '__contains__': 1, 'values': 1}
+        # The last node is reached without walking, `in` stops at the 4th node
+        assert snapshot['traversed'] == {'__getitem__': 3, '__contains__': 4, 'values': 6}
+        assert snapshot['allocated'] == 1
+        assert snapshot['latency_ns']['__getitem__']['count'] == 2
+        assert sum(snapshot['latency_ns']['add']['buckets'].values()) == 1
+        assert 'values' not in snapshot['latency_ns']
+
+        assert instrument.uninstrument(sll) is stats
+        assert instrument.uninstrument(sll) is None
+        assert not hasattr(lists.SinglyLinkedList.add, '_instrumented')
+        sll[2]
+        assert stats.calls['__getitem__'] == 2
+
+    def test_class_stats(self):
+        with instrument.instrumented(lists.Queue) as stats:
+            queue = lists.Queue([1, 2, 3])
+            queue.enqueue(4)
+            assert list(queue.drain()) == [1, 2, 3, 4]
+            lists.Queue().enqueue(1)
+        assert stats.calls == {'__init__': 2, 'enqueue': 2, 'drain': 1}
+        assert stats.traversed == {'drain': 4}
+        assert stats.allocated == 5
+        assert stats.freed == 4
+        assert lists.Queue._stats is None
+        assert not hasattr(lists.Queue.enqueue, '_instrumented')
+        assert 'is_empty' not in vars(lists.Queue)
+
+    def test_class_and_instance(self):
+        deque = lists.LinkedDeque([1, 2, 3, 4])
+        class_stats = instrument.instrument(lists.LinkedDeque)
+        instance_stats = instrument.instrument(deque)
+        deque.rotate(3)
+        lists.LinkedDeque([1]).pop_back()
+        assert instance_stats.calls == {'rotate': 1}
+        assert instance_stats.traversed == {'rotate': 1}
+        assert class_stats.calls == {'__init__': 1, 'pop_back': 1}
+        assert class_stats.freed == 1
+
+        instrument.uninstrument(lists.LinkedDeque)
+        deque.pop_front()
+        assert instance_stats.calls['pop_front'] == 1
+        instrument.uninstrument(deque)
+        assert not hasattr(lists.LinkedDeque.pop_front, '_instrumented')
+
+    def test_blocks_and_skip_nodes(self):
+        block_deque = lists.BlockDeque(range(10), block_size=4)
+        skip_list = lists.IndexableSkipList(range(10), seed=1)
+        with instrument.instrumented(block_deque) as block_stats, instrument.instrumented(skip_list) as skip_stats:
+            assert block_deque[9] == 9
+            assert [block_deque.pop_front() for _ in range(4)] == [0, 1, 2, 3]
+            skip_list.insert(3, 'x')
+            assert skip_list.delete(0) == 0
+        assert block_stats.traversed == {'__getitem__': 1}
+        assert block_stats.freed == 1
+        assert skip_stats.calls == {'insert': 1, 'delete': 1}
+        assert skip_stats.allocated == skip_stats.freed == 1
+
+    def test_walks_are_counted_by_the_wrappers(self):
+        circular = lists.CircularlyLinkedList([1, 2, 3, 4])
+        deque = lists.LinkedDeque(range(10))
+        with instrument.instrumented(circular) as circular_stats, instrument.instrumented(deque) as deque_stats:
+            circular.rotate(-1)
+            assert deque[7] == 7
+            assert deque[-9] == 1
+            with pytest.raises(IndexError):
+                deque[10]
+        assert circular_stats.traversed == {'rotate': 1}
+        assert deque_stats.traversed == {'__getitem__': 5}
+        assert not hasattr(lists.BlockDeque._locate, '_instrumented')
+
+    def test_reset_and_errors(self):
+        stats = instrument.instrument(lists.SinglyLinkedStack)
+        lists.SinglyLinkedStack(1).pop()
+        stats.reset()
+        assert stats.snapshot() == {'calls': {}, 'traversed': {}, 'allocated': 0, 'freed': 0, 'latency_ns': {}}
+        instrument.uninstrument(lists.SinglyLinkedStack)
+
+        with pytest.raises(TypeError):
+            instrument.instrument([])
+        with pytest.raises(TypeError):
+            instrument.instrument(list)
+
+
+class TestLatencyHistogram:
+    def test_record(self):
+        histogram = instrument.LatencyHistogram()
+        for ns in (0, 1, 3, 1000):
+            histogram.record(ns)
+        assert histogram.snapshot() == {'count': 4, 'total_ns': 1004, 'max_ns': 1000,
+                                        'buckets': {1: 1, 2: 1, 4: 1, 1024: 1}}
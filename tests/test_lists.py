@@ -2,8 +2,13 @@
 """
 
 
+import copy
+import pickle
+import random
+
 import pytest
 
+from oops import instrument
 from oops import lists
 
 
@@ -29,6 +34,121 @@ def sll_complex():
     return lists.SinglyLinkedList(COMPLEX_LIST)
 
 
+def _walk(node, count):
+    """Yield `count` linked nodes from `node`.
+    """
+    for _ in range(count):
+        yield node
+        node = node.next
+
+
+class TestNodes:
+    def test_nodes_are_slotted(self):
+        with pytest.raises(AttributeError):
+            lists.ListNode(1).extra = 1
+        with pytest.raises(AttributeError):
+            lists.DoubleListNode(1).extra = 1
+        assert not hasattr(lists.ListNode(1), '__dict__')
+
+    def test_long_chains(self):
+        def chain(n):
+            head = node = lists.ListNode(0)
+            for i in range(1, n):
+                node.next = node = lists.ListNode(i)
+            return head, node
+
+        head, tail = chain(10_000)
+        other, _ = chain(10_000)
+        assert other == head
+        tail.val = -1
+        assert other != head
+
+        chain = repr(head)
+        assert chain.startswith('ListNode(val=0, next=ListNode(val=1, next=')
+        assert chain.count('ListNode(') == lists.REPR_MAX_NODES
+        assert chain.endswith(f'val={lists.REPR_MAX_NODES - 1}, next=...' + ')' * lists.REPR_MAX_NODES)
+
+    def test_cycles(self):
+        node = lists.ListNode(1)
+        node.next = node
+        other = lists.ListNode(1, lists.ListNode(1))
+        other.next.next = other
+        assert node == other
+        assert repr(node) == 'ListNode(val=1, next=...)'
+        node.val = node
+        assert repr(node) == 'ListNode(val=..., next=...)'
+
+        first, second = lists.DoubleListNode(1), lists.DoubleListNode(2)
+        first.next, second.prev = second, first
+        assert repr(first) == 'DoubleListNode(val=1, next=DoubleListNode(val=2, next=None, prev=...), prev=None)'
+        assert first != lists.DoubleListNode(1)
+        assert first != lists.ListNode(1)
+
+
+class TestNodePool:
+    def test_acquire_and_release(self):
+        pool = lists.NodePool(maxsize=2)
+        node = pool.acquire()
+        assert node == lists.ListNode()
+        assert len(pool) == 0
+
+        node.val, node.next = 1, lists.ListNode(2)
+        pool.release(node)
+        assert len(pool) == 1
+        assert node == lists.ListNode()
+        assert pool.acquire() is node
+
+        for _ in range(3):
+            pool.release(lists.ListNode(1))
+        assert len(pool) == 2
+        pool.clear()
+        assert len(pool) == 0
+
+    def test_raise_errors(self):
+        with pytest.raises(TypeError):
+            lists.NodePool(int)
+        with pytest.raises(ValueError):
+            lists.NodePool(maxsize=-1)
+        with pytest.raises(TypeError):
+            lists.NodePool().release(lists.DoubleListNode())
+        with pytest.raises(TypeError):
+            lists.LinkedDeque(pool=lists.NodePool())
+        with pytest.raises(TypeError):
+            lists.Queue(pool=lists.NodePool(lists.DoubleListNode))
+
+    def test_structures_recycle_nodes(self):
+        pool = lists.NodePool()
+        queue = lists.Queue([1, 2, 3], pool=pool)
+        stack = lists.SinglyLinkedStack(pool=pool)
+        assert queue.dequeue() == 1
+        assert len(pool) == 1
+        stack.push(4)
+        assert len(pool) == 0
+        assert stack.pop() == 4
+        assert queue.dequeue() == 2
+        assert len(pool) == 2
+
+        circular = lists.CircularlyLinkedList([1, 2], pool=pool)
+        assert len(pool) == 0
+        assert circular.dequeue() == 1
+        assert len(pool) == 1
+
+        double_pool = lists.NodePool(lists.DoubleListNode, maxsize=1)
+        deque = lists.LinkedDeque([1, 2, 3], pool=double_pool)
+        deque.delete_front()
+        assert deque.pop_back() == 3
+        assert len(double_pool) == 1
+        deque.insert_front(5)
+        assert len(double_pool) == 0
+        assert deque.first() == 5
+        assert deque.last() == 2
+
+    def test_pool_not_in_repr_or_eq(self):
+        queue = lists.Queue(2, pool=lists.NodePool())
+        assert str(queue) == 'Queue(_head=ListNode(val=2, next=None))'
+        assert queue == lists.Queue(2)
+
+
 class TestSinglyLinkedList:
 
     def test_can_add_node_to_sll(self):
@@ -103,6 +223,30 @@ class TestSinglyLinkedList:
         with pytest.raises(StopIteration):
             assert next(sll_iter)
 
+    def test_sll_nodes_values_and_reversed(self, sll_simple):
+        assert list(sll_simple.values()) == SIMPLE_LIST
+        assert [node.val for node in sll_simple.nodes()] == SIMPLE_LIST
+        assert [node.val for node in reversed(sll_simple)] == SIMPLE_LIST[::-1]
+        assert list(lists.SinglyLinkedList().values()) == []
+        assert list(reversed(lists.SinglyLinkedList())) == []
+
+    def test_sll_contains(self, sll_simple, sll_complex):
+        assert 3 in sll_simple
+        assert 5 not in sll_simple
+        assert 'a' in sll_complex
+        assert lists.ListNode(val=1) in sll_simple
+        assert lists.ListNode(val=5) not in sll_simple
+        assert None not in lists.SinglyLinkedList()
+
+    def test_sll_add_keeps_tail(self):
+        sll = lists.SinglyLinkedList()
+        for x in range(100):
+            sll.add(x)
+            assert sll._tail.val == x
+            assert sll[x].val == x
+        assert sll._tail.next is None
+        assert list(sll.values()) == list(range(100))
+
     def test_raise_errors(self, sll_simple):
         with pytest.raises(TypeError):
             sll_simple.add(1, iterate=True)
@@ -124,7 +268,8 @@ class TestSinglyLinkedList:
 
         with pytest.raises(IndexError):
             sll_simple[4]
-        with pytest.raises(ValueError):
+        assert sll_simple[-1] == lists.ListNode(val=1)
+        with pytest.raises(IndexError):
             sll_simple[-10]
         with pytest.raises(ValueError):
             sll_simple[2.5]
@@ -347,3 +492,888 @@ class TestLinkedDeque:
             circulary.delete_back()
         with pytest.raises(IndexError):
             circulary.delete_front()
+
+    def test_iter_and_rotate(self):
+        deque = lists.LinkedDeque([1, 2, 3, 4, 5])
+        assert list(deque) == [1, 2, 3, 4, 5]
+
+        deque.rotate(2)
+        assert list(deque) == [4, 5, 1, 2, 3]
+        deque.rotate(-3)
+        assert list(deque) == [2, 3, 4, 5, 1]
+        deque.rotate(4)
+        assert list(deque) == [3, 4, 5, 1, 2]
+        deque.rotate(10)
+        assert list(deque) == [3, 4, 5, 1, 2]
+        assert deque.first() == 3
+        assert deque.last() == 2
+        assert deque.pop_back() == 2
+        assert deque.pop_front() == 3
+
+        deque = lists.LinkedDeque()
+        deque.rotate(3)
+        assert list(deque) == []
+
+
+class TestPositionalList:
+    def test_add_and_navigate(self):
+        plist = lists.PositionalList([2, 4])
+        assert str(lists.PositionalList()) == 'PositionalList()'
+        assert lists.PositionalList().first() is None
+        first, last = plist.first(), plist.last()
+        assert (first.value, last.value) == (2, 4)
+        three = plist.add_after(first, 3)
+        one = plist.add_first(1)
+        five = plist.add_last(5)
+        zero = plist.add_before(one, 0)
+        assert list(plist) == [0, 1, 2, 3, 4, 5]
+        assert list(reversed(plist)) == [5, 4, 3, 2, 1, 0]
+        assert len(plist) == 6
+        assert plist.before(three) == first
+        assert plist.after(three) == last
+        assert plist.before(zero) is None
+        assert plist.after(five) is None
+        assert plist.find(3) == three
+        assert plist.find(10) is None
+        assert {three, plist.find(3)} == {three}
+        assert repr(three) == 'Position(3)'
+
+    def test_replace_and_delete(self):
+        plist = lists.PositionalList(['a', 'b', 'c'])
+        b = plist.after(plist.first())
+        assert plist.replace(b, 'B') == 'b'
+        assert plist.delete(b) == 'B'
+        assert list(plist) == ['a', 'c']
+        assert repr(b) == 'Position(<deleted>)'
+        for method in (plist.delete, plist.after, plist.before):
+            with pytest.raises(ValueError):
+                method(b)
+        with pytest.raises(ValueError):
+            plist.add_after(b, 'x')
+        with pytest.raises(ValueError):
+            b.value
+        with pytest.raises(ValueError):
+            plist.delete(lists.PositionalList([1]).first())
+        with pytest.raises(TypeError):
+            plist.delete(0)
+        with pytest.raises(TypeError, match='PositionalList does not support node pools.'):
+            lists.PositionalList(pool=lists.NodePool(lists.DoubleListNode))
+
+    def test_cursors(self):
+        plist = lists.PositionalList(range(6))
+        # Deleting the current position, and inserting after it, is allowed
+        for position in plist.positions():
+            if position.value % 2:
+                plist.delete(position)
+            elif position.value == 2:
+                plist.add_after(position, 10)
+        assert list(plist) == [0, 2, 10, 4]
+        four = plist.last()
+        assert [p.value for p in plist.positions(reverse=True)] == [4, 10, 2, 0]
+        assert [p.value for p in plist.positions(plist.before(four), reverse=True)] == [10, 2, 0]
+        assert [p.value for p in plist.positions(plist.find(2))] == [2, 10, 4]
+
+        assert copy.copy(plist) == plist
+        assert list(pickle.loads(pickle.dumps(plist))) == [0, 2, 10, 4]
+
+    @pytest.mark.parametrize('reverse', [False, True])
+    def test_cursor_after_deleting_neighbours(self, reverse):
+        plist = lists.PositionalList([1, 2, 3, 4, 5])
+        seen = []
+        for position in plist.positions(reverse=reverse):
+            seen.append(position.value)
+            if position.value == 2 + 2 * reverse:
+                # Delete the current position and the next one
+                following = plist.before(position) if reverse else plist.after(position)
+                plist.delete(following)
+                plist.delete(position)
+        assert seen == ([5, 4, 2, 1] if reverse else [1, 2, 4, 5])
+        assert list(plist) == ([1, 2, 5] if reverse else [1, 4, 5])
+
+        plist = lists.PositionalList([1, 2, 3, 4])
+        cursor = plist.positions(plist.find(2))
+        current = next(cursor)
+        for position in (plist.before(current), plist.after(current), current):
+            plist.delete(position)
+        with pytest.raises(RuntimeError):
+            next(cursor)
+
+
+class TestSlicing:
+    @pytest.mark.parametrize('slc', [slice(None), slice(2, 8), slice(1, None, 3), slice(-4, None),
+                                     slice(None, None, -1), slice(8, 1, -2), slice(-2, -9, -3), slice(5, 2)])
+    def test_slices(self, slc):
+        values = list(range(10))
+        sll = lists.SinglyLinkedList(values)
+        assert [node.val for node in sll[slc]] == values[slc]
+        for deque in (lists.LinkedDeque(values), lists.BlockDeque(values, block_size=4)):
+            view = deque[slc]
+            assert len(view) == len(values[slc])
+            assert list(view) == values[slc]
+            assert list(reversed(view)) == values[slc][::-1]
+            assert list(view[1::2]) == values[slc][1::2]
+
+    def test_indices_and_views(self):
+        deque = lists.LinkedDeque(range(10))
+        assert (deque[0], deque[7], deque[-1], deque[-10]) == (0, 7, 9, 0)
+        with pytest.raises(IndexError):
+            deque[10]
+        with pytest.raises(ValueError):
+            deque['1']
+
+        view = deque[2:9]
+        assert repr(view) == 'SliceView(LinkedDeque, range(2, 9))'
+        assert (view[0], view[-1]) == (2, 8)
+        with pytest.raises(IndexError):
+            view[7]
+        assert list(view.windows(3)) == [[2, 3, 4], [5, 6, 7], [8]]
+
+    def test_windows(self):
+        sll = lists.SinglyLinkedList(range(7))
+        assert [[node.val for node in page] for page in sll.windows(3)] == [[0, 1, 2], [3, 4, 5], [6]]
+        block_deque = lists.BlockDeque(range(7), block_size=2)
+        assert list(block_deque.windows(3, step=2)) == [[0, 1, 2], [2, 3, 4], [4, 5, 6]]
+        assert list(block_deque.windows(2, step=3)) == [[0, 1], [3, 4], [6]]
+        assert list(lists.LinkedDeque().windows(2)) == []
+        with pytest.raises(ValueError):
+            sll.windows(0)
+        with pytest.raises(ValueError):
+            block_deque.windows(2, step=-1)
+
+    def test_single_walk(self):
+        deque = lists.LinkedDeque(range(100))
+        with instrument.instrumented(deque) as stats:
+            assert list(deque[-3:]) == [97, 98, 99]
+        # The values near the back are reached from the back
+        assert sum(stats.traversed.values()) == 3
+
+
+class TestSpliceAndMerge:
+    @pytest.mark.parametrize('kind', [lists.SinglyLinkedList, lists.Queue, lists.CircularlyLinkedList,
+                                      lists.LinkedDeque])
+    def test_splice(self, kind):
+        def values(structure):
+            if kind is lists.SinglyLinkedList:
+                return list(structure.values())
+            return list(structure._flat_values())
+
+        first, second = kind([1, 2]), kind([3, 4])
+        nodes = values(second)
+        first.splice(second)
+        assert values(first) == [1, 2, 3, 4]
+        assert nodes == [3, 4]
+        assert (len(first), len(second), values(second)) == (4, 0, [])
+        first.splice(kind([-1, 0]), front=True)
+        first.splice(kind())
+        second.splice(first)
+        assert values(second) == [-1, 0, 1, 2, 3, 4]
+        assert len(first) == 0
+        second.splice(kind([5]))
+        assert values(second) == [-1, 0, 1, 2, 3, 4, 5]
+        assert len(second) == 7
+
+        with pytest.raises(ValueError):
+            second.splice(second)
+        with pytest.raises(TypeError):
+            second.splice([6])
+
+    def test_splice_keeps_nodes(self):
+        queue, other = lists.Queue([1]), lists.Queue([2, 3])
+        node = other._head
+        queue.splice(other)
+        assert queue._head.next is node
+        queue.enqueue(4)
+        other.enqueue(5)
+        assert (queue.pop_many(10), other.pop_many(10)) == ([1, 2, 3, 4], [5])
+
+        deque, other = lists.LinkedDeque([1, 2]), lists.LinkedDeque([0])
+        deque.splice(other, front=True)
+        assert (list(deque), list(reversed(deque))) == ([0, 1, 2], [2, 1, 0])
+        other.insert_back(9)
+        assert (list(other), deque.pop_back(), deque.pop_front()) == ([9], 2, 0)
+
+        circular = lists.CircularlyLinkedList([1, 2])
+        circular.splice(lists.CircularlyLinkedList([3]))
+        circular.rotate(4)
+        assert [circular.dequeue() for _ in range(3)] == [3, 1, 2]
+
+    def test_concat(self):
+        pool = lists.NodePool()
+        queues = [lists.Queue([1, 2], pool=pool), lists.Queue(), lists.Queue([3])]
+        concatenated = lists.concat(*queues)
+        assert concatenated.pop_many(5) == [1, 2, 3]
+        assert concatenated.pool is pool
+        assert all(queue.is_empty() for queue in queues)
+        with pytest.raises(ValueError):
+            lists.concat()
+        with pytest.raises(ValueError):
+            lists.concat(queues[0], queues[0])
+        with pytest.raises(TypeError):
+            lists.concat(lists.Queue(), lists.LinkedDeque())
+        with pytest.raises(TypeError):
+            lists.concat(lists.SinglyLinkedStack(), lists.Queue())
+
+    def test_merge_sorted(self):
+        rng = random.Random(3)
+        shards = [sorted(rng.randrange(50) for _ in range(rng.randrange(30))) for _ in range(6)]
+        queues = [lists.Queue(shard) for shard in shards]
+        nodes = {id(node) for queue in queues for node in _walk(queue._head, len(queue))}
+        merged = lists.merge_sorted(*queues)
+        assert {id(node) for node in _walk(merged._head, len(merged))} == nodes
+        assert list(merged.drain()) == sorted(value for shard in shards for value in shard)
+        assert all(queue.is_empty() for queue in queues)
+
+        # Equal keys keep the order of the structures
+        deques = [lists.LinkedDeque([(1, 'a'), (3, 'a')]), lists.LinkedDeque([(1, 'b'), (2, 'b')])]
+        merged = lists.merge_sorted(*deques, key=lambda pair: pair[0])
+        assert list(merged) == [(1, 'a'), (1, 'b'), (2, 'b'), (3, 'a')]
+        assert list(reversed(merged)) == [(3, 'a'), (2, 'b'), (1, 'b'), (1, 'a')]
+
+        mixed = lists.merge_sorted(lists.SinglyLinkedList([1, 4]), lists.Queue([2, 3]),
+                                   lists.CircularlyLinkedList([0, 5]))
+        assert list(mixed.values()) == [0, 1, 2, 3, 4, 5]
+        mixed.add(6)
+        assert mixed[-1].val == 6
+        with pytest.raises(TypeError):
+            lists.merge_sorted(lists.Queue([1]), lists.LinkedDeque([2]))
+
+    @pytest.mark.parametrize('kind', [lists.SinglyLinkedList, lists.Queue, lists.CircularlyLinkedList,
+                                      lists.LinkedDeque])
+    def test_failed_merge_keeps_nodes(self, kind):
+        first, second = kind([1, 'a']), kind([2, 3])
+        with pytest.raises(TypeError):
+            lists.merge_sorted(first, second)
+        for structure, values in ((first, [1, 'a']), (second, [2, 3])):
+            assert len(structure) == 2
+            assert list(structure._flat_values()) == values
+
+
+class TestSort:
+    @staticmethod
+    def values(structure):
+        if isinstance(structure, lists.SinglyLinkedList):
+            return list(structure.values())
+        return list(structure)
+
+    def test_sorted_flag_defaults(self):
+        assert lists.LinkedDeque._sorted_by is None
+        assert lists.SinglyLinkedList()._sorted_by is None
+
+    @pytest.mark.parametrize('kind', [lists.SinglyLinkedList, lists.LinkedDeque])
+    @pytest.mark.parametrize('size', [0, 1, 2, 3, 17, 300])
+    def test_sort(self, kind, size):
+        rng = random.Random(size)
+        pairs = [(rng.randrange(10), i) for i in range(size)]
+        structure = kind(pairs)
+        nodes = set(map(id, _walk(structure._head if kind is lists.SinglyLinkedList else structure._header.next,
+                                  size)))
+        structure.sort(key=lambda pair: pair[0])
+        # Stable, and the nodes are relinked rather than reallocated
+        assert self.values(structure) == sorted(pairs, key=lambda pair: pair[0])
+        first = structure._head if kind is lists.SinglyLinkedList else structure._header.next
+        assert set(map(id, _walk(first, size))) == nodes
+        assert len(structure) == size
+        structure.sort(key=lambda pair: pair[0], reverse=True)
+        assert self.values(structure) == sorted(pairs, key=lambda pair: pair[0], reverse=True)
+        structure.sort()
+        assert self.values(structure) == sorted(pairs)
+        if kind is lists.LinkedDeque:
+            assert list(reversed(structure)) == sorted(pairs, reverse=True)
+        if kind is lists.SinglyLinkedList:
+            structure.add(pairs, iterate=True)
+        else:
+            structure.extend(pairs)
+        assert self.values(structure)[size:] == pairs
+
+    def test_sort_keeps_structure_usable(self):
+        sll = lists.SinglyLinkedList([3, 1, 2])
+        sll.sort()
+        sll.add(0)
+        assert list(sll.values()) == [1, 2, 3, 0]
+        deque = lists.LinkedDeque([3, 1, 2])
+        deque.sort()
+        deque.insert_front(5)
+        deque.insert_back(4)
+        assert (list(deque), deque.pop_back(), deque.pop_front()) == ([5, 1, 2, 3, 4], 4, 5)
+
+    @pytest.mark.parametrize('kind', [lists.SinglyLinkedList, lists.LinkedDeque])
+    def test_failed_sort_keeps_nodes(self, kind):
+        values = [5, 3, 'x', 1, 4, 2, 0]
+        structure = kind(values)
+        with pytest.raises(TypeError):
+            structure.sort()
+        assert sorted(self.values(structure), key=str) == sorted(values, key=str)
+        assert len(structure) == len(values)
+        assert not structure.is_sorted(key=str)
+        if kind is lists.LinkedDeque:
+            assert list(reversed(structure)) == self.values(structure)[::-1]
+
+    def test_is_sorted(self):
+        sll = lists.SinglyLinkedList([1, 2, 2, 3])
+        assert sll.is_sorted()
+        assert sll._sorted_by == (None, False)
+        assert not sll.is_sorted(reverse=True)
+        assert lists.SinglyLinkedList().is_sorted(key=abs, reverse=True)
+        assert 2 in sll and 5 not in sll and 0 not in sll and 'a' not in sll
+        sll.add(0)
+        assert sll._sorted_by is None
+        assert 0 in sll
+        assert not sll.is_sorted()
+
+        deque = lists.LinkedDeque([3, -2, 1])
+        assert deque.is_sorted(key=abs, reverse=True)
+        deque.sort(key=abs, reverse=True)
+        assert list(deque) == [3, -2, 1]
+        deque.pop_front()
+        assert deque._sorted_by == (abs, True)
+        for mutate in (lambda: deque.insert_back(0), lambda: deque.extendleft([4]), lambda: deque.rotate(1),
+                       lambda: deque.extend([1]), lambda: deque.splice(lists.LinkedDeque([1]))):
+            deque.sort()
+            assert deque.is_sorted()
+            mutate()
+            assert deque._sorted_by is None
+        deque.sort()
+        assert -2 in deque and 9 not in deque
+
+
+class TestBlockDeque:
+    def test_create_and_insert(self):
+        deque = lists.BlockDeque()
+        assert deque.is_empty() is True
+        assert repr(deque) == 'BlockDeque([])'
+        assert str(deque) == 'BlockDeque()'
+
+        deque = lists.BlockDeque(2)
+        assert len(deque) == 1
+        assert str(deque) == 'BlockDeque([2])'
+
+        deque = lists.BlockDeque([1, 2, 3], block_size=2)
+        assert len(deque) == 3
+        assert deque.first() == 1
+        assert deque.last() == 3
+        deque.insert_front(10)
+        assert deque.first() == 10
+        assert list(deque) == [10, 1, 2, 3]
+        assert list(reversed(deque)) == [3, 2, 1, 10]
+        assert deque == lists.BlockDeque([10, 1, 2, 3])
+
+    @pytest.mark.parametrize('block_size', (2, 3, 64))
+    def test_against_collections_deque(self, block_size):
+        import collections
+        import random
+
+        rng = random.Random(block_size)
+        expected = collections.deque()
+        deque = lists.BlockDeque(block_size=block_size)
+        for step in range(3000):
+            op = rng.randrange(6)
+            if op == 0:
+                deque.insert_back(step)
+                expected.append(step)
+            elif op == 1:
+                deque.insert_front(step)
+                expected.appendleft(step)
+            elif op == 2 and expected:
+                assert deque.pop_back() == expected.pop()
+            elif op == 3 and expected:
+                assert deque.pop_front() == expected.popleft()
+            elif op == 4 and expected:
+                idx = rng.randrange(-len(expected), len(expected))
+                assert deque[idx] == expected[idx]
+                deque[idx] = expected[idx] = -step
+            elif op == 5:
+                k = rng.randrange(-10, 10)
+                deque.rotate(k)
+                expected.rotate(k)
+            assert len(deque) == len(expected)
+        assert list(deque) == list(expected)
+        assert list(reversed(deque)) == list(reversed(expected))
+
+    def test_raise_errors(self):
+        deque = lists.BlockDeque()
+        with pytest.raises(IndexError):
+            deque.pop_front()
+        with pytest.raises(IndexError):
+            deque.pop_back()
+        with pytest.raises(IndexError):
+            deque.first()
+        with pytest.raises(IndexError):
+            deque.last()
+        with pytest.raises(IndexError):
+            deque.delete_front()
+        with pytest.raises(IndexError):
+            deque[0]
+        with pytest.raises(ValueError):
+            lists.BlockDeque([1])[0.5]
+        with pytest.raises(ValueError):
+            lists.BlockDeque(block_size=1)
+        with pytest.raises(TypeError, match='BlockDeque does not support node pools.'):
+            lists.BlockDeque(pool=lists.NodePool())
+
+
+def test_make_deque():
+    assert isinstance(lists.make_deque(), lists.LinkedDeque)
+    deque = lists.make_deque([1, 2], backend='block', block_size=8)
+    assert isinstance(deque, lists.BlockDeque)
+    assert deque.block_size == 8
+    assert list(deque) == [1, 2]
+    assert list(lists.make_deque([1, 2], backend='linked')) == [1, 2]
+    with pytest.raises(ValueError):
+        lists.make_deque(backend='array')
+
+
+class TestConstruction:
+    STRUCTURES = (lists.SinglyLinkedList, lists.SinglyLinkedStack, lists.Queue, lists.CircularlyLinkedList,
+                  lists.LinkedDeque, lists.BlockDeque)
+
+    @staticmethod
+    def values(structure):
+        """Values of `structure`, in insertion order."""
+        if isinstance(structure, lists.SinglyLinkedList):
+            return list(structure.values())
+        if isinstance(structure, lists.SinglyLinkedStack):
+            values = []
+            while not structure.is_empty():
+                values.append(structure.pop())
+            return values[::-1]
+        if isinstance(structure, (lists.Queue, lists.CircularlyLinkedList)):
+            values = []
+            while not structure.is_empty():
+                values.append(structure.dequeue())
+            return values
+        return list(structure)
+
+    @pytest.mark.parametrize('cls', STRUCTURES)
+    @pytest.mark.parametrize('source', (
+        pytest.param((1, 2, 3), id='tuple'),
+        pytest.param(range(1, 4), id='range'),
+        pytest.param(lists.SinglyLinkedList([1, 2, 3]), id='sll'),
+        pytest.param(lists.LinkedDeque([1, 2, 3]), id='deque'),
+    ))
+    def test_create_from_any_iterable(self, cls, source):
+        assert self.values(cls(source)) == [1, 2, 3]
+        assert self.values(cls.from_iterable(source)) == [1, 2, 3]
+
+    def test_hooks_are_abstract(self):
+        with pytest.raises(TypeError):
+            lists.SinglyLinkedBase()
+
+        class Incomplete(lists.SinglyLinkedBase):
+            def _link_values(self, values):
+                return 0
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+    @pytest.mark.parametrize('cls', STRUCTURES)
+    def test_from_iterable(self, cls):
+        import array
+
+        assert self.values(cls.from_iterable(x for x in range(5))) == [0, 1, 2, 3, 4]
+        assert self.values(cls.from_iterable(array.array('i', [4, 5]))) == [4, 5]
+        assert self.values(cls.from_iterable('ab')) == ['a', 'b']
+        assert self.values(cls.from_iterable([])) == []
+        assert self.values(cls(x for x in range(3))) == [0, 1, 2]
+        assert len(cls.from_iterable(range(1000))) == 1000
+
+        with pytest.raises(TypeError):
+            cls.from_iterable(1)
+
+    @pytest.mark.parametrize('cls', STRUCTURES)
+    def test_deep_copy_is_opt_in(self, cls):
+        shared = [1]
+        values = [shared, shared]
+
+        stored = self.values(cls(values))
+        assert stored[0] is shared
+
+        stored = self.values(cls(values, deep_copy=True))
+        assert stored == values
+        assert stored[0] is not shared
+        assert stored[0] is stored[1]
+
+        stored = self.values(cls.from_iterable(values, deep_copy=True))
+        assert stored[0] is not shared
+
+    def test_from_iterable_keeps_keyword_arguments(self):
+        pool = lists.NodePool()
+        queue = lists.Queue.from_iterable(range(3), pool=pool)
+        assert queue.pool is pool
+        deque = lists.BlockDeque.from_iterable(range(3), block_size=2)
+        assert deque.block_size == 2
+        assert list(deque) == [0, 1, 2]
+
+    def test_stack_pushes_in_order(self):
+        stack = lists.SinglyLinkedStack.from_iterable([1, 2, 3])
+        assert stack.top() == 3
+        stack = lists.SinglyLinkedStack(1)
+        stack._link_values([2, 3])
+        assert [stack.pop() for _ in range(3)] == [3, 2, 1]
+
+    def test_failed_iteration_leaves_structure_unchanged(self):
+        def failing():
+            yield 10
+            raise RuntimeError
+
+        for structure in (lists.SinglyLinkedList([1]), lists.Queue([1]), lists.SinglyLinkedStack([1]),
+                          lists.CircularlyLinkedList([1]), lists.LinkedDeque([1])):
+            with pytest.raises(RuntimeError):
+                structure._link_values(failing())
+            assert len(structure) == 1
+            assert self.values(structure) == [1]
+
+
+class TestBatchOperations:
+    def test_stack_push_many_pop_many_and_drain(self):
+        pool = lists.NodePool()
+        stack = lists.SinglyLinkedStack([1], pool=pool)
+        stack.push_many(range(2, 6))
+        assert len(stack) == 5
+        assert stack.top() == 5
+
+        assert stack.pop_many(2) == [5, 4]
+        assert len(stack) == 3
+        assert len(pool) == 2
+        assert stack.pop_many(0) == []
+        assert stack.pop_many(10) == [3, 2, 1]
+        assert stack.is_empty()
+        assert stack.pop_many(1) == []
+
+        stack.push_many([1, 2, 3])
+        drain = stack.drain()
+        assert next(drain) == 3
+        assert len(stack) == 2
+        assert list(drain) == [2, 1]
+        assert stack.is_empty()
+
+        with pytest.raises(TypeError):
+            stack.push_many(1)
+        with pytest.raises(ValueError):
+            stack.pop_many(-1)
+
+    def test_queue_extend_pop_many_and_drain(self):
+        queue = lists.Queue()
+        queue.extend(range(3))
+        queue.extend(x for x in range(3, 5))
+        assert len(queue) == 5
+        assert queue.first() == 0
+        assert queue.last() == 4
+
+        queue.extendleft([-1, -2])
+        assert queue.first() == -2
+        assert queue.pop_many(3) == [-2, -1, 0]
+        assert len(queue) == 4
+        assert queue.pop_many(10) == [1, 2, 3, 4]
+        assert queue.is_empty()
+        assert str(queue) == 'Queue()'
+
+        queue.extendleft([1, 2])
+        assert queue.first() == 2
+        assert queue.last() == 1
+        queue.enqueue(3)
+        assert list(queue.drain()) == [2, 1, 3]
+        assert queue.is_empty()
+        queue.enqueue(4)
+        assert queue.first() == queue.last() == 4
+
+        with pytest.raises(TypeError):
+            queue.extend(1)
+        with pytest.raises(TypeError):
+            queue.extendleft(1)
+        with pytest.raises(ValueError):
+            queue.pop_many(1.5)
+
+    @pytest.mark.parametrize('cls', (lists.LinkedDeque, lists.BlockDeque))
+    def test_deque_extend_pop_many_and_drain(self, cls):
+        deque = cls([3])
+        deque.extend([4, 5, 6])
+        deque.extendleft([2, 1, 0])
+        assert list(deque) == [0, 1, 2, 3, 4, 5, 6]
+        assert len(deque) == 7
+        assert deque.first() == 0
+        assert deque.last() == 6
+
+        assert deque.pop_many(2) == [0, 1]
+        assert deque.pop_many(2, back=True) == [6, 5]
+        assert list(deque) == [2, 3, 4]
+        assert deque.first() == 2
+        assert deque.last() == 4
+        assert deque.pop_many(5, back=True) == [4, 3, 2]
+        assert deque.is_empty()
+        deque.extendleft([])
+        deque.extend([1, 2, 3])
+        assert list(deque) == [1, 2, 3]
+
+        assert list(deque.drain(back=True)) == [3, 2, 1]
+        deque.extend([1, 2])
+        assert list(deque.drain()) == [1, 2]
+        assert deque.is_empty()
+        deque.insert_back(1)
+        assert list(deque) == [1]
+
+        with pytest.raises(TypeError):
+            deque.extend(1)
+        with pytest.raises(TypeError):
+            deque.extendleft(1)
+        with pytest.raises(ValueError):
+            deque.pop_many(-1)
+
+    def test_iterate_flags_use_batch_path(self):
+        sll = lists.SinglyLinkedList([1])
+        sll.add(lists.SinglyLinkedList([2, 3]), iterate=True)
+        assert list(sll.values()) == [1, 2, 3]
+        assert sll._tail.val == 3
+
+        circular = lists.CircularlyLinkedList([1])
+        circular.enqueue([2, 3], iterate=True)
+        assert [circular.dequeue() for _ in range(3)] == [1, 2, 3]
+
+
+class TestIndexableSkipList:
+    def test_create_and_add(self):
+        skip = lists.IndexableSkipList()
+        assert skip.is_empty()
+        assert repr(skip) == 'IndexableSkipList([])'
+        assert str(skip) == 'IndexableSkipList()'
+
+        skip = lists.IndexableSkipList(SIMPLE_LIST)
+        assert len(skip) == SIMPLE_LIST_LEN
+        assert str(skip) == 'IndexableSkipList([1, 2, 3, 1])'
+        assert [skip[x].val for x in range(len(skip))] == SIMPLE_LIST
+        assert list(skip.values()) == SIMPLE_LIST
+        assert [node.val for node in skip] == SIMPLE_LIST
+        assert 3 in skip
+        assert 4 not in skip
+
+        skip.add('new_element')
+        assert skip[4].val == 'new_element'
+        skip.add([5, 6], iterate=True)
+        assert list(skip.values()) == SIMPLE_LIST + ['new_element', 5, 6]
+        assert skip == lists.IndexableSkipList(SIMPLE_LIST + ['new_element', 5, 6])
+
+    def test_against_list(self):
+        import random
+
+        rng = random.Random(7)
+        expected = list(range(500))
+        skip = lists.IndexableSkipList.from_iterable(range(500), seed=1)
+        for step in range(2000):
+            op = rng.randrange(4)
+            if op == 0:
+                idx = rng.randint(0, len(expected))
+                skip.insert(idx, step)
+                expected.insert(idx, step)
+            elif op == 1 and expected:
+                idx = rng.randrange(len(expected))
+                assert skip.delete(idx) == expected.pop(idx)
+            elif op == 2 and expected:
+                idx = rng.randrange(len(expected))
+                assert skip[idx].val == expected[idx]
+            else:
+                values = [step] * rng.randrange(3)
+                skip.add(values, iterate=True)
+                expected.extend(values)
+            assert len(skip) == len(expected)
+        assert list(skip.values()) == expected
+        assert [skip[idx].val for idx in range(len(expected))] == expected
+
+    def test_delete_all(self):
+        skip = lists.IndexableSkipList(range(50), seed=3)
+        while not skip.is_empty():
+            skip.delete(len(skip) // 2)
+        assert skip._levels == 1
+        skip.add(1)
+        assert skip[0].val == 1
+
+    def test_binary_search_over_skip_list(self):
+        from oops import searches
+
+        skip = lists.IndexableSkipList(range(0, 1000, 2))
+        assert searches.binary_search(skip, 500, key=lambda node: node.val) is True
+        assert searches.binary_search(skip, 501, key=lambda node: node.val) is False
+
+    def test_raise_errors(self):
+        skip = lists.IndexableSkipList([1, 2])
+        with pytest.raises(IndexError):
+            skip[2]
+        with pytest.raises(ValueError):
+            skip[-1]
+        with pytest.raises(ValueError):
+            skip[0.5]
+        with pytest.raises(IndexError):
+            skip.insert(3, 1)
+        with pytest.raises(IndexError):
+            skip.delete(2)
+        with pytest.raises(TypeError):
+            skip.add(1, iterate=True)
+        with pytest.raises(TypeError, match='IndexableSkipList does not support node pools.'):
+            lists.IndexableSkipList(pool=lists.NodePool())
+
+
+class TestCircularRotate:
+    def test_rotate(self):
+        import collections
+
+        circular = lists.CircularlyLinkedList([1, 2, 3, 4])
+        circular.rotate()
+        assert circular.first() == 4
+        assert circular.last() == 3
+        circular.rotate(2)
+        assert circular.first() == 2
+        circular.rotate(-1)
+        assert circular.first() == 3
+        circular.rotate(8)
+        assert [circular.dequeue() for _ in range(4)] == [3, 4, 1, 2]
+
+        # Same direction as collections.deque
+        for k in (-6, -1, 1, 2, 7):
+            circular = lists.CircularlyLinkedList([1, 2, 3, 4, 5])
+            expected = collections.deque([1, 2, 3, 4, 5])
+            circular.rotate(k)
+            expected.rotate(k)
+            assert [circular.dequeue() for _ in range(5)] == list(expected)
+
+        circular.rotate(3)
+        assert circular.is_empty()
+        circular.enqueue(1)
+        circular.rotate(5)
+        assert circular.first() == circular.last() == 1
+
+
+class TestRingBuffer:
+    def test_create_and_enqueue(self):
+        ring = lists.RingBuffer(3)
+        assert ring.is_empty() is True
+        assert str(ring) == 'RingBuffer()'
+        assert repr(ring) == "RingBuffer([], capacity=3, overflow='overwrite')"
+
+        ring.enqueue(1)
+        ring.enqueue([2, 3], iterate=True)
+        assert ring.full() is True
+        assert list(ring) == [1, 2, 3]
+        ring.enqueue(4)
+        assert list(ring) == [2, 3, 4]
+        assert len(ring) == 3
+        assert ring.first() == 2
+        assert ring.last() == 4
+        assert ring[0] == 2
+        assert ring[-1] == 4
+        ring[1] = 30
+        assert ring[1] == 30
+        assert ring == lists.RingBuffer.from_iterable([2, 30, 4], capacity=5)
+
+        assert ring.dequeue() == 2
+        assert list(ring) == [30, 4]
+        ring.clear()
+        assert ring.is_empty()
+
+    def test_overflow_policies(self):
+        ring = lists.RingBuffer(2, 'drop')
+        ring.enqueue([1, 2, 3], iterate=True)
+        assert list(ring) == [1, 2]
+
+        ring = lists.RingBuffer(2, overflow='raise')
+        ring.enqueue([1, 2], iterate=True)
+        with pytest.raises(IndexError):
+            ring.enqueue(3)
+        assert list(ring) == [1, 2]
+
+    def test_snapshot(self):
+        ring = lists.RingBuffer.from_iterable(range(6), capacity=4)
+        assert ring.snapshot() == ([2, 3], [4, 5])
+        ring.dequeue()
+        ring.dequeue()
+        assert ring.snapshot() == ([4, 5], [])
+
+        typed = lists.RingBuffer.from_iterable(range(6), capacity=4, typecode='d')
+        first, second = typed.snapshot()
+        assert isinstance(first, memoryview)
+        assert first.tolist() == [2.0, 3.0]
+        assert second.tolist() == [4.0, 5.0]
+        typed.enqueue(6)
+        assert first.tolist() == [6.0, 3.0]
+        assert list(typed) == [3.0, 4.0, 5.0, 6.0]
+        assert typed.dequeue() == 3.0
+
+    @pytest.mark.parametrize('typecode', (None, 'q'))
+    def test_rotate_against_deque(self, typecode):
+        import collections
+
+        for capacity, size in ((5, 5), (7, 4), (6, 1)):
+            for k in range(-8, 9):
+                ring = lists.RingBuffer.from_iterable(range(capacity + 2), capacity=capacity, typecode=typecode)
+                for _ in range(capacity - size):
+                    ring.dequeue()
+                expected = collections.deque(ring)
+                ring.rotate(k)
+                expected.rotate(k)
+                assert list(ring) == list(expected)
+                ring.enqueue(100)
+                expected.append(100)
+                assert list(ring) == list(expected)[-capacity:]
+
+    def test_raise_errors(self):
+        with pytest.raises(ValueError):
+            lists.RingBuffer(0)
+        with pytest.raises(ValueError):
+            lists.RingBuffer(2, overflow='block')
+        with pytest.raises(TypeError, match='RingBuffer does not support node pools.'):
+            lists.RingBuffer(2, pool=lists.NodePool())
+        ring = lists.RingBuffer(2)
+        with pytest.raises(IndexError):
+            ring.dequeue()
+        with pytest.raises(IndexError):
+            ring.first()
+        with pytest.raises(IndexError):
+            ring.last()
+        with pytest.raises(IndexError):
+            ring[0]
+        with pytest.raises(ValueError):
+            ring['0']
+        with pytest.raises(TypeError):
+            ring.enqueue(1, iterate=True)
+
+
+class TestCopyAndPickle:
+    N = 10_000
+
+    @pytest.mark.parametrize('cls', [lists.SinglyLinkedList, lists.SinglyLinkedStack, lists.Queue,
+                                     lists.CircularlyLinkedList, lists.LinkedDeque, lists.BlockDeque,
+                                     lists.IndexableSkipList])
+    def test_long_structures(self, cls):
+        structure = cls.from_iterable([i, [i]] for i in range(self.N))
+        for copied in (pickle.loads(pickle.dumps(structure)), copy.copy(structure), copy.deepcopy(structure)):
+            assert type(copied) is cls
+            assert len(copied) == self.N
+            assert copied == structure
+        assert cls.from_iterable(range(self.N)) != cls.from_iterable(range(1, self.N + 1))
+        assert len(repr(structure)) < 100 * self.N
+
+    def test_shallow_and_deep(self):
+        values = [[1], [2]]
+        deque = lists.LinkedDeque.from_iterable(values)
+        assert copy.copy(deque).first() is values[0]
+        assert copy.deepcopy(deque).first() is not values[0]
+        deque.insert_back(deque)
+        copied = copy.deepcopy(deque)
+        assert copied.last() is copied
+
+    def test_parameters_are_kept(self):
+        pool = lists.NodePool()
+        queue = copy.copy(lists.Queue([1, 2], pool=pool))
+        assert queue.pool is pool
+        assert queue == lists.Queue([1, 2])
+
+        ring = lists.RingBuffer.from_iterable(range(5), capacity=4, overflow='drop', typecode='q')
+        copied = pickle.loads(pickle.dumps(ring))
+        assert repr(copied) == "RingBuffer([0, 1, 2, 3], capacity=4, overflow='drop')"
+        assert copied.typecode == 'q'
+        assert copy.deepcopy(lists.BlockDeque([1], block_size=4)).block_size == 4
+        assert copy.copy(lists.IndexableSkipList([1], seed=3)).seed == 3
+
+    def test_rotated_circular_list(self):
+        circular = lists.CircularlyLinkedList.from_iterable(range(5))
+        circular.rotate(2)
+        copied = copy.copy(circular)
+        assert copied == circular
+        assert [copied.dequeue() for _ in range(5)] == [3, 4, 0, 1, 2]
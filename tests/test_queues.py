@@ -0,0 +1,529 @@
+"""Unit testing for queues.py
+"""
+
+
+import asyncio
+import collections
+import json
+import marshal
+import pickle
+
+import pytest
+
+from oops import queues
+
+
+class TestAsyncQueue:
+    def test_put_and_get(self):
+        async def main():
+            queue = queues.AsyncQueue()
+            assert queue.is_empty() is True
+            assert queue.empty() is True
+            assert queue.full() is False
+
+            await queue.put(1)
+            queue.put_nowait(2)
+            assert len(queue) == 2
+            assert queue.qsize() == 2
+            assert await queue.get() == 1
+            assert queue.get_nowait() == 2
+            with pytest.raises(asyncio.QueueEmpty):
+                queue.get_nowait()
+
+        asyncio.run(main())
+
+    def test_get_waits_for_producer(self):
+        async def main():
+            queue = queues.AsyncQueue()
+            consumer = asyncio.create_task(queue.get())
+            await asyncio.sleep(0)
+            assert not consumer.done()
+            await queue.put('item')
+            assert await consumer == 'item'
+
+        asyncio.run(main())
+
+    def test_backpressure(self):
+        async def main():
+            queue = queues.AsyncQueue(maxsize=2)
+            await queue.put(1)
+            await queue.put(2)
+            assert queue.full() is True
+            with pytest.raises(asyncio.QueueFull):
+                queue.put_nowait(3)
+
+            producer = asyncio.create_task(queue.put(3))
+            await asyncio.sleep(0)
+            assert not producer.done()
+            assert await queue.get() == 1
+            await producer
+            assert len(queue) == 2
+            assert [await queue.get(), await queue.get()] == [2, 3]
+
+        asyncio.run(main())
+
+    def test_get_many(self):
+        async def main():
+            queue = queues.AsyncQueue()
+            for x in range(5):
+                queue.put_nowait(x)
+            assert await queue.get_many(3) == [0, 1, 2]
+            assert await queue.get_many(10) == [3, 4]
+            assert await queue.get_many(10, timeout=0.01) == []
+
+            consumer = asyncio.create_task(queue.get_many(10, timeout=5))
+            await asyncio.sleep(0)
+            queue.put_nowait('a')
+            queue.put_nowait('b')
+            assert await consumer == ['a', 'b']
+
+            with pytest.raises(ValueError):
+                await queue.get_many(0)
+
+        asyncio.run(main())
+
+    def test_get_many_wakes_producers(self):
+        async def main():
+            queue = queues.AsyncQueue(maxsize=2)
+            producers = [asyncio.create_task(queue.put(x)) for x in range(4)]
+            await asyncio.sleep(0)
+            assert await queue.get_many(2) == [0, 1]
+            await asyncio.gather(*producers)
+            assert await queue.get_many(2) == [2, 3]
+
+        asyncio.run(main())
+
+    def test_cancelled_getter_passes_wakeup(self):
+        async def main():
+            queue = queues.AsyncQueue()
+            first = asyncio.create_task(queue.get())
+            second = asyncio.create_task(queue.get())
+            await asyncio.sleep(0)
+            queue.put_nowait(1)
+            first.cancel()
+            assert await second == 1
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            assert len(queue._getters) == 0
+
+        asyncio.run(main())
+
+    def test_join_and_task_done(self):
+        async def main():
+            queue = queues.AsyncQueue()
+            await queue.join()
+            processed = []
+
+            async def worker():
+                while True:
+                    item = await queue.get()
+                    processed.append(item)
+                    queue.task_done()
+
+            task = asyncio.create_task(worker())
+            for x in range(10):
+                await queue.put(x)
+            await queue.join()
+            assert processed == list(range(10))
+            task.cancel()
+
+            with pytest.raises(ValueError):
+                queue.task_done()
+
+        asyncio.run(main())
+
+    def test_raise_errors(self):
+        with pytest.raises(ValueError):
+            queues.AsyncQueue(maxsize=-1)
+
+
+def run_producers_consumers(container, put, get_batch, producers=4, consumers=4, per_producer=2000):
+    """Move values from `producers` threads to `consumers` threads, return
+    the values received by each consumer."""
+    import threading
+
+    received = [[] for _ in range(consumers)]
+    done = threading.Event()
+
+    def produce(producer):
+        for x in range(per_producer):
+            put((producer, x))
+
+    def consume(consumer):
+        while not done.is_set() or len(container):
+            received[consumer].extend(get_batch(16, timeout=0.01))
+
+    consumer_threads = [threading.Thread(target=consume, args=(c,)) for c in range(consumers)]
+    producer_threads = [threading.Thread(target=produce, args=(p,)) for p in range(producers)]
+    for thread in consumer_threads + producer_threads:
+        thread.start()
+    for thread in producer_threads:
+        thread.join()
+    done.set()
+    for thread in consumer_threads:
+        thread.join()
+    return received
+
+
+def check_received(received, producers=4, per_producer=2000):
+    values = [value for batch in received for value in batch]
+    assert sorted(values) == [(p, x) for p in range(producers) for x in range(per_producer)]
+    for batch in received:
+        for producer in range(producers):
+            sent = [x for p, x in batch if p == producer]
+            assert sent == sorted(sent)
+
+
+class TestConcurrentQueue:
+    def test_queue_api(self):
+        queue = queues.ConcurrentQueue()
+        assert queue.is_empty() is True
+        assert len(queue) == 0
+        with pytest.raises(IndexError):
+            queue.dequeue()
+        with pytest.raises(IndexError):
+            queue.first()
+        with pytest.raises(IndexError):
+            queue.last()
+
+        queue.enqueue(1)
+        queue.put(2)
+        queue.extend([3, 4])
+        assert len(queue) == 4
+        assert queue.first() == 1
+        assert queue.last() == 4
+        assert queue.dequeue() == 1
+        assert queue.get() == 2
+        assert queue.get_batch(5) == [3, 4]
+        assert queue.is_empty() is True
+        with pytest.raises(IndexError):
+            queue.last()
+
+    def test_blocking_get(self):
+        import queue as stdlib_queue
+        import threading
+
+        queue = queues.ConcurrentQueue()
+        with pytest.raises(stdlib_queue.Empty):
+            queue.get_nowait()
+        with pytest.raises(stdlib_queue.Empty):
+            queue.get(timeout=0.01)
+        assert queue.get_batch(3, timeout=0.01) == []
+
+        timer = threading.Timer(0.05, queue.enqueue, args=('late',))
+        timer.start()
+        assert queue.get(timeout=5) == 'late'
+        timer.join()
+
+        with pytest.raises(ValueError):
+            queue.get_batch(0)
+
+    def test_multiple_producers_and_consumers(self):
+        queue = queues.ConcurrentQueue()
+        check_received(run_producers_consumers(queue, queue.put, queue.get_batch))
+        assert len(queue) == 0
+
+
+class TestConcurrentDeque:
+    def test_deque_api(self):
+        import queue as stdlib_queue
+
+        deque = queues.ConcurrentDeque()
+        assert deque.is_empty() is True
+        with pytest.raises(IndexError):
+            deque.pop_front()
+        with pytest.raises(IndexError):
+            deque.first()
+        with pytest.raises(stdlib_queue.Empty):
+            deque.get_nowait()
+        with pytest.raises(stdlib_queue.Empty):
+            deque.get(timeout=0.01)
+
+        deque.insert_back(2)
+        deque.insert_front(1)
+        deque.extend([3, 4, 5])
+        assert len(deque) == 5
+        assert deque.first() == 1
+        assert deque.last() == 5
+        assert deque.pop_back() == 5
+        assert deque.get(back=True) == 4
+        assert deque.get() == 1
+        assert deque.get_batch(5) == [2, 3]
+        assert deque.get_batch(5, timeout=0.01) == []
+        with pytest.raises(ValueError):
+            deque.get_batch(-1)
+
+    @pytest.mark.parametrize('kind', [queues.ConcurrentDeque, queues.WorkStealingDeque])
+    def test_extend_values(self, kind):
+        from oops import lists
+
+        deque = kind()
+        with pytest.raises(TypeError, match='not iterable'):
+            deque.extend(1)
+        deque.extend(lists.SinglyLinkedList([1, 2]))
+        assert list(deque._deque) == [1, 2]
+
+    def test_multiple_producers_and_consumers(self):
+        deque = queues.ConcurrentDeque()
+        check_received(run_producers_consumers(deque, deque.put, deque.get_batch))
+        assert len(deque) == 0
+
+
+class TestWorkStealingDeque:
+    def test_deque_api(self):
+        import queue as stdlib_queue
+
+        deque = queues.WorkStealingDeque()
+        assert deque.is_empty() is True
+        with pytest.raises(IndexError):
+            deque.pop()
+        with pytest.raises(stdlib_queue.Empty):
+            deque.steal()
+        assert deque.steal_half() == []
+
+        deque.push(1)
+        deque.extend([2, 3, 4, 5])
+        assert len(deque) == 5
+        # Owner LIFO, thieves FIFO
+        assert deque.pop() == 5
+        assert deque.steal() == 1
+        assert deque.steal_half() == [2, 3]
+        with deque._lock:
+            assert deque.steal_half() == []
+            with pytest.raises(stdlib_queue.Empty):
+                deque.steal()
+        assert deque.steal_half(blocking=True) == [4]
+        assert deque.is_empty() is True
+
+    def test_owner_and_thieves(self):
+        import threading
+
+        deque = queues.WorkStealingDeque()
+        taken = []
+        done = threading.Event()
+
+        def thief():
+            while not done.is_set() or not deque.is_empty():
+                taken.extend(deque.steal_half())
+
+        thieves = [threading.Thread(target=thief) for _ in range(4)]
+        for thread in thieves:
+            thread.start()
+        for x in range(20000):
+            deque.push(x)
+            if x % 3 == 0:
+                try:
+                    taken.append(deque.pop())
+                except IndexError:
+                    pass
+        done.set()
+        for thread in thieves:
+            thread.join()
+        assert sorted(taken) == list(range(20000))
+
+
+def produce_records(shared, count):
+    """Child process enqueuing `count` records in the `shared` queue."""
+    for x in range(count):
+        shared.enqueue(str(x).encode(), block=True)
+    shared.close()
+
+
+class TestSharedMemoryQueue:
+    @pytest.fixture
+    def shared(self):
+        shared = queues.SharedMemoryQueue(capacity=4, record_size=8)
+        yield shared
+        shared.close()
+        shared.unlink()
+
+    def test_queue_api(self, shared):
+        assert shared.is_empty() is True
+        assert len(shared) == 0
+        with pytest.raises(IndexError):
+            shared.dequeue()
+        with pytest.raises(IndexError):
+            shared.first()
+        with pytest.raises(IndexError):
+            shared.last()
+
+        shared.enqueue(b'a')
+        shared.enqueue(bytearray(b'bb'))
+        shared.enqueue(memoryview(b'12345678'))
+        assert len(shared) == 3
+        assert shared.first() == b'a'
+        assert shared.last() == b'12345678'
+        assert shared.dequeue() == b'a'
+
+        # Wrap around the ring buffer
+        for x in range(2):
+            shared.enqueue(bytes([x]))
+        assert shared.full() is True
+        with pytest.raises(IndexError):
+            shared.enqueue(b'x')
+        with pytest.raises(IndexError):
+            shared.enqueue(b'x', block=True, timeout=0.01)
+        assert [bytes(view) for view in shared.dequeue_many(3)] == [b'bb', b'12345678', b'\x00']
+        assert shared.dequeue() == b'\x01'
+        with pytest.raises(IndexError):
+            shared.dequeue(block=True, timeout=0.01)
+        with pytest.raises(IndexError):
+            shared.dequeue_many(2)
+
+    def test_raise_errors(self, shared):
+        with pytest.raises(ValueError):
+            shared.enqueue(b'123456789')
+        with pytest.raises(ValueError):
+            shared.dequeue_many(0)
+        with pytest.raises(ValueError):
+            queues.SharedMemoryQueue(capacity=0)
+
+    def test_cross_process(self, shared):
+        import multiprocessing
+
+        process = multiprocessing.Process(target=produce_records, args=(shared, 20))
+        process.start()
+        received = []
+        while len(received) < 20:
+            received.extend(bytes(view) for view in shared.dequeue_many(3, block=True, timeout=10))
+        process.join(timeout=10)
+        assert process.exitcode == 0
+        assert received == [str(x).encode() for x in range(20)]
+
+
+class TestSpillingQueue:
+    def test_fifo_with_spills(self, tmp_path):
+        with queues.SpillingQueue(tmp_path, memory_items=4, segment_size=64) as queue:
+            assert queue.is_empty() is True
+            with pytest.raises(IndexError):
+                queue.dequeue()
+            with pytest.raises(IndexError):
+                queue.last()
+
+            queue.extend(range(10))
+            assert len(queue) == 10
+            assert queue.spilled() == 8
+            assert queue.first() == 0
+            assert queue.last() == 9
+            assert len(list(tmp_path.glob('*.spill'))) > 1
+
+            assert [queue.dequeue() for _ in range(5)] == [0, 1, 2, 3, 4]
+            queue.enqueue('a', iterate=True)
+            assert queue.last() == 'a'
+            assert [queue.dequeue() for _ in range(6)] == [5, 6, 7, 8, 9, 'a']
+            assert queue.is_empty() is True
+            # Consumed segments are deleted
+            assert list(tmp_path.glob('*.spill')) == []
+
+            queue.enqueue(None)
+            assert queue.dequeue() is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_failed_spill_keeps_values(self, tmp_path):
+        class Serializer:
+            @staticmethod
+            def dumps(value):
+                if value == 'bad':
+                    raise ValueError('cannot serialize')
+                return pickle.dumps(value)
+
+            loads = staticmethod(pickle.loads)
+
+        queue = queues.SpillingQueue(tmp_path, memory_items=4, segment_size=64, serializer=Serializer)
+        queue.extend([1, 2, 3, 4, 5])
+        with pytest.raises(ValueError):
+            queue.enqueue('bad')
+        for value in (7, 8, 9, 10):
+            # The tail can't be spilled while it holds the bad value
+            with pytest.raises(ValueError):
+                queue.enqueue(value)
+        assert len(queue) == 10
+        assert queue.spilled() == 2
+        assert [queue.dequeue() for _ in range(10)] == [1, 2, 3, 4, 5, 'bad', 7, 8, 9, 10]
+        assert queue.is_empty() is True
+        queue.close()
+
+    def test_interleaved(self, tmp_path):
+        queue = queues.SpillingQueue(tmp_path, memory_items=6, segment_size=100)
+        expected = collections.deque()
+        for i in range(300):
+            queue.enqueue(i)
+            expected.append(i)
+            if i % 3 == 0:
+                assert queue.dequeue() == expected.popleft()
+            assert len(queue) == len(expected)
+            if expected:
+                assert queue.last() == expected[-1]
+        assert list(iter(queue.dequeue, 299)) == list(expected)[:-1]
+        queue.close()
+
+    def test_serializer_and_large_records(self, tmp_path):
+        queue = queues.SpillingQueue(tmp_path, memory_items=2, segment_size=16, serializer=marshal)
+        values = [b'x' * 100, {'key': [1, 2]}, 'text']
+        queue.extend(values)
+        assert [queue.dequeue() for _ in values] == values
+        queue.close()
+
+    def test_recover_after_close(self, tmp_path):
+        queue = queues.SpillingQueue(tmp_path, memory_items=4, segment_size=64, recover=True)
+        queue.extend(range(3))
+        queue.close()
+        assert json.loads((tmp_path / 'cursor.json').read_text())['segments']
+
+        queue = queues.SpillingQueue(tmp_path, memory_items=4, segment_size=64, recover=True)
+        assert len(queue) == 3
+        assert queue.last() == 2
+        queue.extend(range(3, 12))
+        assert [queue.dequeue() for _ in range(4)] == [0, 1, 2, 3]
+        queue.close()
+
+        queue = queues.SpillingQueue(tmp_path, memory_items=4, segment_size=64, recover=True)
+        assert [queue.dequeue() for _ in range(len(queue))] == list(range(4, 12))
+        queue.close()
+
+        # A queue that doesn't recover starts empty
+        assert len(queues.SpillingQueue(tmp_path, recover=True)) == 0
+        queue = queues.SpillingQueue(tmp_path, memory_items=4, recover=True)
+        queue.extend(range(10))
+        queue.close()
+        assert len(queues.SpillingQueue(tmp_path)) == 0
+        assert list(tmp_path.glob('*.spill')) == []
+
+    def test_recover_after_crash(self, tmp_path):
+        queue = queues.SpillingQueue(tmp_path, memory_items=4, segment_size=64, recover=True)
+        queue.extend(range(20))
+        assert [queue.dequeue() for _ in range(5)] == [0, 1, 2, 3, 4]
+        queue.checkpoint()
+        assert queue.dequeue() == 5
+        queue.enqueue(20)
+        assert [queue.dequeue() for _ in range(3)] == [6, 7, 8]
+        # Crash: the value in memory is lost, and the values dequeued since
+        # the last checkpoint (when 8 was read from disk) are delivered again
+        queue._close_writer()
+        queue._close_reader()
+        del queue
+
+        queue = queues.SpillingQueue(tmp_path, memory_items=4, segment_size=64, recover=True)
+        assert [queue.dequeue() for _ in range(len(queue))] == list(range(8, 20))
+        queue.close()
+
+    def test_torn_record(self, tmp_path):
+        queue = queues.SpillingQueue(tmp_path, memory_items=2, recover=True)
+        queue.extend(['a', 'b', 'c'])
+        queue._close_writer()
+        segment, = tmp_path.glob('*.spill')
+        data = bytearray(segment.read_bytes())
+        data[-1 + data.rindex(pickle.dumps('c')) + len(pickle.dumps('c'))] ^= 0xFF
+        segment.write_bytes(data)
+        del queue
+
+        queue = queues.SpillingQueue(tmp_path, memory_items=2, recover=True)
+        assert len(queue) == 1
+        assert queue.dequeue() == 'b'
+        queue.close()
+
+    def test_invalid_sizes(self, tmp_path):
+        with pytest.raises(ValueError):
+            queues.SpillingQueue(tmp_path, memory_items=1)
+        with pytest.raises(ValueError):
+            queues.SpillingQueue(tmp_path, segment_size=0)
@@ -1,3 +1,7 @@
+import bisect
+import random
+import struct
+
 import pytest
 
 from oops import searches
@@ -20,3 +24,225 @@ from oops import searches
 )
 def test_binary_search(sorted_list, target, decision):
     assert searches.binary_search(sorted_list, target) == decision
+
+
+SORTED = [1, 2, 2, 2, 5, 7, 7, 9]
+
+
+@pytest.mark.parametrize('target', range(0, 11))
+@pytest.mark.parametrize(('lo', 'hi'), ((0, None), (2, 6), (3, 3), (0, 1)))
+def test_bisect_matches_stdlib(target, lo, hi):
+    import bisect
+
+    end = len(SORTED) if hi is None else hi
+    assert searches.bisect_left(SORTED, target, lo, hi) == bisect.bisect_left(SORTED, target, lo, end)
+    assert searches.bisect_right(SORTED, target, lo, hi) == bisect.bisect_right(SORTED, target, lo, end)
+    assert searches.lower_bound(SORTED, target, lo, hi) == bisect.bisect_left(SORTED, target, lo, end)
+    assert searches.upper_bound(SORTED, target, lo, hi) == bisect.bisect_right(SORTED, target, lo, end)
+
+
+def test_find_index_and_count_range():
+    assert searches.find_index(SORTED, 2) == 1
+    assert searches.find_index(SORTED, 7) == 5
+    assert searches.find_index(SORTED, 3) == -1
+    assert searches.find_index(SORTED, 10) == -1
+    assert searches.find_index(SORTED, 2, lo=4) == -1
+    assert searches.find_index([], 1) == -1
+
+    assert searches.count_range(SORTED, 2, 2) == 3
+    assert searches.count_range(SORTED, 2, 7) == 6
+    assert searches.count_range(SORTED, 3, 4) == 0
+    assert searches.count_range(SORTED, 7, 2) == 0
+    assert searches.count_range(SORTED, 0, 100, lo=2, hi=5) == 3
+
+
+def test_key_function():
+    records = [{'id': 1, 'name': 'a'}, {'id': 4, 'name': 'b'}, {'id': 9, 'name': 'c'}]
+
+    def key(record):
+        return record['id']
+
+    assert searches.bisect_left(records, 4, key=key) == 1
+    assert searches.bisect_right(records, 4, key=key) == 2
+    assert searches.find_index(records, 9, key=key) == 2
+    assert searches.find_index(records, 5, key=key) == -1
+    assert searches.count_range(records, 2, 9, key=key) == 2
+    assert searches.binary_search(records, 1, key=key) is True
+    assert searches.binary_search(records, 1, lo=1, key=key) is False
+
+
+def test_custom_sequence():
+    from oops import lists
+
+    sll = lists.SinglyLinkedList([1, 3, 5, 7])
+    assert searches.binary_search(sll, 5, key=lambda node: node.val) is True
+    assert searches.find_index(sll, 7, key=lambda node: node.val) == 3
+    assert searches.bisect_left(lists.BlockDeque([1, 3, 5]), 4) == 2
+
+
+def test_sorted_linked_structures():
+    from oops import instrument
+    from oops import lists
+
+    sll = lists.SinglyLinkedList([7, 1, 5, 3, 5])
+    sll.sort()
+    deque = lists.LinkedDeque([(2, 'b'), (9, 'c'), (2, 'a'), (0, 'd')])
+
+    def first(pair):
+        return pair[0]
+
+    deque.sort(key=first)
+    with instrument.instrumented(sll) as sll_stats, instrument.instrumented(deque) as deque_stats:
+        assert searches.bisect_left(sll, 5) == 2
+        assert searches.bisect_right(sll, 5) == 4
+        assert searches.find_index(sll, 5) == 2
+        assert searches.find_index(sll, 4) == -1
+        assert searches.find_index(sll, 8) == -1
+        assert searches.count_range(sll, 2, 6, lo=1, hi=3) == 2
+        assert searches.find_index(deque, 2, key=first) == 1
+        assert searches.bisect_right(deque, 2, key=first) == 3
+        assert searches.binary_search(deque, 9, lo=1, hi=3, key=first) is False
+    assert '__getitem__' not in sll_stats.calls
+    assert '__getitem__' not in deque_stats.calls
+
+    # Not known to be sorted by this key: searched by index
+    assert searches.find_index(deque, 9, key=lambda pair: pair[0]) == 3
+    deque.insert_back((10, 'e'))
+    assert searches.find_index(deque, 10, key=first) == 4
+
+
+def test_raise_errors():
+    with pytest.raises(ValueError, match='non-negative'):
+        searches.bisect_left(SORTED, 1, lo=-1)
+    with pytest.raises(ValueError):
+        searches.binary_search(SORTED, 1, lo=-1)
+
+
+DATASETS = {
+    'duplicates': SORTED,
+    'uniform': sorted(random.Random(1).sample(range(100_000), 1000)),
+    'skewed': [i ** 4 for i in range(1000)],
+    'floats': [i / 7 for i in range(500)],
+    'constant': [3] * 300,
+}
+
+
+@pytest.mark.parametrize('name', DATASETS)
+def test_strategies_match_bisect(name):
+    data = DATASETS[name]
+    rng = random.Random(name)
+    targets = [rng.randrange(int(data[-1]) + 2) for _ in range(200)] + [data[0] - 1, data[0], data[-1], data[-1] + 1]
+    for target in targets:
+        expected_left = bisect.bisect_left(data, target)
+        expected_right = bisect.bisect_right(data, target)
+        hint = rng.randrange(-5, len(data) + 5)
+        assert searches.gallop_left(data, target, hint) == expected_left
+        assert searches.gallop_right(data, target, hint) == expected_right
+        assert searches.interpolation_search(data, target) == expected_left
+        assert searches.exponential_search(data, target) == expected_left
+        assert searches.search(data, target) == expected_left
+        assert searches.search(data, target, hint=hint) == expected_left
+        assert searches.search(data, target, strategy='interpolation') == expected_left
+
+
+def test_search_bounds_and_keys():
+    data = DATASETS['uniform']
+    target = data[600]
+    assert searches.gallop_left(data, target, hint=0, lo=100, hi=700) == 600
+    assert searches.gallop_left(data, target, hint=900, lo=100, hi=500) == 500
+    assert searches.interpolation_search(data, target, lo=601) == 601
+    assert searches.interpolation_search(data, target, lo=5, hi=5) == 5
+    records = [{'id': x} for x in data]
+    assert searches.interpolation_search(records, target, key=lambda record: record['id']) == 600
+    assert searches.gallop_right(records, target, 10, key=lambda record: record['id']) == 601
+    assert searches.exponential_search(records, target, key=lambda record: record['id']) == 600
+    with pytest.raises(ValueError):
+        searches.gallop_left(data, 1, lo=-1)
+    with pytest.raises(ValueError):
+        searches.search(data, 1, strategy='linear')
+
+
+def test_exponential_search_unbounded():
+    class Squares:
+        def __init__(self):
+            self.probes = 0
+
+        def __getitem__(self, idx):
+            self.probes += 1
+            return idx * idx
+
+    squares = Squares()
+    assert searches.exponential_search(squares, 10 ** 10) == 10 ** 5
+    assert squares.probes < 2 * 17 + 2
+    assert searches.exponential_search(range(5), 10) == 5
+    assert searches.exponential_search([], 10) == 0
+
+
+def test_choose_strategy():
+    assert searches.choose_strategy(DATASETS['uniform']) == 'interpolation'
+    assert searches.choose_strategy(DATASETS['skewed']) == 'bisect'
+    assert searches.choose_strategy(DATASETS['constant']) == 'bisect'
+    assert searches.choose_strategy(SORTED) == 'bisect'
+    assert searches.choose_strategy([str(x) for x in range(1000)]) == 'bisect'
+    assert searches.choose_strategy([{'t': x} for x in range(1000)], key=lambda record: record['t']) == 'interpolation'
+
+
+def make_records(keys):
+    """Records of 16 bytes: a 4 bytes header, a big-endian key and a
+    little-endian payload."""
+    return b''.join(struct.pack('>4sQ', b'HEAD', key) + struct.pack('<I', i) for i, key in enumerate(keys))
+
+
+@pytest.mark.parametrize('cache_size', [0, 1, 7, 4096])
+def test_record_view(cache_size):
+    rng = random.Random(cache_size)
+    keys = sorted(rng.randrange(5000) for _ in range(3000))
+    view = searches.RecordView(make_records(keys), 16, key_offset=4, decoder='>Q', cache_size=cache_size)
+    assert len(view) == 3000
+    assert (view[0], view[-1]) == (keys[0], keys[-1])
+    assert struct.unpack('<I', view.record(10)[12:]) == (10,)
+    for target in [-1, 0, 5000] + rng.sample(range(5000), 200):
+        assert view.bisect_left(target) == bisect.bisect_left(keys, target)
+        assert view.bisect_right(target) == bisect.bisect_right(keys, target)
+        assert view.find_index(target) == (keys.index(target) if target in keys else -1)
+        assert (target in view) == (target in keys)
+    assert view.cached_keys() <= cache_size
+    # Every search of the module works on the view
+    assert searches.search(view, keys[1234]) == keys.index(keys[1234])
+    assert searches.count_range(view, 100, 200) == sum(100 <= key <= 200 for key in keys)
+
+
+def test_record_view_bytes_keys_and_files(tmp_path):
+    words = sorted(f'{word:<8}'.encode() for word in ('apple', 'kiwi', 'fig', 'banana', 'pear', 'plum'))
+    header = b'\x00' * 10
+    path = tmp_path / 'records.bin'
+    path.write_bytes(header + b''.join(word + b'.' for word in words))
+    with searches.RecordView.from_file(path, 9, key_size=8, offset=10, cache_size=2) as view:
+        assert view.find_index(b'fig     ') == 2
+        assert view.bisect_left(b'c') == 2
+        assert list(view) == words
+    with pytest.raises(ValueError):
+        view[0]
+
+    view = searches.RecordView.from_file(path, 9, key_size=8, offset=10)
+    record = view.record(1)
+    with pytest.raises(BufferError, match='release the records'):
+        view.close()
+    # Nothing was released, the view still works
+    assert (view[1], record.tobytes()) == (words[1], words[1] + b'.')
+    record.release()
+    view.close()
+    assert view.buffer.closed
+
+    view = searches.RecordView(memoryview(b'a1b2c3'), 2, decoder=lambda key: key.tobytes().decode())
+    assert (list(view), view.bisect_right('b2'), view[-3]) == (['a1', 'b2', 'c3'], 2, 'a1')
+    with pytest.raises(IndexError):
+        view[3]
+    (tmp_path / 'empty.bin').write_bytes(b'')
+    with searches.RecordView.from_file(tmp_path / 'empty.bin', 8, decoder='<Q') as empty:
+        assert (len(empty), empty.bisect_left(1), empty.find_index(1)) == (0, 0, -1)
+
+    for kwargs in ({'record_size': 0}, {'record_size': 4}, {'record_size': 2, 'key_offset': 2},
+                   {'record_size': 2, 'decoder': '<I'}, {'record_size': 2, 'cache_size': -1}):
+        with pytest.raises(ValueError):
+            searches.RecordView(b'abcdef', **kwargs)
@@ -0,0 +1,155 @@
+"""Unit testing for typed.py
+"""
+
+
+import copy
+import pickle
+from array import array
+
+import pytest
+
+from oops import lists
+from oops import typed
+
+
+class TestTypedQueue:
+    def test_queue(self):
+        queue = typed.TypedQueue('q', [1, 2, 3])
+        assert repr(queue) == "TypedQueue('q', [1, 2, 3])"
+        assert repr(typed.TypedQueue('d')) == "TypedQueue('d')"
+        assert len(typed.TypedQueue('q', 5)) == 1
+        queue.enqueue(4)
+        queue.enqueue(range(5, 8), iterate=True)
+        assert (queue.first(), queue.last(), len(queue)) == (1, 7, 7)
+        assert queue.dequeue() == 1
+        assert queue.pop_many(2) == array('q', [2, 3])
+        assert list(queue) == [4, 5, 6, 7]
+        assert (queue[0], queue[-1]) == (4, 7)
+        queue[1] = 50
+        assert queue.tobytes() == array('q', [4, 50, 6, 7]).tobytes()
+        assert queue.pop_many(10) == array('q', [4, 50, 6, 7])
+        assert queue.is_empty()
+        with pytest.raises(IndexError, match='Queue is empty.'):
+            queue.dequeue()
+        with pytest.raises(IndexError, match='Queue is empty.'):
+            queue.first()
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            typed.TypedQueue('x')
+        queue = typed.TypedQueue('i', [1])
+        with pytest.raises(TypeError):
+            queue.enqueue('a')
+        with pytest.raises(OverflowError):
+            queue.enqueue(2 ** 40)
+        with pytest.raises(TypeError):
+            queue.extend(1)
+        with pytest.raises(IndexError):
+            queue[1]
+        with pytest.raises(ValueError):
+            queue['0']
+        with pytest.raises(ValueError):
+            queue.pop_many(-1)
+        with pytest.raises(TypeError, match='TypedQueue does not support node pools.'):
+            typed.TypedQueue('q', pool=lists.NodePool())
+
+    def test_long_queue(self):
+        queue = typed.TypedQueue('l')
+        for i in range(1000):
+            queue.enqueue(i)
+            queue.enqueue(i)
+            assert queue.dequeue() == i // 2
+        assert list(queue) == [i // 2 for i in range(1000, 2000)]
+        # Dequeued slots are dropped once they take most of the array
+        assert len(queue._data) < 4 * len(queue)
+
+
+class TestTypedStack:
+    def test_stack(self):
+        stack = typed.TypedStack('d', (1, 2.5))
+        stack.push(3)
+        stack.push_many([4, 5])
+        assert stack.top() == 5.0
+        assert stack.pop() == 5.0
+        assert stack.pop_many(2) == array('d', [4.0, 3.0])
+        assert list(stack) == [1.0, 2.5]
+        assert stack.pop_many(0) == array('d')
+        stack.clear()
+        with pytest.raises(IndexError, match='Stack is empty.'):
+            stack.pop()
+        with pytest.raises(IndexError, match='Stack is empty.'):
+            stack.top()
+
+
+class TestTypedDeque:
+    def test_deque(self):
+        deque = typed.TypedDeque('h', [3, 4])
+        deque.insert_front(2)
+        deque.insert_back(5)
+        deque.extendleft([1, 0])
+        deque.extend(array('h', [6, 7]))
+        assert list(deque) == list(range(8))
+        assert (deque.first(), deque.last()) == (0, 7)
+        assert (deque.pop_front(), deque.pop_back()) == (0, 7)
+        deque.delete_front()
+        deque.delete_back()
+        assert deque.pop_many(2, back=True) == array('h', [5, 4])
+        assert deque.pop_many(5) == array('h', [2, 3])
+        with pytest.raises(IndexError, match='Deque is empty.'):
+            deque.pop_front()
+        with pytest.raises(IndexError, match='Deque is empty.'):
+            deque.last()
+
+    def test_grow_front(self):
+        deque = typed.TypedDeque('q')
+        for i in range(1000):
+            deque.insert_front(i)
+        deque.extendleft(range(1000, 3000))
+        assert list(deque) == list(range(2999, -1, -1))
+        assert len(deque._data) < 3 * len(deque)
+
+
+class TestBuffers:
+    def test_view(self):
+        queue = typed.TypedQueue('i', range(5))
+        queue.dequeue()
+        view = queue.view()
+        assert (view.format, view.itemsize, view.tolist()) == ('i', 4, [1, 2, 3, 4])
+        assert queue.itemsize == 4
+        queue[0] = 10
+        assert view[0] == 10
+        # Growing while a view is exported moves the values to a new array
+        queue.enqueue(range(5, 100), iterate=True)
+        queue.enqueue(100)
+        assert view.tolist() == [10, 2, 3, 4]
+        assert list(queue) == [10, *range(2, 101)]
+        view.release()
+
+    def test_bulk_loads(self):
+        values = array('d', [1.5, 2.5])
+        deque = typed.TypedDeque('d', memoryview(values))
+        deque.extend(values.tobytes())
+        deque.extend(bytearray(values.tobytes()))
+        deque.extendleft(memoryview(array('f', [0.5])))
+        assert list(deque) == [0.5, 1.5, 2.5, 1.5, 2.5, 1.5, 2.5]
+
+        # Buffers of another item type are converted value by value
+        stack = typed.TypedStack('q', array('b', [-1, 2]))
+        stack.push_many(memoryview(array('I', [3])))
+        assert list(stack) == [-1, 2, 3]
+        with pytest.raises(ValueError):
+            stack.push_many(b'\x00')
+        with pytest.raises(TypeError):
+            stack.push_many(array('d', [1.5]))
+
+    def test_copy_and_pickle(self):
+        queue = typed.TypedQueue('B', b'\x01\x02\x03')
+        queue.dequeue()
+        assert list(queue) == [2, 3]
+        for copied in (copy.copy(queue), copy.deepcopy(queue), pickle.loads(pickle.dumps(queue))):
+            assert copied == queue
+            assert copied is not queue
+            assert copied.typecode == 'B'
+        assert queue != typed.TypedQueue('B', [2])
+        assert queue != typed.TypedStack('B', [2, 3])
+        assert typed.TypedQueue.from_iterable(iter([1, 2]), typecode='B') == typed.TypedQueue('B', [1, 2])